@@ -0,0 +1,383 @@
+from expression import Expression
+
+
+def get_order(root) -> list:
+    """Returns the variables of an expression in the order they first appear from left to right.
+    Variables that are used together are usually written close together, so this order
+    keeps a BDD much smaller than the alphabetical order does
+
+    :param root: The root of the expression to get the variable order of
+    :type root: Expression or Variable
+
+    :rtype: list[str]
+    """
+
+    # Keep track of the variables in a dict which is used as an ordered set
+    variables = {}
+    stack = [root]
+    while len(stack) > 0:
+        node = stack.pop()
+        if isinstance(node, Expression):
+            stack.append(node.get_right())
+            stack.append(node.get_left())
+        else:
+            variables[node.get_value()] = None
+    return list(variables)
+
+
+class BDD:
+    """A BDD holds Reduced Ordered Binary Decision Diagrams of boolean expressions over the same variables.
+    Every node is unique, so two expressions are equivalent exactly when their diagrams are the same edge.
+
+    An edge is an integer where the lowest bit says whether the edge is complemented (NOT) and
+    the other bits are the index of the node it points to. The only terminal node is TRUE,
+    so FALSE is the complemented edge to TRUE. To keep every node unique, the high edge of a node
+    is never complemented.
+
+    :param variables: The variables, in order from the top of a diagram to the bottom
+    :type variables: list
+    """
+
+    TRUE = 0
+    FALSE = 1
+
+    def __init__(self, variables):
+        self._variables = list(variables)
+        self._levels = {self._variables[i]: i for i in range(len(self._variables))}
+
+        # The nodes are stored as three lists where node 0 is the TRUE terminal
+        #   which is below every variable
+        self._level = [len(self._variables)]
+        self._low = [BDD.TRUE]
+        self._high = [BDD.TRUE]
+
+        # The unique table maps a (level, low, high) node to its index and
+        #   the computed table remembers the result of every AND and XOR
+        self._unique = {}
+        self._computed = {}
+
+    def __len__(self):
+        return len(self._level)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Getters
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def get_variables(self) -> list:
+        """Returns the variables, in order from the top of a diagram to the bottom"""
+        return self._variables
+
+    def get_size(self, edge: int) -> int:
+        """Returns the amount of nodes, including the TRUE terminal, in the diagram of an edge
+
+        :param edge: The edge of the diagram
+        :type edge: int
+        """
+        seen = set()
+        stack = [edge >> 1]
+        while len(stack) > 0:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            if node != 0:
+                stack.append(self._low[node] >> 1)
+                stack.append(self._high[node] >> 1)
+        return len(seen)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Node Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __make(self, level: int, low: int, high: int) -> int:
+        """Returns the edge of the node of a variable with a low edge (when the variable is false)
+        and a high edge (when the variable is true), creating the node if it does not exist yet
+
+        :param level: The level of the variable of the node
+        :param low: The edge to follow when the variable is false
+        :param high: The edge to follow when the variable is true
+
+        :type level: int
+        :type low: int
+        :type high: int
+
+        :rtype: int
+        """
+
+        # A node whose edges are the same does not depend on its variable
+        if low == high:
+            return low
+
+        # Move a complemented high edge to the edge of the node itself
+        #   since NOT (x ? high : low) is x ? NOT high : NOT low
+        if high & 1:
+            return self.__make(level, low ^ 1, high ^ 1) ^ 1
+
+        key = (level, low, high)
+        node = self._unique.get(key)
+        if node is None:
+            node = len(self._level)
+            self._level.append(level)
+            self._low.append(low)
+            self._high.append(high)
+            self._unique[key] = node
+        return node << 1
+
+    def __cofactors(self, edge: int, level: int) -> tuple:
+        """Returns the edges of an edge when the variable at a level is false and when it is true
+
+        :param edge: The edge to get the cofactors of
+        :param level: The level of the variable
+        :type edge: int
+        :type level: int
+
+        :return: A tuple containing the low edge and the high edge
+        :rtype: tuple
+        """
+        node = edge >> 1
+        if self._level[node] != level:
+            return edge, edge
+        return self._low[node] ^ (edge & 1), self._high[node] ^ (edge & 1)
+
+    def variable(self, value: str) -> int:
+        """Returns the edge of a variable
+
+        :param value: The variable
+        :type value: str
+        """
+        return self.__make(self._levels[value], BDD.FALSE, BDD.TRUE)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Operator Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @staticmethod
+    def negate(edge: int) -> int:
+        """Returns the edge of the NOT of an edge"""
+        return edge ^ 1
+
+    def conjoin(self, edge: int, other: int) -> int:
+        """Returns the edge of the AND of two edges
+
+        :param edge: The left side of the AND
+        :param other: The right side of the AND
+        :type edge: int
+        :type other: int
+
+        :rtype: int
+        """
+        return self.__apply("AND", edge, other)
+
+    def disjoin(self, edge: int, other: int) -> int:
+        """Returns the edge of the OR of two edges which is the NOT of the AND of the NOT of each edge
+
+        :param edge: The left side of the OR
+        :param other: The right side of the OR
+        :type edge: int
+        :type other: int
+
+        :rtype: int
+        """
+        return self.conjoin(edge ^ 1, other ^ 1) ^ 1
+
+    def exclusive_disjoin(self, edge: int, other: int) -> int:
+        """Returns the edge of the XOR of two edges
+
+        :param edge: The left side of the XOR
+        :param other: The right side of the XOR
+        :type edge: int
+        :type other: int
+
+        :rtype: int
+        """
+        return self.__apply("XOR", edge, other)
+
+    @staticmethod
+    def __simplify(operator: str, edge: int, other: int) -> tuple:
+        """Returns the result of an AND or an XOR of two edges when it does not need the cofactors,
+        or the key of the AND or the XOR in the computed table otherwise
+
+        :param operator: The operator which is either "AND" or "XOR"
+        :param edge: The left side
+        :param other: The right side
+
+        :type operator: str
+        :type edge: int
+        :type other: int
+
+        :return: A tuple containing the resulting edge or None, the key or None,
+            and whether or not the result of the key is complemented
+        :rtype: tuple
+        """
+        if operator == "AND":
+            if edge == BDD.FALSE or other == BDD.FALSE or edge == other ^ 1:
+                return BDD.FALSE, None, 0
+            if edge == BDD.TRUE or edge == other:
+                return other, None, 0
+            if other == BDD.TRUE:
+                return edge, None, 0
+
+            # An AND is the same in either order so only one order is remembered
+            return None, ("AND", min(edge, other), max(edge, other)), 0
+
+        # The NOT of either side is the NOT of the XOR, so only XORs of
+        #   edges that are not complemented are remembered
+        complement = (edge ^ other) & 1
+        edge &= ~1
+        other &= ~1
+        if edge == other:
+            return BDD.FALSE ^ complement, None, 0
+        if edge == BDD.TRUE:
+            return other ^ 1 ^ complement, None, 0
+        if other == BDD.TRUE:
+            return edge ^ 1 ^ complement, None, 0
+        return None, ("XOR", min(edge, other), max(edge, other)), complement
+
+    def __apply(self, operator: str, edge: int, other: int) -> int:
+        """Returns the edge of the AND or the XOR of two edges from the AND or the XOR of their cofactors.
+        The cofactors are combined in post-order without recursion so that diagrams with
+        very many levels, like the AND of thousands of variables, can be combined
+
+        :param operator: The operator which is either "AND" or "XOR"
+        :param edge: The left side
+        :param other: The right side
+
+        :type operator: str
+        :type edge: int
+        :type other: int
+
+        :rtype: int
+        """
+        result, root, complement = BDD.__simplify(operator, edge, other)
+        if root is None:
+            return result
+
+        stack = [root]
+        while len(stack) > 0:
+            key = stack[-1]
+            if key in self._computed:
+                stack.pop()
+                continue
+
+            _, edge, other = key
+            level = min(self._level[edge >> 1], self._level[other >> 1])
+            edge_low, edge_high = self.__cofactors(edge, level)
+            other_low, other_high = self.__cofactors(other, level)
+
+            # Get the result of each cofactor, or combine the cofactors that are not remembered yet first
+            children = []
+            needed = []
+            for pair in [(edge_low, other_low), (edge_high, other_high)]:
+                child, child_key, child_complement = BDD.__simplify(operator, *pair)
+                if child_key is None:
+                    children.append(child)
+                elif child_key in self._computed:
+                    children.append(self._computed[child_key] ^ child_complement)
+                else:
+                    needed.append(child_key)
+            if len(needed) > 0:
+                stack.extend(needed)
+                continue
+
+            self._computed[key] = self.__make(level, children[0], children[1])
+            stack.pop()
+
+        return self._computed[root] ^ complement
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Expression Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def create(self, root) -> int:
+        """Creates the diagram of an expression and returns its edge
+
+        :param root: The root of the expression
+        :type root: Expression or Variable
+
+        :rtype: int
+        """
+
+        # Walk the expression in post-order without recursion so that
+        #   very deep expressions can be used
+        edges = {}
+        stack = [root]
+        while len(stack) > 0:
+            node = stack[-1]
+            if id(node) in edges:
+                stack.pop()
+                continue
+
+            if not isinstance(node, Expression):
+                edges[id(node)] = self.variable(node.get_value()) ^ node.has_not()
+                stack.pop()
+                continue
+
+            left = node.get_left()
+            right = node.get_right()
+            if id(left) not in edges or id(right) not in edges:
+                stack.append(right)
+                stack.append(left)
+                continue
+
+            # Note that a NAND, a NOR, or an XNOR is the NOT of an AND, an OR, or an XOR
+            #   which is already in has_not
+            operator = node.get_operator()
+            if operator in ["AND", "NAND"]:
+                edge = self.conjoin(edges[id(left)], edges[id(right)])
+            elif operator in ["OR", "NOR"]:
+                edge = self.disjoin(edges[id(left)], edges[id(right)])
+            else:
+                edge = self.exclusive_disjoin(edges[id(left)], edges[id(right)])
+            edges[id(node)] = edge ^ node.has_not
+            stack.pop()
+
+        return edges[id(root)]
+
+    def count_satisfying(self, edge: int) -> int:
+        """Returns the amount of assignments of every variable that make an edge true
+
+        :param edge: The edge of the diagram
+        :type edge: int
+        """
+
+        # The count of a node is over the variables at and below its level,
+        #   and the nodes are counted in post-order without recursion
+        counts = {0: 1}
+        stack = [edge >> 1]
+        while len(stack) > 0:
+            node = stack[-1]
+            if node in counts:
+                stack.pop()
+                continue
+
+            low, high = self._low[node], self._high[node]
+            if low >> 1 not in counts or high >> 1 not in counts:
+                stack.append(low >> 1)
+                stack.append(high >> 1)
+                continue
+
+            counts[node] = self.__count_edge(counts, low, self._level[node] + 1) + \
+                self.__count_edge(counts, high, self._level[node] + 1)
+            stack.pop()
+
+        return self.__count_edge(counts, edge, 0)
+
+    def __count_edge(self, counts: dict, edge: int, level: int) -> int:
+        """Returns the amount of assignments of the variables at and below a level that make an edge true.
+        The variables between the level and the node of the edge can be either true or false
+
+        :param counts: The amount of assignments that make each node true
+        :param edge: The edge to count
+        :param level: The level to count from
+
+        :type counts: dict
+        :type edge: int
+        :type level: int
+
+        :rtype: int
+        """
+        node = edge >> 1
+        count = counts[node]
+        if edge & 1:
+            count = (1 << (len(self._variables) - self._level[node])) - count
+        return count << (self._level[node] - level)
@@ -0,0 +1,425 @@
+"""Benchmarks for the Logician expression pipeline
+
+Run ``python benchmark.py parse`` to compare the throughput of the LALR, Earley and Pratt parsers,
+``python benchmark.py pipeline`` to time each stage of parsing, evaluating, and simplifying random expressions,
+and ``python benchmark.py gui`` to time how long the app takes to respond to typing.
+
+Every command can write its results as JSON with ``--output`` and compare them with
+the results of an earlier run with ``--baseline``
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+
+from pratt import PrattParser
+
+# The binary operators of every style in the README for each operator
+OPERATOR_STYLES = {
+    "or": ["||", "or", "|", "+"],
+    "and": ["&&", "and", "&", "*"],
+    "xor": ["^", "xor"],
+    "xnor": ["!^", "xnor", "~^", "-^"],
+    "nor": ["!||", "nor", "~|", "-+"],
+    "nand": ["!&&", "nand", "~&", "-*"]
+}
+OPERATORS = [style for styles in OPERATOR_STYLES.values() for style in styles]
+NOTS = ["!", "not ", "~", "-"]
+
+
+def random_expression(tokens: int, variables: int = 8, seed: int = 0) -> str:
+    """Creates a random boolean expression with roughly the specified amount of tokens
+
+    :param tokens: The amount of tokens the expression should have
+    :param variables: The amount of different variables to use in the expression
+    :param seed: The seed for the random number generator so the expression can be reproduced
+
+    :type tokens: int
+    :type variables: int
+    :type seed: int
+
+    :rtype: str
+    """
+    generator = random.Random(seed)
+    names = [f"v{i}" for i in range(variables)]
+
+    # Each operand is a variable that may be negated or grouped with the next operand
+    #   in parentheses to make the expression nested
+    parts = []
+    count = 0
+    depth = 0
+    while count < tokens:
+        if generator.random() < 0.2:
+            parts.append(generator.choice(NOTS))
+            count += 1
+        if generator.random() < 0.1 and count < tokens - 4:
+            parts.append("(")
+            depth += 1
+            count += 1
+        parts.append(generator.choice(names))
+        count += 1
+        if depth > 0 and generator.random() < 0.3:
+            parts.append(")")
+            depth -= 1
+            count += 1
+        if count < tokens - 1:
+            parts.append(generator.choice(OPERATORS))
+            count += 1
+        else:
+            break
+    if depth > 0:
+        parts.append(")" * depth)
+    return " ".join(parts)
+
+
+def random_formula(variables: int, depth: int = None, operators: list = None, seed: int = 0) -> str:
+    """Creates a random boolean expression as a full binary tree of operators with the specified depth.
+    The leaves use every variable in a random order before any variable is used again
+
+    :param variables: The amount of different variables to use in the expression
+    :param depth: The amount of operators from the root to each variable.
+        By default, the smallest depth that has a leaf for every variable is used
+    :param operators: The operators ("and", "or", "xor", "xnor", "nor", "nand") to choose from.
+        By default, every operator is used
+    :param seed: The seed for the random number generator so the expression can be reproduced
+
+    :type variables: int
+    :type depth: int
+    :type operators: list[str]
+    :type seed: int
+
+    :rtype: str
+    """
+    generator = random.Random(seed)
+    names = [f"v{i}" for i in range(variables)]
+    generator.shuffle(names)
+    if depth is None:
+        depth = max(1, math.ceil(math.log2(variables)))
+    if operators is None:
+        operators = list(OPERATOR_STYLES)
+    styles = [OPERATOR_STYLES[operator] for operator in operators]
+
+    # Build the expression from the leaves up so that very deep expressions do not need recursion
+    #   where each level joins every two neighbouring parts with an operator
+    parts = []
+    for leaf in range(1 << depth):
+        part = names[leaf % variables]
+        if generator.random() < 0.2:
+            part = generator.choice(NOTS) + part
+        parts.append(part)
+    for _ in range(depth):
+        parts = [
+            "({} {} {})".format(parts[i], generator.choice(generator.choice(styles)), parts[i + 1])
+            for i in range(0, len(parts), 2)
+        ]
+        if generator.random() < 0.2:
+            parts = [generator.choice(NOTS) + part for part in parts]
+    return parts[0]
+
+
+def time_call(function, *args, repeat: int = 5) -> float:
+    """Returns the best wall time, in seconds, of calling a function a number of times
+
+    :param function: The function to call
+    :param args: The arguments to call the function with
+    :param repeat: The amount of times to call the function
+
+    :type function: callable
+    :type repeat: int
+
+    :rtype: float
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def benchmark_parse(sizes: list, repeat: int = 5) -> list:
+    """Compares the throughput of the LALR, Earley and Pratt parsers on random expressions
+    with the specified amounts of tokens
+
+    :param sizes: The amounts of tokens of each expression to parse
+    :param repeat: The amount of times to parse each expression
+
+    :type sizes: list[int]
+    :type repeat: int
+
+    :return: A list of results for each parser and expression size
+    :rtype: list[dict]
+    """
+    from grammar import create_earley_parser, create_parser, load_parser
+
+    results = [
+        {"stage": "create_lalr", "seconds": time_call(create_parser, repeat=1)},
+        {"stage": "load_lalr", "seconds": time_call(load_parser, repeat=repeat)},
+        {"stage": "create_earley", "seconds": time_call(create_earley_parser, repeat=1)}
+    ]
+
+    parsers = {
+        "lalr": load_parser().parse,
+        "earley": create_earley_parser().parse,
+        "pratt": lambda expr: PrattParser(expr).parse()
+    }
+    for size in sizes:
+        expression = random_expression(size)
+        for name, parse in parsers.items():
+            seconds = time_call(parse, expression, repeat=repeat)
+            results.append({
+                "stage": f"parse_{name}",
+                "tokens": size,
+                "seconds": seconds,
+                "tokens_per_second": size / seconds
+            })
+    return results
+
+
+def benchmark_pipeline(variables: list, depth: int = None, operators: list = None,
+                       parser: str = "fast", repeat: int = 5, seed: int = 0, backend: str = "python") -> list:
+    """Times each stage of parsing, evaluating, and simplifying a random expression
+    for each amount of variables. The simplified functions are not cached between calls
+    so that every call does the whole simplification
+
+    :param variables: The amounts of variables of each expression
+    :param depth: The depth of each expression. By default, the smallest depth that uses every variable
+    :param operators: The operators to choose from. By default, every operator is used
+    :param parser: The parser to use which is either "lark" or "fast"
+    :param repeat: The amount of times to time each stage
+    :param seed: The seed for the random expressions
+    :param backend: The backend that finds the prime implicants which is either "python" or "numpy"
+
+    :type variables: list[int]
+    :type depth: int
+    :type operators: list[str]
+    :type parser: str
+    :type repeat: int
+    :type seed: int
+    :type backend: str
+
+    :return: A list of results for each stage and amount of variables
+    :rtype: list[dict]
+    """
+    from qm import QM
+    from tree import Tree
+
+    cache = Tree.CACHE
+    Tree.CACHE = None
+    qm_backend = Tree.QM_BACKEND
+    Tree.QM_BACKEND = backend
+    results = []
+    try:
+        for count in variables:
+            expression = random_formula(count, depth, operators, seed)
+            tree = Tree(expression, parser)
+            evaluations = tree.evaluate()
+
+            # The stages of the Quine-McCluskey Algorithm are timed inside one run
+            #   so the best time of each stage is kept separately
+            timings = {}
+            for _ in range(repeat):
+                qm = QM(tree.get_variables(), evaluations.get_minterms(), backend=backend)
+                for stage, seconds in qm.get_timings().items():
+                    timings[stage] = min(seconds, timings.get(stage, seconds))
+
+            stages = {
+                "tree_init": time_call(Tree, expression, parser, repeat=repeat),
+                "evaluate": time_call(tree.evaluate, repeat=repeat),
+                "get_table": time_call(tree.get_table, repeat=repeat),
+                "qm_prime_implicants": timings["prime_implicants"],
+                "qm_cover": timings["cover"],
+
+                # Tree.simplify also presimplifies the expression, splits it into parts that share no variables,
+                #   and splits large parts on a shared variable, so this is the whole pipeline and not only QM
+                "full_simplify": time_call(tree.simplify, repeat=repeat)
+            }
+            for stage, seconds in stages.items():
+                results.append({
+                    "stage": stage,
+                    "variables": count,
+                    "depth": depth,
+                    "operators": operators,
+                    "seed": seed,
+                    "backend": backend,
+                    "seconds": seconds
+                })
+    finally:
+        Tree.CACHE = cache
+        Tree.QM_BACKEND = qm_backend
+    return results
+
+
+def benchmark_gui(variables: list, depth: int = None, operators: list = None, seed: int = 0) -> list:
+    """Times how long the app takes to handle each keystroke of typing a random expression
+    and how long it then takes to show the simplified expressions.
+    The app is run without a window using the offscreen Qt platform unless another platform is set
+
+    :param variables: The amounts of variables of each expression
+    :param depth: The depth of each expression. By default, the smallest depth that uses every variable
+    :param operators: The operators to choose from. By default, every operator is used
+    :param seed: The seed for the random expressions
+
+    :type variables: list[int]
+    :type depth: int
+    :type operators: list[str]
+    :type seed: int
+
+    :return: A list of results for each amount of variables
+    :rtype: list[dict]
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5 import QtCore, QtTest
+    from main import Logician
+
+    logician = Logician(sys.argv[:1])
+    results = []
+    for count in variables:
+        expression = random_formula(count, depth, operators, seed)
+        logician.expression_text.clear()
+
+        # A keystroke is handled by on_edit on the GUI thread which must never wait for the expression
+        keystrokes = []
+        for character in expression:
+            start = time.perf_counter()
+            QtTest.QTest.keyClicks(logician.expression_text, character)
+            keystrokes.append(time.perf_counter() - start)
+
+        # The result is shown once the debounce timer runs out and the worker has finished
+        #   which is when the status bar no longer says that the expression is being computed
+        start = time.perf_counter()
+        while logician.window.statusBar().currentMessage() == "Computing…":
+            logician.processEvents(QtCore.QEventLoop.AllEvents, 10)
+        result = time.perf_counter() - start
+
+        keystrokes.sort()
+        common = {"variables": count, "depth": depth, "operators": operators, "seed": seed}
+        results.append({"stage": "gui_keystroke", **common, "seconds": keystrokes[len(keystrokes) // 2],
+                        "max_seconds": keystrokes[-1]})
+        results.append({"stage": "gui_result", **common, "seconds": result})
+    return results
+
+
+def compare(results: list, baseline: list, threshold: float) -> list:
+    """Compares results with the results of an earlier run. A result is matched with the result
+    of the baseline that has the same stage and parameters
+
+    :param results: The results to compare
+    :param baseline: The results of the earlier run
+    :param threshold: How many times slower a result may be than the baseline before it is a regression
+
+    :type results: list[dict]
+    :type baseline: list[dict]
+    :type threshold: float
+
+    :return: A list of the results that are in the baseline with the ratio of their time to the baseline
+        and whether or not they are a regression
+    :rtype: list[dict]
+    """
+    earlier = {_get_key(result): result for result in baseline}
+    comparisons = []
+    for result in results:
+        key = _get_key(result)
+        if key not in earlier:
+            continue
+        ratio = result["seconds"] / earlier[key]["seconds"] if earlier[key]["seconds"] > 0 else 1.0
+        comparisons.append({**result, "baseline_seconds": earlier[key]["seconds"],
+                            "ratio": ratio, "regression": ratio > threshold})
+    return comparisons
+
+
+def _get_key(result: dict) -> str:
+    """Returns the stage and parameters of a result which identifies it between runs
+
+    :param result: The result to get the key of
+    :type result: dict
+
+    :rtype: str
+    """
+    return json.dumps({
+        name: value
+        for name, value in result.items()
+        if "seconds" not in name and name not in ["ratio", "regression"]
+    }, sort_keys=True)
+
+
+def _print_results(results: list):
+    """Prints the results of a benchmark as a table
+
+    :param results: The results to print
+    :type results: list[dict]
+    """
+    for result in results:
+        size = result.get("tokens", result.get("variables", ""))
+        line = "{:<20} {:>8} {:>12.6f}s".format(result["stage"], size, result["seconds"])
+        if "tokens_per_second" in result:
+            line += " {:>14}".format("{:.0f} tok/s".format(result["tokens_per_second"]))
+        if "ratio" in result:
+            line += " {:>8.2f}x{}".format(result["ratio"], "  REGRESSION" if result["regression"] else "")
+        print(line)
+
+
+def main():
+    arguments = argparse.ArgumentParser(description="Benchmarks for the Logician expression pipeline")
+    commands = arguments.add_subparsers(dest="command", required=True)
+
+    # Every command can write its results and compare them with a baseline
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--output", help="The JSON file to write the results to")
+    common.add_argument("--baseline", help="The JSON file of an earlier run to compare the results with")
+    common.add_argument("--threshold", type=float, default=1.2,
+                        help="How many times slower than the baseline a result may be before it is a regression")
+
+    # The pipeline and GUI commands use random expressions
+    formulas = argparse.ArgumentParser(add_help=False)
+    formulas.add_argument("--variables", type=int, nargs="+", default=[4, 8, 12, 16],
+                          choices=range(4, 21), metavar="{4..20}",
+                          help="The amounts of variables of each expression")
+    formulas.add_argument("--depth", type=int, help="The depth of each expression")
+    formulas.add_argument("--operators", nargs="+", choices=list(OPERATOR_STYLES),
+                          help="The operators to choose from")
+    formulas.add_argument("--seed", type=int, default=0, help="The seed for the random expressions")
+
+    parse = commands.add_parser("parse", parents=[common], help="Compare the LALR, Earley and Pratt parsers")
+    parse.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 10000],
+                       help="The amounts of tokens of each expression to parse")
+    parse.add_argument("--repeat", type=int, default=5, help="The amount of times to parse each expression")
+
+    pipeline = commands.add_parser("pipeline", parents=[common, formulas],
+                                   help="Time each stage of parsing, evaluating, and simplifying")
+    pipeline.add_argument("--parser", choices=["lark", "fast"], default="fast", help="The parser to use")
+    pipeline.add_argument("--repeat", type=int, default=5, help="The amount of times to time each stage")
+    pipeline.add_argument("--backend", choices=["python", "numpy"], default="python",
+                          help="The backend that finds the prime implicants")
+
+    commands.add_parser("gui", parents=[common, formulas], help="Time how long the app takes to respond to typing")
+    options = arguments.parse_args()
+
+    if options.command == "parse":
+        results = benchmark_parse(options.sizes, options.repeat)
+    elif options.command == "pipeline":
+        results = benchmark_pipeline(options.variables, options.depth, options.operators,
+                                     options.parser, options.repeat, options.seed, options.backend)
+    else:
+        results = benchmark_gui(options.variables, options.depth, options.operators, options.seed)
+
+    if options.output is not None:
+        with open(options.output, "w") as file:
+            json.dump({"command": options.command, "results": results}, file, indent=2)
+
+    # A regression makes the exit status 1 so that the comparison can be used in a script
+    if options.baseline is not None:
+        with open(options.baseline) as file:
+            results = compare(results, json.load(file)["results"], options.threshold)
+    _print_results(results)
+    if any(result.get("regression", False) for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
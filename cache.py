@@ -0,0 +1,237 @@
+import os
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+
+# The version of the stored prime implicants
+#   This must be changed whenever the way an expression is simplified changes
+CACHE_VERSION = 1
+
+
+class SimplifyCache:
+    """A SimplifyCache remembers the prime implicants of functions that have already been simplified.
+    A function is identified by its sorted variables and its truth table as a bitmask, so the same function
+    written differently (``a & b``, ``b and a``, ``!(!a || !b)``) is only simplified once.
+
+    The least recently used functions are removed once the cache is larger than its memory bound.
+    If a path is given, the prime implicants are also stored in a SQLite database so that they
+    can be used again after the program is restarted.
+
+    :param max_bytes: The rough amount of memory, in bytes, the cache may use
+    :param path: The path of the SQLite database to store the prime implicants in. By default, nothing is stored
+
+    :type max_bytes: int
+    :type path: str
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, path: str = None):
+        self._max_bytes = max_bytes
+        self._path = path
+        self._entries = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+
+        # The cache can be used by more than one thread, and the database connection
+        #   is opened again in a child process since a connection cannot be shared between processes
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Getters
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def get_hits(self) -> int:
+        """Returns the amount of functions that were found in the cache"""
+        return self._hits
+
+    def get_misses(self) -> int:
+        """Returns the amount of functions that were not found in the cache"""
+        return self._misses
+
+    def get_size(self) -> int:
+        """Returns the rough amount of memory, in bytes, the functions in the cache use"""
+        return self._size
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Helper Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @staticmethod
+    def __get_key(variables, vector, is_maxterm, dont_cares) -> str:
+        """Returns the key of a function which is used both in memory and in the database
+
+        :param variables: The sorted variables of the function
+        :param vector: The truth table of the function as a bitmask
+        :param is_maxterm: Whether or not the prime implicants are of the maxterm expression
+        :param dont_cares: The rows of the truth table that are don't-cares as a bitmask
+
+        :type variables: list
+        :type vector: int
+        :type is_maxterm: bool
+        :type dont_cares: int
+
+        :rtype: str
+        """
+        key = "{}|{}|{:x}".format(",".join(variables), "M" if is_maxterm else "m", vector)
+
+        # Functions without don't-cares keep the same key as before don't-cares were supported
+        if dont_cares:
+            key += "|{:x}".format(dont_cares)
+        return key
+
+    @staticmethod
+    def __get_entry_size(key, implicants) -> int:
+        """Returns the rough amount of memory, in bytes, an entry of the cache uses
+
+        :param key: The key of the entry
+        :param implicants: The prime implicants of the entry as (bits, mask) tuples
+
+        :type key: str
+        :type implicants: list[tuple]
+
+        :rtype: int
+        """
+        return sys.getsizeof(key) + sys.getsizeof(implicants) + sum(
+            sys.getsizeof(implicant) + sys.getsizeof(implicant[0]) + sys.getsizeof(implicant[1])
+            for implicant in implicants
+        )
+
+    def __connect(self):
+        """Returns the connection to the database or None if there is no database or it cannot be opened"""
+        if self._path is None:
+            return None
+
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            try:
+                self._connection = sqlite3.connect(self._path, check_same_thread=False)
+                self._connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS implicants_v{CACHE_VERSION} (key TEXT PRIMARY KEY, value TEXT)"
+                )
+                self._connection.commit()
+            except sqlite3.Error:
+                self._connection = None
+        return self._connection
+
+    def __add(self, key, implicants):
+        """Adds prime implicants to the memory of the cache and removes the
+        least recently used entries until the cache is within its memory bound
+
+        :param key: The key of the function
+        :param implicants: The prime implicants of the function as (bits, mask) tuples
+
+        :type key: str
+        :type implicants: list[tuple]
+        """
+        if key in self._entries:
+            self._size -= SimplifyCache.__get_entry_size(key, self._entries.pop(key))
+        self._entries[key] = implicants
+        self._size += SimplifyCache.__get_entry_size(key, implicants)
+
+        while self._size > self._max_bytes and len(self._entries) > 0:
+            old_key, old_implicants = self._entries.popitem(last=False)
+            self._size -= SimplifyCache.__get_entry_size(old_key, old_implicants)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Cache Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def get(self, variables, vector, is_maxterm=False, dont_cares=0) -> list:
+        """Returns the prime implicants of a function that has already been simplified
+        or None if the function is not in the cache
+
+        :param variables: The sorted variables of the function
+        :param vector: The truth table of the function as a bitmask
+        :param is_maxterm: Whether or not to get the prime implicants of the maxterm expression
+        :param dont_cares: The rows of the truth table that are don't-cares as a bitmask
+
+        :type variables: list
+        :type vector: int
+        :type is_maxterm: bool
+        :type dont_cares: int
+
+        :return: The prime implicants as (bits, mask) tuples
+        :rtype: list[tuple]
+        """
+        key = SimplifyCache.__get_key(variables, vector, is_maxterm, dont_cares)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+
+            # Check if the prime implicants were stored in the database
+            connection = self.__connect()
+            if connection is not None:
+                try:
+                    row = connection.execute(
+                        f"SELECT value FROM implicants_v{CACHE_VERSION} WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error:
+                    row = None
+                if row is not None:
+                    implicants = [
+                        (int(bits, 16), int(mask, 16))
+                        for bits, mask in (implicant.split(":") for implicant in row[0].split())
+                    ]
+                    self.__add(key, implicants)
+                    self._hits += 1
+                    return implicants
+
+            self._misses += 1
+            return None
+
+    def put(self, variables, vector, implicants, is_maxterm=False, dont_cares=0):
+        """Adds the prime implicants of a function to the cache
+
+        :param variables: The sorted variables of the function
+        :param vector: The truth table of the function as a bitmask
+        :param implicants: The prime implicants of the function as (bits, mask) tuples
+        :param is_maxterm: Whether or not the prime implicants are of the maxterm expression
+        :param dont_cares: The rows of the truth table that are don't-cares as a bitmask
+
+        :type variables: list
+        :type vector: int
+        :type implicants: list[tuple]
+        :type is_maxterm: bool
+        :type dont_cares: int
+        """
+        key = SimplifyCache.__get_key(variables, vector, is_maxterm, dont_cares)
+        implicants = [(bits, mask) for bits, mask in implicants]
+        with self._lock:
+            self.__add(key, implicants)
+
+            connection = self.__connect()
+            if connection is not None:
+                try:
+                    connection.execute(
+                        f"INSERT OR REPLACE INTO implicants_v{CACHE_VERSION} (key, value) VALUES (?, ?)",
+                        (key, " ".join("{:x}:{:x}".format(bits, mask) for bits, mask in implicants))
+                    )
+                    connection.commit()
+                except sqlite3.Error:
+                    pass
+
+    def clear(self):
+        """Removes every function from the memory of the cache and resets the hit and miss counters.
+        The functions stored in the database are kept
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+
+    def close(self):
+        """Closes the connection to the database"""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self._pid = None
@@ -0,0 +1,141 @@
+from expression import Expression
+
+
+class CompiledExpression:
+    """A CompiledExpression lowers an Expression or Variable object into a single generated
+    Python function so that evaluating a row does not need to walk the expression objects
+
+    The generated function only uses the ``&``, ``|`` and ``^`` operators where a NOT is an XOR
+    with a mask. This allows the same function to evaluate a single row of bools
+    or every row of a truth table at once using bit-parallel masks.
+
+    :param root: The root of the expression to compile
+    :param variables: The variables, in order, that the compiled function takes as parameters
+
+    :type root: Expression or Variable
+    :type variables: list
+    """
+
+    OPERATORS = {
+        "OR": "|", "NOR": "|",
+        "AND": "&", "NAND": "&",
+        "XOR": "^", "XNOR": "^"
+    }
+
+    def __init__(self, root, variables: list):
+        self.__variables = variables
+
+        # Create the statements that evaluate every node of the expression
+        #   and load the generated functions
+        parameters = [f"_v{i}" for i in range(len(variables))]
+        body, result = CompiledExpression.__lower(root, dict(zip(variables, parameters)))
+        self.__source = "\n".join([
+            "def _evaluate({}):".format(", ".join(parameters + ["_mask=1"])),
+            *body,
+            f"    return {result}",
+            "",
+            "def _evaluate_row(_row, _mask=1):",
+            *[
+                f"    {parameters[i]} = _row >> {len(variables) - 1 - i} & 1"
+                for i in range(len(variables))
+            ],
+            *body,
+            f"    return {result}",
+            ""
+        ])
+        namespace = {}
+        exec(compile(self.__source, "<logician>", "exec"), namespace)
+        self.__evaluate = namespace["_evaluate"]
+        self.__evaluate_row = namespace["_evaluate_row"]
+
+    def __call__(self, *values) -> bool:
+        return self.__evaluate(*values) == 1
+
+    @staticmethod
+    def __lower(root, parameters: dict) -> tuple:
+        """Lowers an expression into a list of statements where each Expression node
+        is stored in its own temporary variable
+
+        :param root: The root of the expression to lower
+        :param parameters: A JSON object that maps each variable to its parameter name
+
+        :type root: Expression or Variable
+        :type parameters: dict
+
+        :return: A tuple containing the statements and the name that holds the result
+        :rtype: tuple
+        """
+
+        body = []
+        names = {}
+
+        # Walk the expression in post-order without recursion so that
+        #   very deep expressions can still be compiled
+        stack = [(root, False)]
+        while len(stack) > 0:
+            node, visited = stack.pop()
+            if id(node) in names:
+                continue
+
+            # Variables are used directly as a parameter
+            if not isinstance(node, Expression):
+                names[id(node)] = "({} ^ _mask)".format(parameters[node.get_value()]) \
+                    if node.has_not() else parameters[node.get_value()]
+
+            # Expressions are stored once both sides have been lowered
+            elif visited:
+                name = f"_t{len(body)}"
+                statement = "{} {} {}".format(
+                    names[id(node.get_left())],
+                    CompiledExpression.OPERATORS[node.get_operator()],
+                    names[id(node.get_right())]
+                )
+                if node.has_not:
+                    statement = f"({statement}) ^ _mask"
+                body.append(f"    {name} = {statement}")
+                names[id(node)] = name
+
+            else:
+                stack.append((node, True))
+                stack.append((node.get_right(), False))
+                stack.append((node.get_left(), False))
+
+        return body, names[id(root)]
+
+    # # # # # # # # # # # # # # # # # # # #
+    # Getters
+    # # # # # # # # # # # # # # # # # # # #
+
+    def get_variables(self) -> list:
+        """Returns the variables, in order, that the compiled function takes as parameters"""
+        return self.__variables
+
+    def get_source(self) -> str:
+        """Returns the generated Python source of the compiled functions"""
+        return self.__source
+
+    # # # # # # # # # # # # # # # # # # # #
+    # Evaluation Methods
+    # # # # # # # # # # # # # # # # # # # #
+
+    def evaluate_row(self, row: int) -> bool:
+        """Evaluates the compiled expression at a row of the truth table
+        where the first variable is the most significant bit of the row index
+
+        :param row: The row index to evaluate
+        :type row: int
+        """
+        return self.__evaluate_row(row) == 1
+
+    def evaluate_masks(self, masks: list, full: int) -> int:
+        """Evaluates the compiled expression for every row of a truth table at once
+
+        :param masks: The bit-parallel masks of each variable, in order
+        :param full: A mask with a bit set for every row of the truth table
+
+        :type masks: list[int]
+        :type full: int
+
+        :rtype: int
+        """
+        return self.__evaluate(*masks, full)
@@ -0,0 +1,356 @@
+import heapq
+import time
+
+
+class Cancelled(Exception):
+    """Raised by a solve when its cancellation check says that its result is no longer needed"""
+
+
+class SetCover:
+    """A SetCover finds the cheapest set of columns that covers every element of a covering table.
+    This is used to choose the prime implicants after the essential prime implicants have been found.
+
+    The table is first reduced to its cyclic core by repeatedly taking essential columns and
+    removing dominated elements and dominated columns. The cyclic core is then solved exactly
+    with a branch-and-bound search that uses independent elements as a lower bound.
+    The time budget starts with the reduction. If it runs out, the reduction stops and the best cover found so far
+    is used, starting from a greedy cover of the elements that are still uncovered.
+
+    :param columns: The elements that each column covers as a bitmask where bit ``i`` is element ``i``
+    :param costs: The cost of each column
+    :param time_budget: The amount of seconds the reduction and the exact search may take.
+        By default, there is no limit
+    :param is_cancelled: A function that returns True once the cover is no longer needed,
+        which stops the solve with ``Cancelled``. By default, the solve is never cancelled
+
+    :type columns: list[int]
+    :type costs: list[int]
+    :type time_budget: float
+    :type is_cancelled: callable
+    """
+
+    def __init__(self, columns, costs, time_budget=None, is_cancelled=None):
+        self._columns = columns
+        self._costs = costs
+        self._time_budget = time_budget
+        self._is_cancelled = is_cancelled
+        self._optimal = True
+
+        # Keep track of which columns cover each element as a bitmask
+        #   where bit j is column j
+        universe = 0
+        for column in columns:
+            universe |= column
+        self._universe = universe
+        self._rows = [0] * universe.bit_length()
+        for j in range(len(columns)):
+            for element in SetCover.__bits(columns[j]):
+                self._rows[element] |= 1 << j
+
+        self._deadline = None
+        self._best = None
+        self._best_cost = None
+        self._nodes = 0
+        self._solution = self.__solve()
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Getters
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def get_solution(self) -> list:
+        """Returns the indices, in ascending order, of the columns in the cover"""
+        return self._solution
+
+    def is_optimal(self) -> bool:
+        """Returns whether or not the cover is proven to be the cheapest cover"""
+        return self._optimal
+
+    def get_nodes(self) -> int:
+        """Returns the amount of branches the branch-and-bound search visited"""
+        return self._nodes
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Helper Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @staticmethod
+    def __bits(mask):
+        """Returns the indices of the set bits of a mask in ascending order
+
+        :param mask: The mask to get the set bits of
+        :type mask: int
+
+        :rtype: list[int]
+        """
+        bits = []
+        while mask:
+            low = mask & -mask
+            bits.append(low.bit_length() - 1)
+            mask ^= low
+        return bits
+
+    def __covering(self, element, active) -> int:
+        """Returns the active columns that cover an element as a bitmask
+
+        :param element: The index of the element to get the covering columns of
+        :param active: The columns, as a bitmask, that can still be chosen
+
+        :type element: int
+        :type active: int
+        """
+        return self._rows[element] & active
+
+    def __sorted_elements(self, uncovered, active) -> list:
+        """Returns the uncovered elements sorted by how few active columns cover them
+
+        :param uncovered: The elements, as a bitmask, that are not covered yet
+        :param active: The columns, as a bitmask, that can still be chosen
+
+        :type uncovered: int
+        :type active: int
+
+        :rtype: list[int]
+        """
+        return sorted(
+            SetCover.__bits(uncovered),
+            key=lambda e: bin(self.__covering(e, active)).count("1")
+        )
+
+    def __check_cancelled(self):
+        """Raises ``Cancelled`` if the cover is no longer needed"""
+        if self._is_cancelled is not None and self._is_cancelled():
+            raise Cancelled()
+
+    def __is_expired(self) -> bool:
+        """Returns whether or not the time budget has run out, in which case the cover is no longer optimal"""
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            self._optimal = False
+        return not self._optimal
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Reduction Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __reduce(self, uncovered, active) -> tuple:
+        """Reduces the covering table to its cyclic core by taking essential columns
+        and removing dominated elements and dominated columns until nothing changes or the time budget runs out.
+        Every step keeps the cheapest cover, so the table can be left partly reduced
+
+        :param uncovered: The elements, as a bitmask, that are not covered yet
+        :param active: The columns, as a bitmask, that can still be chosen
+
+        :type uncovered: int
+        :type active: int
+
+        :return: A tuple containing the uncovered elements, the active columns, and the chosen columns
+        :rtype: tuple
+        """
+
+        chosen = []
+        changed = True
+        while changed and uncovered and not self.__is_expired():
+            changed = False
+            self.__check_cancelled()
+
+            # Take every column that is the only column covering an element
+            for element in SetCover.__bits(uncovered):
+                if self.__is_expired():
+                    break
+                if not uncovered >> element & 1:
+                    continue
+                covering = self.__covering(element, active)
+                if covering and covering & (covering - 1) == 0:
+                    column = covering.bit_length() - 1
+                    chosen.append(column)
+                    uncovered &= ~self._columns[column]
+                    active &= ~covering
+                    changed = True
+
+            # Remove elements whose covering columns include all the covering columns of another element
+            #   since covering the other element will always cover this element.
+            #   The kept elements are grouped by their first covering column so that only
+            #   the elements that can be a subset are compared
+            kept = {}
+            for element in self.__sorted_elements(uncovered, active):
+                if self.__is_expired():
+                    break
+                covering = self.__covering(element, active)
+                if any(
+                        other & ~covering == 0
+                        for column in SetCover.__bits(covering)
+                        for other in kept.get(column, [])
+                ):
+                    uncovered &= ~(1 << element)
+                    changed = True
+                else:
+                    kept.setdefault((covering & -covering).bit_length() - 1, []).append(covering)
+
+            # Remove columns that cover a subset of the elements of another column
+            #   that costs the same or less. Only the columns that cover the first element
+            #   of a column can cover all of its elements
+            for j in SetCover.__bits(active):
+                if self.__is_expired():
+                    break
+                elements = self._columns[j] & uncovered
+                if elements == 0:
+                    active &= ~(1 << j)
+                    continue
+                first = (elements & -elements).bit_length() - 1
+                for k in SetCover.__bits(self.__covering(first, active)):
+                    if k != j and self._costs[k] <= self._costs[j] and \
+                            elements & ~self._columns[k] == 0 and \
+                            (self._costs[k] < self._costs[j] or self._columns[k] & uncovered != elements or k < j):
+                        active &= ~(1 << j)
+                        changed = True
+                        break
+
+        return uncovered, active, chosen
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Solving Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __greedy(self, uncovered, active) -> list:
+        """Returns a cover of the uncovered elements by repeatedly choosing the column
+        that covers the most uncovered elements for its cost and then, unless the time budget has run out,
+        removing redundant columns
+
+        :param uncovered: The elements, as a bitmask, that are not covered yet
+        :param active: The columns, as a bitmask, that can be chosen
+
+        :type uncovered: int
+        :type active: int
+
+        :rtype: list[int]
+        """
+
+        # Keep the columns in a heap by how many elements they cover for their cost.
+        #   A column can only cover fewer elements as other columns are chosen, so a column
+        #   whose updated score is still the best is chosen without rescoring the other columns
+        chosen = []
+        remaining = uncovered
+        heap = [
+            (-bin(self._columns[j] & remaining).count("1") / self._costs[j], j)
+            for j in SetCover.__bits(active)
+        ]
+        heapq.heapify(heap)
+        while remaining:
+            _, column = heapq.heappop(heap)
+            score = -bin(self._columns[column] & remaining).count("1") / self._costs[column]
+            if len(heap) > 0 and (score, column) > heap[0]:
+                heapq.heappush(heap, (score, column))
+                continue
+            chosen.append(column)
+            remaining &= ~self._columns[column]
+
+        # Remove columns whose elements are all covered by the other chosen columns
+        #   by keeping track of how many chosen columns cover each element.
+        #   The greedy cover is already a cover, so this is skipped once the time budget has run out
+        if self.__is_expired():
+            return chosen
+        counts = {}
+        for column in chosen:
+            for element in SetCover.__bits(self._columns[column] & uncovered):
+                counts[element] = counts.get(element, 0) + 1
+        for column in sorted(chosen, key=lambda j: -self._costs[j]):
+            elements = SetCover.__bits(self._columns[column] & uncovered)
+            if all(counts[element] > 1 for element in elements):
+                chosen.remove(column)
+                for element in elements:
+                    counts[element] -= 1
+
+        return chosen
+
+    def __lower_bound(self, elements, active) -> int:
+        """Returns a lower bound of the cost to cover the uncovered elements.
+        Elements that share no covering columns each need their own column
+
+        :param elements: The uncovered elements sorted by how few active columns cover them
+        :param active: The columns, as a bitmask, that can still be chosen
+
+        :type elements: list[int]
+        :type active: int
+        """
+
+        cheapest = min(self._costs[j] for j in SetCover.__bits(active))
+        used = 0
+        count = 0
+        for element in elements:
+            covering = self.__covering(element, active)
+            if covering & used == 0:
+                used |= covering
+                count += 1
+        return count * cheapest
+
+    def __search(self, uncovered, active, chosen, cost):
+        """Searches for the cheapest cover of the uncovered elements with branch-and-bound
+
+        :param uncovered: The elements, as a bitmask, that are not covered yet
+        :param active: The columns, as a bitmask, that can still be chosen
+        :param chosen: The columns that have been chosen so far
+        :param cost: The cost of the columns that have been chosen so far
+
+        :type uncovered: int
+        :type active: int
+        :type chosen: list[int]
+        :type cost: int
+        """
+
+        self._nodes += 1
+        self.__check_cancelled()
+        if self.__is_expired():
+            return
+
+        # Check if every element is covered
+        if uncovered == 0:
+            if cost < self._best_cost:
+                self._best = list(chosen)
+                self._best_cost = cost
+            return
+
+        # Check if an element can no longer be covered or if this branch cannot beat the best cover
+        elements = self.__sorted_elements(uncovered, active)
+        if self.__covering(elements[0], active) == 0:
+            return
+        if cost + self.__lower_bound(elements, active) >= self._best_cost:
+            return
+
+        # Branch on the columns of the element with the fewest covering columns
+        element = elements[0]
+        columns = sorted(
+            SetCover.__bits(self.__covering(element, active)),
+            key=lambda j: (self._costs[j], -bin(self._columns[j] & uncovered).count("1"), j)
+        )
+        for column in columns:
+            chosen.append(column)
+            self.__search(
+                uncovered & ~self._columns[column], active & ~(1 << column), chosen, cost + self._costs[column]
+            )
+            chosen.pop()
+
+            # Every cover with this column has been searched, so it is not needed in the other branches
+            active &= ~(1 << column)
+            if not self._optimal:
+                return
+
+    def __solve(self) -> list:
+        """Solves for the cheapest cover
+
+        :rtype: list[int]
+        """
+
+        if self._time_budget is not None:
+            self._deadline = time.perf_counter() + self._time_budget
+
+        # Reduce the covering table to its cyclic core
+        uncovered, active, chosen = self.__reduce(self._universe, (1 << len(self._columns)) - 1)
+        if uncovered == 0:
+            return sorted(chosen)
+
+        # Start from a greedy cover so the search has a cost to beat,
+        #   which is also the cover when the time budget ran out while reducing
+        self._best = self.__greedy(uncovered, active)
+        self._best_cost = sum(self._costs[j] for j in self._best)
+        if not self.__is_expired():
+            self.__search(uncovered, active, [], 0)
+        return sorted(chosen + self._best)
@@ -0,0 +1,397 @@
+from expression import Expression
+from qm import Minterm, QM
+
+
+def get_cover(root, variables, negate=False, limit=None) -> list:
+    """Creates a cover of an expression as a list of cubes without enumerating its truth table.
+
+    A cube is a tuple of two integers ``(ones, zeros)`` where a bit in ``ones`` means the variable
+    is true and a bit in ``zeros`` means the variable is false in every row the cube covers.
+    The first variable is the most significant bit, just like the rows of a truth table.
+
+    :param root: The root of the expression to create the cover of
+    :param variables: The variables, in order, of the expression
+    :param negate: Whether or not to create the cover of the NOT of the expression
+    :param limit: The most cubes that the cover of any node may need, or None for no limit
+
+    :type root: Expression or Variable
+    :type variables: list
+    :type negate: bool
+    :type limit: int
+
+    :return: The cover, or None if the cover of a node needs more than ``limit`` cubes
+    :rtype: list[tuple]
+    """
+
+    bits = {variables[i]: 1 << (len(variables) - 1 - i) for i in range(len(variables))}
+
+    # Keep track of the cover of each node for whether or not it is negated
+    #   and walk the expression without recursion so that very deep expressions can be used
+    covers = {}
+    stack = [(root, negate)]
+    while len(stack) > 0:
+        node, negated = stack[-1]
+        if (id(node), negated) in covers:
+            stack.pop()
+            continue
+
+        # A variable is a cube with a single literal
+        if not isinstance(node, Expression):
+            bit = bits[node.get_value()]
+            covers[(id(node), negated)] = [(0, bit)] if node.has_not() != negated else [(bit, 0)]
+            stack.pop()
+            continue
+
+        # Get the covers of the left and right that this node needs.
+        #   Note that the NOT of an AND is the OR of the NOT of each side (and vice versa)
+        key = (id(node), negated)
+        negated = negated != node.has_not
+        operator = node.get_operator()
+        polarities = [negated] if operator in ["AND", "NAND", "OR", "NOR"] else [False, True]
+        needed = [
+            (side, polarity)
+            for side in [node.get_left(), node.get_right()]
+            for polarity in polarities
+            if (id(side), polarity) not in covers
+        ]
+        if len(needed) > 0:
+            stack.extend(needed)
+            continue
+
+        left = node.get_left()
+        right = node.get_right()
+
+        # An AND is the product of the covers of its sides and an OR is their union.
+        #   An XOR is true when exactly one side is true and an XNOR when both sides are the same
+        if operator in ["AND", "NAND"] and not negated or operator in ["OR", "NOR"] and negated:
+            products = [(covers[(id(left), negated)], covers[(id(right), negated)])]
+        elif operator in ["AND", "NAND", "OR", "NOR"]:
+            products = []
+        else:
+            products = [
+                (covers[(id(left), False)], covers[(id(right), not negated)]),
+                (covers[(id(left), True)], covers[(id(right), negated)])
+            ]
+
+        # Every cube of one side of a product is multiplied with every cube of the other side
+        #   so the sizes of the sides are checked before the cubes are multiplied
+        if limit is not None and any(len(cubes) * len(others) > limit for cubes, others in products):
+            return None
+
+        if len(products) == 1:
+            cover = _product(*products[0])
+        elif len(products) == 0:
+            cover = _union(covers[(id(left), negated)], covers[(id(right), negated)])
+        else:
+            cover = _union(_product(*products[0]), _product(*products[1]))
+        if limit is not None and len(cover) > limit:
+            return None
+        covers[key] = cover
+        stack.pop()
+
+    return covers[(id(root), negate)]
+
+
+def get_complement(cubes, limit=None) -> list:
+    """Creates a cover of the rows that a cover does not cover without enumerating its truth table
+
+    :param cubes: The cover, as a list of cubes from ``get_cover``, to create the complement of
+    :param limit: The most cubes that the complement may need, or None for no limit
+
+    :type cubes: list[tuple]
+    :type limit: int
+
+    :return: The complement, or None if it needs more than ``limit`` cubes
+    :rtype: list[tuple]
+    """
+    return _complement(cubes, limit)
+
+
+# # # # # # # # # # # # # # # # # # # # # # # # #
+# Cube Methods
+# # # # # # # # # # # # # # # # # # # # # # # # #
+
+def _literals(cube) -> int:
+    """Returns the amount of literals in a cube"""
+    return bin(cube[0] | cube[1]).count("1")
+
+
+def _contains(cube, other) -> bool:
+    """Returns whether or not every row of the other cube is in the cube"""
+    return cube[0] & ~other[0] == 0 and cube[1] & ~other[1] == 0
+
+
+def _intersects(cube, other) -> bool:
+    """Returns whether or not the cube and the other cube have a row in common"""
+    return cube[0] & other[1] == 0 and cube[1] & other[0] == 0
+
+
+def _minimize(cubes) -> list:
+    """Removes every cube that is contained in another cube of a cover"""
+    result = []
+    for cube in sorted(set(cubes), key=_literals):
+        if not any(_contains(other, cube) for other in result):
+            result.append(cube)
+    return result
+
+
+def _union(cubes, others) -> list:
+    """Returns the cover of the OR of two covers"""
+    return _minimize(cubes + others)
+
+
+def _product(cubes, others) -> list:
+    """Returns the cover of the AND of two covers"""
+    return _minimize([
+        (cube[0] | other[0], cube[1] | other[1])
+        for cube in cubes
+        for other in others
+        if _intersects(cube, other)
+    ])
+
+
+def _cofactor(cubes, cube) -> list:
+    """Returns the cofactor of a cover with respect to a cube which is the cover
+    of the rows inside the cube with the literals of the cube removed
+    """
+    literals = cube[0] | cube[1]
+    return [
+        (other[0] & ~literals, other[1] & ~literals)
+        for other in cubes
+        if _intersects(other, cube)
+    ]
+
+
+def _split(cubes) -> int:
+    """Returns the variable, as a bit, to split a cover on when it is not unate.
+    This is the variable that appears both as true and false in the most cubes.
+    If every variable only appears as true or only as false, 0 is returned
+    """
+    ones = zeros = 0
+    for cube in cubes:
+        ones |= cube[0]
+        zeros |= cube[1]
+    binate = ones & zeros
+
+    best = 0
+    best_count = 0
+    while binate:
+        bit = binate & -binate
+        binate ^= bit
+        count = min(
+            sum(1 for cube in cubes if cube[0] & bit),
+            sum(1 for cube in cubes if cube[1] & bit)
+        )
+        if count > best_count:
+            best = bit
+            best_count = count
+    return best
+
+
+def _covers(cubes, cube) -> bool:
+    """Returns whether or not every row of a cube is covered by a cover"""
+    return _tautology(_cofactor(cubes, cube))
+
+
+def _tautology(cubes) -> bool:
+    """Returns whether or not a cover covers every row with the unate recursive paradigm"""
+    if (0, 0) in cubes:
+        return True
+
+    # A cover that is unate in every variable is only a tautology if it has the universal cube
+    bit = _split(cubes)
+    if bit == 0:
+        return False
+    return _tautology(_cofactor(cubes, (bit, 0))) and _tautology(_cofactor(cubes, (0, bit)))
+
+
+def _complement(cubes, limit=None) -> list:
+    """Returns a cover of the rows that a cover does not cover with the unate recursive paradigm,
+    or None when the cover, or the cover of either half, needs more than a limit of cubes
+    """
+    if len(cubes) == 0:
+        return [(0, 0)]
+    if (0, 0) in cubes:
+        return []
+
+    # The complement of a single cube is each of its literals negated
+    if len(cubes) == 1:
+        result = []
+        ones, zeros = cubes[0]
+        while ones | zeros:
+            bit = (ones | zeros) & -(ones | zeros)
+            result.append((0, bit) if ones & bit else (bit, 0))
+            ones &= ~bit
+            zeros &= ~bit
+        return result
+
+    # Split on a binate variable, or on the most used variable when the cover is unate
+    bit = _split(cubes)
+    if bit == 0:
+        literals = 0
+        for cube in cubes:
+            literals |= cube[0] | cube[1]
+        bit = max(
+            [1 << i for i in range(literals.bit_length()) if literals >> i & 1],
+            key=lambda b: sum(1 for cube in cubes if (cube[0] | cube[1]) & b)
+        )
+
+    true = _complement(_cofactor(cubes, (bit, 0)), limit)
+    if true is None:
+        return None
+    false = _complement(_cofactor(cubes, (0, bit)), limit)
+    if false is None:
+        return None
+
+    # Cubes in both halves do not need the split variable. Since each half has no cube that contains another,
+    #   a cube of one half can only be contained in a cube that is in both halves
+    both = set(true) & set(false)
+    result = list(both)
+    for half, literal in [(true, (bit, 0)), (false, (0, bit))]:
+        result.extend(
+            (cube[0] | literal[0], cube[1] | literal[1])
+            for cube in half
+            if cube not in both and not any(_contains(other, cube) for other in both)
+        )
+    if limit is not None and len(result) > limit:
+        return None
+    return result
+
+
+class Espresso:
+    """A class to minimize a cover of cubes with the Espresso heuristic.
+    Unlike the Quine-McCluskey Algorithm, this never enumerates the rows of a truth table
+    so it can be used with many more variables, but the result is not always the smallest.
+
+    :param variables: A list of variables (as strings), in alphabetical order, that an expression has
+    :param cover: A list of cubes, from ``get_cover``, where the expression is true
+    :param dont_cares: A list of cubes to be used as don't-care values
+    :param is_maxterm: Whether or not the cover is of the rows where the expression is false
+        and the result should be a maxterm expression
+
+    :type variables: list
+    :type cover: list[tuple]
+    :type dont_cares: list[tuple]
+    :type is_maxterm: bool
+    """
+
+    def __init__(self, variables, cover, dont_cares=None, *, is_maxterm=False):
+        if dont_cares is None:
+            dont_cares = []
+        self._variables = variables
+        self._full = (1 << len(variables)) - 1
+        self._cover = cover
+        self._dont_cares = dont_cares
+        self._is_maxterm = is_maxterm
+
+        self._prime_implicants = [
+            Minterm(cube[0], self._full & ~(cube[0] | cube[1]), len(variables))
+            for cube in sorted(self.__minimize(), key=lambda c: (c[0], c[1]))
+        ]
+        self._function = QM.format_function(variables, self._prime_implicants, is_maxterm)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Espresso Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @staticmethod
+    def __cost(cubes) -> tuple:
+        """Returns the cost of a cover as the amount of cubes and then the amount of literals"""
+        return len(cubes), sum(_literals(cube) for cube in cubes)
+
+    def __expand(self, cubes) -> list:
+        """Makes each cube as large as possible by removing literals
+        while every row of the cube is still in the cover or a don't-care.
+        This is checked with a tautology of the cofactor of the cover so that
+        the rows where the expression is false never need to be found
+
+        :param cubes: The cover to expand
+        :type cubes: list[tuple]
+        """
+        care = self._cover + self._dont_cares
+        result = []
+        for cube in sorted(cubes, key=_literals):
+            if any(_contains(other, cube) for other in result):
+                continue
+
+            literals = cube[0] | cube[1]
+            while literals:
+                bit = literals & -literals
+                literals ^= bit
+                expanded = (cube[0] & ~bit, cube[1] & ~bit)
+                if _covers(care, expanded):
+                    cube = expanded
+            result.append(cube)
+        return _minimize(result)
+
+    def __irredundant(self, cubes) -> list:
+        """Removes every cube that is covered by the other cubes and the don't-cares
+
+        :param cubes: The cover to remove redundant cubes from
+        :type cubes: list[tuple]
+        """
+        result = list(cubes)
+        for cube in sorted(cubes, key=_literals, reverse=True):
+            others = [other for other in result if other != cube] + self._dont_cares
+            if _tautology(_cofactor(others, cube)):
+                result.remove(cube)
+        return result
+
+    def __reduce(self, cubes) -> list:
+        """Makes each cube as small as possible while the cover still covers the same rows
+        so that the next expansion can find different, and hopefully fewer, cubes
+
+        :param cubes: The cover to reduce
+        :type cubes: list[tuple]
+        """
+        result = list(cubes)
+        for cube in sorted(cubes, key=_literals):
+            result.remove(cube)
+            others = result + self._dont_cares
+            if _covers(others, cube):
+                continue
+
+            # The smallest cube that contains every row only this cube covers has a literal of each variable
+            #   where one half of the cube is covered by the other cubes
+            free = self._full & ~(cube[0] | cube[1])
+            while free:
+                bit = free & -free
+                free ^= bit
+                if _covers(others, (cube[0] | bit, cube[1])):
+                    cube = (cube[0], cube[1] | bit)
+                elif _covers(others, (cube[0], cube[1] | bit)):
+                    cube = (cube[0] | bit, cube[1])
+            result.append(cube)
+        return result
+
+    def __minimize(self) -> list:
+        """Minimizes the cover with the expand, irredundant and reduce loop
+
+        :rtype: list[tuple]
+        """
+
+        if len(self._cover) == 0:
+            return []
+        if _tautology(self._cover + self._dont_cares):
+            return [(0, 0)]
+
+        cubes = self.__irredundant(self.__expand(self._cover))
+        while True:
+            reduced = self.__irredundant(self.__expand(self.__reduce(cubes)))
+            if Espresso.__cost(reduced) >= Espresso.__cost(cubes):
+                return cubes
+            cubes = reduced
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Getters
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def get_function(self) -> str:
+        """Returns the function minimized by Espresso"""
+        return self._function
+
+    def get_prime_implicants(self) -> list:
+        """Returns the prime implicants, as Minterm objects, that make up the function
+        in the same order as they appear in the function
+        """
+        return self._prime_implicants
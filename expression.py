@@ -1,3 +1,5 @@
+import threading
+import weakref
 from typing import Union
 from variable import Variable
 
@@ -5,6 +7,10 @@ from variable import Variable
 class Expression:
     """A Expression class holds information about a boolean expression
 
+    An Expression is immutable and interned, so creating an Expression that is the same as one that already exists
+    returns the existing Expression. The same subexpression is then a single object wherever it is used, which turns
+    the expression into a DAG that is only evaluated once per subexpression.
+
     :param left: The left side of this Expression
     :param operator: The operator of this Expression
     :param right: The right side of this Expression
@@ -18,11 +24,18 @@ class Expression:
     :type json: dict
     """
 
-    def __init__(self, left: ['Expression', Variable] = None,
-                 operator: str = None,
-                 right: ['Expression', Variable] = None,
-                 has_not: bool = False, *,
-                 json: dict = None):
+    __slots__ = ("left", "operator", "right", "has_not", "_hash", "__weakref__")
+
+    # The unique table of every Expression that exists keyed by its children, operator, and NOT
+    #   Note that the children are interned too, so they are compared by their identity
+    _unique = weakref.WeakValueDictionary()
+    _lock = threading.Lock()
+
+    def __new__(cls, left: ['Expression', Variable] = None,
+                operator: str = None,
+                right: ['Expression', Variable] = None,
+                has_not: bool = False, *,
+                json: dict = None):
 
         # Check if the JSON object is given
         if json is not None:
@@ -45,23 +58,88 @@ class Expression:
                     "The \"left\", \"operator\", \"right\", and \"has_not\" keys must exist in the Expression JSON")
 
         # Make sure left, operator, right, and has_not exist
-        if left is not None and operator is not None and right is not None and has_not is not None:
-            self.left = left
-            self.operator = operator
-            self.right = right
-            self.has_not = has_not
-        else:
+        if left is None or operator is None or right is None or has_not is None:
             raise ValueError(
                 "The \"left\", \"operator\", \"right\", and \"has_not\" parameters must not be a NoneType.")
 
+        has_not = bool(has_not)
+        key = (id(left), operator, id(right), has_not)
+        # The lock is only needed to add a new Expression so that two threads never add the same one
+        expression = Expression._unique.get(key)
+        if expression is not None:
+            return expression
+        with Expression._lock:
+            expression = Expression._unique.get(key)
+            if expression is None:
+                expression = super().__new__(cls)
+                setter = super(Expression, expression).__setattr__
+                setter("left", left)
+                setter("operator", operator)
+                setter("right", right)
+                setter("has_not", has_not)
+                setter("_hash", hash((hash(left), operator, hash(right), has_not)))
+                Expression._unique[key] = expression
+        return expression
+
+    def __setattr__(self, name, value):
+        raise AttributeError("An Expression cannot be changed")
+
+    def __delattr__(self, name):
+        raise AttributeError("An Expression cannot be changed")
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        # Pickle the expression as a flat list of nodes in post-order, where each Expression refers to
+        #   the nodes before it by their index, so that very deep expressions can be sent to other processes
+        #   without recursion and the same subexpression is only pickled once
+        nodes = []
+        indices = {}
+        stack = [(self, False)]
+        while len(stack) > 0:
+            node, visited = stack.pop()
+            if id(node) in indices:
+                continue
+            if not isinstance(node, Expression):
+                nodes.append(node)
+            elif visited:
+                nodes.append((indices[id(node.left)], node.operator, indices[id(node.right)], node.has_not))
+            else:
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+                continue
+            indices[id(node)] = len(nodes) - 1
+        return _from_nodes, (nodes,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __str__(self):
-        if not self.has_not:
-            return "({} {} {})".format(
-                str(self.get_left()), self.get_operator(), str(self.get_right())
-            )
-        return "NOT({} {} {})".format(
-            str(self.get_left()), self.get_operator(), str(self.get_right())
-        )
+        # Write the expression in post-order without recursion so that long chains of terms,
+        #   like a simplified expression of many parts, can still be written
+        strings = {}
+        stack = [(self, False)]
+        while len(stack) > 0:
+            node, visited = stack.pop()
+            if id(node) in strings:
+                continue
+            if not isinstance(node, Expression):
+                strings[id(node)] = str(node)
+            elif visited:
+                strings[id(node)] = "{}({} {} {})".format(
+                    "NOT" if node.has_not else "",
+                    strings[id(node.get_left())], node.get_operator(), strings[id(node.get_right())]
+                )
+            else:
+                stack.append((node, True))
+                stack.append((node.get_right(), False))
+                stack.append((node.get_left(), False))
+        return strings[id(self)]
 
     # # # # # # # # # # # # # # # # # # # # # # # # #
     # Getters
@@ -79,6 +157,21 @@ class Expression:
         """Returns the right value of this Expression object"""
         return self.right
 
+    def negate(self) -> 'Expression':
+        """Returns a new Expression object that is the NOT of this Expression object"""
+        return Expression(self.get_left(), self.get_operator(), self.get_right(), not self.has_not)
+
+    def to_json(self) -> dict:
+        """Returns a JSON object of this Expression object that can be loaded with ``Expression(json=...)``"""
+
+        # The has_not of a NAND, a NOR, or an XNOR is inverted when it is loaded
+        return {
+            "left": self.get_left().to_json(),
+            "operator": self.get_operator(),
+            "right": self.get_right().to_json(),
+            "has_not": self.has_not != (self.get_operator() in ["NAND", "NOR", "XNOR"])
+        }
+
     # # # # # # # # # # # # # # # # # # # # # # # # #
     # Evaluation Methods
     # # # # # # # # # # # # # # # # # # # # # # # # #
@@ -104,6 +197,34 @@ class Expression:
             return not evaluation
         return evaluation
 
+    def evaluate_mask(self, masks, full) -> int:
+        """Evaluates this Expression object for every row of a truth table at once
+        given a dict of bit-parallel masks
+
+        :param masks: A JSON object of masks where bit ``r`` of each mask is the truth value
+            of the variable at row ``r``
+        :param full: A mask with a bit set for every row of the truth table
+
+        :type masks: dict
+        :type full: int
+
+        :rtype: int
+        """
+        left = self.get_left().evaluate_mask(masks, full)
+        right = self.get_right().evaluate_mask(masks, full)
+
+        evaluation = 0
+        if self.get_operator() in ["OR", "NOR"]:
+            evaluation = left | right
+        elif self.get_operator() in ["AND", "NAND"]:
+            evaluation = left & right
+        elif self.get_operator() in ["XOR", "XNOR"]:
+            evaluation = left ^ right
+
+        if self.has_not:
+            return evaluation ^ full
+        return evaluation
+
     def functional(self) -> str:
         """Returns a functional representation of this Expression
 
@@ -112,7 +233,38 @@ class Expression:
             - ``NOT a AND b`` would be functionally equivalent to ``and(not(a), b)``
             - ``NOT (a AND b)`` would be functionally equivalent to ``not(and(a, b))``
         """
-        expr = f"{self.get_operator().lower()}({self.get_left().functional()}, {self.get_right().functional()})"
-        if self.has_not:
-            expr = f"not({expr})"
-        return expr
+
+        # Write the expression in post-order without recursion, like ``__str__``
+        strings = {}
+        stack = [(self, False)]
+        while len(stack) > 0:
+            node, visited = stack.pop()
+            if id(node) in strings:
+                continue
+            if not isinstance(node, Expression):
+                strings[id(node)] = node.functional()
+            elif visited:
+                expr = f"{node.get_operator().lower()}({strings[id(node.get_left())]}, {strings[id(node.get_right())]})"
+                if node.has_not:
+                    expr = f"not({expr})"
+                strings[id(node)] = expr
+            else:
+                stack.append((node, True))
+                stack.append((node.get_right(), False))
+                stack.append((node.get_left(), False))
+        return strings[id(self)]
+
+
+def _from_nodes(nodes: list) -> Expression:
+    """Returns the Expression of the last node of a list of nodes written by ``Expression.__reduce__``
+
+    :param nodes: The Variables and the Expressions, as a tuple of the index of the left node, the operator,
+        the index of the right node, and has_not, in post-order
+    :type nodes: list[Variable or tuple]
+    """
+    built = []
+    for node in nodes:
+        if isinstance(node, tuple):
+            node = Expression(built[node[0]], node[1], built[node[2]], node[3])
+        built.append(node)
+    return built[-1]
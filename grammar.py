@@ -0,0 +1,122 @@
+import hashlib
+import os
+import stat
+import tempfile
+
+from lark import Lark, __version__ as LARK_VERSION
+
+# The version of the serialized parse table
+#   This must be changed whenever the way the parser is created changes
+PARSER_VERSION = 1
+
+BOOLEAN_GRAMMAR = """
+    start: orexpr
+    ?orexpr: (orexpr ("+" | "|" ~ 1..2 | "or" | "OR"))? andexpr
+    ?andexpr: (andexpr ("*" | "&" ~ 1..2 | "and" | "AND"))? xorexpr
+    ?xorexpr: (xorexpr ("^" | "xor" | "XOR"))? xnorexpr
+    ?xnorexpr: (xnorexpr ("-^" | "!^" | "~^" | "xnor" | "XNOR"))? norexpr
+    ?norexpr: (norexpr ("-+" | "!||" | "~|" | "nor" | "NOR"))? nandexpr
+    ?nandexpr: (nandexpr ("-*" | "!&&" | "~&" | "nand" | "NAND"))? term
+    ?term: nexpr
+        | pexpr
+        | IDENT
+    nexpr: ("~" | "!" | "-" | "not" | "NOT") term
+    ?pexpr: "(" orexpr ")"
+        | "[" orexpr "]"
+
+    %import common.CNAME -> IDENT
+    %import common.WS
+    %ignore WS
+    """
+
+
+def get_cache_path() -> str:
+    """Returns the path of the file that holds the serialized LALR parse table.
+    The file is in the cache directory of the user, instead of the temporary directory that every user
+    can write to, since loading the parse table unpickles it.
+    The path includes a hash of the grammar so that changing the grammar never loads a stale table
+    """
+    if os.name == "nt":
+        directory = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        directory = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    digest = hashlib.sha256(BOOLEAN_GRAMMAR.encode("utf-8")).hexdigest()
+    return os.path.join(directory, "logician", f"parser_{digest}.cache")
+
+
+def _is_private(status: os.stat_result) -> bool:
+    """Returns whether or not a file or directory is owned by the current user and no other user can write to it.
+    This is always True where there are no user IDs, like on Windows
+
+    :param status: The status of the file or directory from ``os.stat`` or ``os.fstat``
+    :type status: os.stat_result
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    return status.st_uid == os.getuid() and status.st_mode & (stat.S_IWGRP | stat.S_IWOTH) == 0
+
+
+def _get_header() -> bytes:
+    """Returns the header that is written before the serialized parse table
+    which holds the versions the parse table was created with
+    """
+    return f"logician {PARSER_VERSION} lark {LARK_VERSION}\n".encode("utf-8")
+
+
+def create_parser() -> Lark:
+    """Creates the LALR parser for a boolean expression from the grammar
+    without using the serialized parse table
+    """
+    return Lark(BOOLEAN_GRAMMAR, parser="lalr")
+
+
+def create_earley_parser() -> Lark:
+    """Creates an Earley parser for a boolean expression from the same grammar
+    as the LALR parser. This is only used to compare the two parsers
+    """
+    return Lark(BOOLEAN_GRAMMAR, parser="earley")
+
+
+def load_parser(path: str = None) -> Lark:
+    """Loads the LALR parser for a boolean expression from its serialized parse table.
+    If the parse table does not exist or was created by a different version, the parser is
+    created from the grammar and the parse table is saved for the next time
+
+    :param path: The path of the serialized parse table. By default, this is a file in the cache directory
+        of the user. The parse table is only loaded from, and saved to, a file and a directory that
+        are owned by the current user and that no other user can write to
+    :type path: str
+    """
+
+    if path is None:
+        path = get_cache_path()
+
+    # Try loading the parse table if the versions in the header match
+    #   Note that the opened file is checked so that it cannot be replaced after it is checked
+    directory = os.path.dirname(os.path.abspath(path))
+    # noinspection PyBroadException
+    try:
+        with open(path, "rb") as file:
+            if _is_private(os.fstat(file.fileno())) and _is_private(os.stat(directory)) and \
+                    file.readline() == _get_header():
+                return Lark.load(file)
+    except Exception:
+        pass
+
+    # The parse table could not be loaded, create the parser and try to save it
+    #   The parse table is written to a temporary file first so that another process
+    #   never loads a parse table that is only partially written
+    parser = create_parser()
+    # noinspection PyBroadException
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not _is_private(os.stat(directory)):
+            return parser
+        with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as file:
+            file.write(_get_header())
+            parser.save(file)
+        os.replace(file.name, path)
+    except Exception:
+        pass
+
+    return parser
@@ -0,0 +1,203 @@
+"""Simplifies boolean expressions without the GUI
+
+Run ``python -m logician expressions.txt`` to simplify every line of a file (or stdin when no file is given)
+and write one JSON object per expression, in the same order as the input
+"""
+import argparse
+import itertools
+import json
+import os
+import signal
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# The Tree class is imported once by each worker when the worker starts
+#   so that the main process never needs to import the parser
+Tree = None
+METHOD = "qm"
+PARSER = "lark"
+TIMEOUT = None
+
+
+class ExpressionTimeout(Exception):
+    """Raised inside a worker when an expression takes longer than the timeout"""
+
+
+def _on_timeout(*_):
+    raise ExpressionTimeout()
+
+
+def _initialize(method: str, parser: str, timeout: float, part_workers: int = None):
+    """Imports the Tree class and loads the parser in a worker
+
+    :param method: The method to simplify with which is either "qm" or "espresso"
+    :param parser: The parser to use which is either "lark" or "fast"
+    :param timeout: The amount of seconds each expression may take, or None for no limit
+    :param part_workers: The amount of processes the parts of an expression may be simplified in.
+        By default, ``Tree.WORKERS`` is kept
+
+    :type method: str
+    :type parser: str
+    :type timeout: float
+    :type part_workers: int
+    """
+    global Tree, METHOD, PARSER, TIMEOUT
+    from tree import Tree
+    if part_workers is not None:
+        Tree.WORKERS = part_workers
+    METHOD = method
+    PARSER = parser
+    TIMEOUT = timeout
+
+    # Parse an expression so the parser is loaded before the first real expression
+    Tree("a", PARSER)
+    if TIMEOUT is not None and hasattr(signal, "SIGALRM"):
+        signal.signal(signal.SIGALRM, _on_timeout)
+
+
+def _simplify(expression: str) -> dict:
+    """Simplifies a boolean expression in a worker
+
+    :param expression: The boolean expression to simplify
+    :type expression: str
+
+    :return: A JSON object with the minterm, maxterm, variables, and functional form of the expression,
+        where a form with more than ``Tree.MAX_TERMS`` terms is null,
+        or with the error if the expression could not be simplified
+    :rtype: dict
+    """
+
+    # The timer is only available where there is a SIGALRM signal
+    timed = TIMEOUT is not None and hasattr(signal, "SIGALRM")
+    if timed:
+        signal.setitimer(signal.ITIMER_REAL, TIMEOUT)
+    try:
+        tree = Tree(expression, PARSER)
+        minterm, maxterm, shortest = tree.simplify_all(METHOD)
+        return {
+            "expression": expression,
+            "minterm": None if minterm is None else str(minterm),
+            "maxterm": None if maxterm is None else str(maxterm),
+            "shortest": "minterm" if shortest is minterm else "maxterm",
+            "variables": tree.get_variables(),
+            "functional": tree.functional()
+        }
+    except ExpressionTimeout:
+        return {"expression": expression, "error": "timeout"}
+    except ValueError as error:
+        return {"expression": expression, "error": str(error)}
+
+    # Any other error, such as a RecursionError on a very deep expression, is only the error of this expression
+    #   so it is written for this expression instead of stopping every other expression
+    except Exception as error:
+        return {"expression": expression, "error": f"{type(error).__name__}: {error}"}
+    finally:
+        if timed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def read_expressions(paths: list):
+    """Yields every expression, one per line, from a list of files where "-" is stdin.
+    Blank lines are skipped
+
+    :param paths: The paths of the files to read. By default, stdin is read
+    :type paths: list[str]
+
+    :rtype: Iterator[str]
+    """
+    for path in paths or ["-"]:
+        file = sys.stdin if path == "-" else open(path, encoding="utf-8")
+        try:
+            for line in file:
+                line = line.strip()
+                if len(line) > 0:
+                    yield line
+        finally:
+            if file is not sys.stdin:
+                file.close()
+
+
+def simplify_expressions(expressions, workers: int = None, chunk_size: int = 16, timeout: float = None,
+                         method: str = "qm", parser: str = "lark"):
+    """Yields the simplification of every expression, in the same order as the expressions,
+    by simplifying them in a pool of worker processes
+
+    :param expressions: The boolean expressions to simplify
+    :param workers: The amount of worker processes. By default, this is the amount of CPUs.
+        With 1 worker, the expressions are simplified in this process
+    :param chunk_size: The amount of expressions to send to a worker at once
+    :param timeout: The amount of seconds each expression may take, or None for no limit
+    :param method: The method to simplify with which is either "qm" or "espresso"
+    :param parser: The parser to use which is either "lark" or "fast"
+
+    :type expressions: Iterable[str]
+    :type workers: int
+    :type chunk_size: int
+    :type timeout: float
+    :type method: str
+    :type parser: str
+
+    :rtype: Iterator[dict]
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1:
+        _initialize(method, parser, timeout)
+        for expression in expressions:
+            yield _simplify(expression)
+        return
+
+    # The expressions are sent in batches so that a very large input is never all in memory
+    #   while each worker still has a few chunks waiting for it. Every CPU already has a worker,
+    #   so the parts of an expression are simplified in the worker itself
+    expressions = iter(expressions)
+    batch_size = workers * chunk_size * 4
+    with ProcessPoolExecutor(workers, initializer=_initialize, initargs=(method, parser, timeout, 1)) as executor:
+        while True:
+            batch = list(itertools.islice(expressions, batch_size))
+            if len(batch) == 0:
+                break
+            for result in executor.map(_simplify, batch, chunksize=chunk_size):
+                yield result
+
+
+def main():
+    arguments = argparse.ArgumentParser(
+        prog="python -m logician",
+        description="Simplifies boolean expressions, one per line, and writes the results as JSON lines"
+    )
+    arguments.add_argument("files", nargs="*", help="The files to read expressions from. By default, stdin is read")
+    arguments.add_argument("-o", "--output", default="-", help="The file to write the results to")
+    arguments.add_argument("-w", "--workers", type=int, default=None,
+                           help="The amount of worker processes. By default, this is the amount of CPUs")
+    arguments.add_argument("-c", "--chunk-size", type=int, default=16,
+                           help="The amount of expressions to send to a worker at once")
+    arguments.add_argument("-t", "--timeout", type=float, default=None,
+                           help="The amount of seconds each expression may take")
+    arguments.add_argument("-m", "--method", choices=["qm", "espresso"], default="qm",
+                           help="The method to simplify with")
+    arguments.add_argument("-p", "--parser", choices=["lark", "fast"], default="lark",
+                           help="The parser to use")
+    options = arguments.parse_args()
+
+    if options.workers is not None and options.workers < 1:
+        arguments.error("the amount of workers must be at least 1")
+    if options.chunk_size < 1:
+        arguments.error("the chunk size must be at least 1")
+
+    output = sys.stdout if options.output == "-" else open(options.output, "w", encoding="utf-8")
+    try:
+        results = simplify_expressions(
+            read_expressions(options.files),
+            options.workers, options.chunk_size, options.timeout, options.method, options.parser
+        )
+        for result in results:
+            output.write(json.dumps(result) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 import sys
 import os
+import multiprocessing
 
 from PyQt5 import QtGui, QtWidgets, QtCore
 
+from cover import Cancelled
+from stats import Stats, instrument
 from tree import Tree
 
 
@@ -23,6 +26,191 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+# # # # # # # # # # # # # # # # # # # #
+# Model Classes
+# # # # # # # # # # # # # # # # # # # #
+
+
+class TruthTableModel(QtCore.QAbstractTableModel):
+    """A TruthTableModel gives a QTableView the truth table of a Tree one cell at a time.
+    The truth table is never created, a row is only evaluated when the QTableView shows it,
+    so even a truth table with millions of rows uses almost no memory
+
+    :param tree: The Tree to show the truth table of, or None for an empty truth table
+    :param parent: The QObject that owns this TruthTableModel
+
+    :type tree: Tree
+    :type parent: QtCore.QObject
+    """
+
+    # Qt keeps the amount of rows in a C int, so only the first MAX_ROWS rows of a larger truth table are shown
+    #   followed by a row that says the truth table was truncated
+    MAX_ROWS = 1 << 30
+    TRUNCATED = "…"
+
+    def __init__(self, tree: Tree = None, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self.variables = [] if tree is None else tree.get_variables()
+        self.expression = "" if tree is None else str(tree)
+        self.compiled = None if tree is None else tree.compile()
+
+    def is_truncated(self) -> bool:
+        """Returns whether or not the truth table has more rows than the QTableView can show"""
+        return self.compiled is not None and 1 << len(self.variables) > TruthTableModel.MAX_ROWS
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() or self.compiled is None:
+            return 0
+        if self.is_truncated():
+            return TruthTableModel.MAX_ROWS + 1
+        return 1 << len(self.variables)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() or self.compiled is None:
+            return 0
+        return len(self.variables) + 1
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == QtCore.Qt.TextAlignmentRole:
+            return QtCore.Qt.AlignCenter
+
+        # The row after the last row that is shown says that the truth table was truncated
+        if index.row() == TruthTableModel.MAX_ROWS and self.is_truncated():
+            if role == QtCore.Qt.DisplayRole:
+                return TruthTableModel.TRUNCATED
+            if role == QtCore.Qt.ToolTipRole:
+                return f"Only the first {TruthTableModel.MAX_ROWS} of the 2^{len(self.variables)} rows are shown."
+            return None
+
+        if role == QtCore.Qt.DisplayRole:
+
+            # The variables are the bits of the row where the first variable is the most significant bit
+            #   and the last column is the evaluation of the expression at the row
+            row, column = index.row(), index.column()
+            if column < len(self.variables):
+                return "1" if row >> (len(self.variables) - 1 - column) & 1 else "0"
+            return "1" if self.compiled.evaluate_row(row) else "0"
+
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole:
+            return None
+
+        if orientation == QtCore.Qt.Horizontal:
+            if section < len(self.variables):
+                return self.variables[section]
+            return self.expression
+        if section == TruthTableModel.MAX_ROWS and self.is_truncated():
+            return TruthTableModel.TRUNCATED
+        return str(section)
+
+
+# # # # # # # # # # # # # # # # # # # #
+# Worker Classes
+# # # # # # # # # # # # # # # # # # # #
+
+
+class WorkerSignals(QtCore.QObject):
+    """The signals that a SimplifyWorker uses to post its result back to the GUI thread.
+    A QRunnable is not a QObject so it cannot have signals itself
+
+    Each signal holds the generation of the request so that results of stale requests can be ignored
+    """
+
+    finished = QtCore.pyqtSignal(int, object)
+    failed = QtCore.pyqtSignal(int, str)
+
+
+class SimplifyWorker(QtCore.QRunnable):
+    """A SimplifyWorker parses, simplifies, and compiles an expression
+    on a thread of a QThreadPool so that the GUI thread never freezes
+
+    :param expression: The boolean expression to simplify
+    :param dont_cares: A boolean expression that is true where the value of the expression does not matter,
+        or an empty string for no don't-cares
+    :param generation: The generation of the request which increases every time the expression is edited
+    :param is_stale: A function that returns whether or not a newer request has been made since this one
+    :param show_stats: Whether or not to record the time of each stage for the status bar
+
+    :type expression: str
+    :type dont_cares: str
+    :type generation: int
+    :type is_stale: callable
+    :type show_stats: bool
+    """
+
+    def __init__(self, expression: str, dont_cares: str, generation: int, is_stale, show_stats: bool = False):
+        super().__init__()
+        self.expression = expression
+        self.dont_cares = dont_cares
+        self.generation = generation
+        self.is_stale = is_stale
+        self.show_stats = show_stats
+        self.signals = WorkerSignals()
+
+    def run(self):
+        if self.show_stats:
+            with instrument() as stats:
+                self.simplify(stats)
+        else:
+            self.simplify()
+
+    def simplify(self, stats: Stats = None):
+        """Parses, simplifies, and compiles the expression and emits the result
+
+        :param stats: The Stats that records the time of each stage, or None to not show it
+        :type stats: Stats
+        """
+
+        # Stop between each step as soon as a newer request has been made
+        #   since its result would never be shown
+        try:
+            tree = Tree(self.expression)
+            if self.is_stale():
+                return
+            minterm, maxterm, shortest = tree.simplify_all(
+                dont_cares=self.dont_cares or None, is_cancelled=self.is_stale
+            )
+            if self.is_stale():
+                return
+
+            # An expression that is always false or always true shows the truth table
+            #   of the expression in both truth tables
+            #   Note that the expressions are compiled here so the GUI thread only evaluates rows
+            if str(minterm) in "01" or str(maxterm) in "01":
+                simplified = tree
+            else:
+                simplified = shortest
+            tree.compile()
+            simplified.compile()
+
+            # A form of an expression of parts that has too many terms is not built
+            too_large = f"More than {Tree.MAX_TERMS} terms"
+            self.signals.finished.emit(self.generation, {
+                "minterm": too_large if minterm is None else str(minterm),
+                "maxterm": too_large if maxterm is None else str(maxterm),
+                "is_minterm_shortest": shortest is minterm,
+                "tree": tree,
+                "simplified": simplified,
+                "stats": None if stats is None else str(stats)
+            })
+
+        except ValueError as error:
+            self.signals.failed.emit(self.generation, str(error))
+
+        # A newer request stops this one while it is simplified since its result would never be shown
+        except Cancelled:
+            self.signals.failed.emit(self.generation, "The expression was edited")
+
+        # Any other error must still be emitted so that the app never keeps waiting for this request
+        except Exception as error:
+            self.signals.failed.emit(self.generation, f"{type(error).__name__}: {error}")
+
+
 # # # # # # # # # # # # # # # # # # # #
 # App Class / Window Geometry
 # # # # # # # # # # # # # # # # # # # #
@@ -36,6 +224,12 @@ class Logician(QtWidgets.QApplication):
 
     COURIER_NEW = QtGui.QFont("courier new")
 
+    # The amount of milliseconds to wait after the last keystroke before the expression is evaluated
+    DEBOUNCE_INTERVAL = 150
+
+    # Whether or not to show the time of each stage of simplifying the expression in the status bar
+    SHOW_STATS = False
+
     def __init__(self, *args):
         super().__init__(*args)
 
@@ -48,6 +242,8 @@ class Logician(QtWidgets.QApplication):
         # Setup the labels for the expression and simplified fields
         self.expression_label = QtWidgets.QLabel("Expression", self.window)
 
+        self.dont_cares_label = QtWidgets.QLabel("Don't Cares", self.window)
+
         self.simplified_minterm_label = QtWidgets.QLabel("Simplified Minterm", self.window)
 
         self.simplified_maxterm_label = QtWidgets.QLabel("Simplified Maxterm", self.window)
@@ -55,8 +251,23 @@ class Logician(QtWidgets.QApplication):
         # Setup the text fields for the expression, the simplified fields, and the truth table
         self.expression_text = QtWidgets.QLineEdit(self.window)
         self.expression_text.textEdited.connect(self.on_edit)
+
+        # The expression is evaluated on a thread pool once the user stops typing for a moment.
+        #   Every edit increases the generation so that only the newest result is ever shown
+        self.thread_pool = QtCore.QThreadPool(self.window)
+        self.generation = 0
+        self.debounce_timer = QtCore.QTimer(self.window)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(Logician.DEBOUNCE_INTERVAL)
+        self.debounce_timer.timeout.connect(self.start_worker)
         self.expression_text.setToolTip("The boolean expression to evaluate.")
 
+        self.dont_cares_text = QtWidgets.QLineEdit(self.window)
+        self.dont_cares_text.textEdited.connect(self.on_edit)
+        self.dont_cares_text.setToolTip(
+            "A boolean expression that is true where the value of the expression does not matter."
+        )
+
         self.simplified_minterm_text = QtWidgets.QLineEdit(self.window)
         self.simplified_minterm_text.setReadOnly(True)
         self.simplified_minterm_text.setToolTip("The expression simplified as a Minterm expression.")
@@ -65,17 +276,8 @@ class Logician(QtWidgets.QApplication):
         self.simplified_maxterm_text.setReadOnly(True)
         self.simplified_maxterm_text.setToolTip("The expression simplified as a Maxterm expression.")
 
-        self.truth_table_text = QtWidgets.QTextEdit(self.window)
-        self.truth_table_text.setReadOnly(True)
-        self.truth_table_text.setToolTip("The truth table of the given expression.")
-        self.truth_table_text.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
-        self.truth_table_text.setLineWrapMode(QtWidgets.QTextEdit.NoWrap)
-
-        self.simplified_truth_table_text = QtWidgets.QTextEdit(self.window)
-        self.simplified_truth_table_text.setReadOnly(True)
-        self.simplified_truth_table_text.setToolTip("The truth table of the simplest expression.")
-        self.simplified_truth_table_text.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
-        self.simplified_truth_table_text.setLineWrapMode(QtWidgets.QTextEdit.NoWrap)
+        self.truth_table_view = self.create_table_view("The truth table of the given expression.")
+        self.simplified_truth_table_view = self.create_table_view("The truth table of the simplest expression.")
 
         # Setup the layout for the window by joining a grid layout and a horizontal layout in a vertical layout
         self.layout = QtWidgets.QVBoxLayout()
@@ -83,12 +285,14 @@ class Logician(QtWidgets.QApplication):
         table_layout = QtWidgets.QHBoxLayout()
         text_layout.addWidget(self.expression_label, 0, 0)
         text_layout.addWidget(self.expression_text, 0, 1)
-        text_layout.addWidget(self.simplified_minterm_label, 1, 0)
-        text_layout.addWidget(self.simplified_minterm_text, 1, 1)
-        text_layout.addWidget(self.simplified_maxterm_label, 2, 0)
-        text_layout.addWidget(self.simplified_maxterm_text, 2, 1)
-        table_layout.addWidget(self.truth_table_text)
-        table_layout.addWidget(self.simplified_truth_table_text)
+        text_layout.addWidget(self.dont_cares_label, 1, 0)
+        text_layout.addWidget(self.dont_cares_text, 1, 1)
+        text_layout.addWidget(self.simplified_minterm_label, 2, 0)
+        text_layout.addWidget(self.simplified_minterm_text, 2, 1)
+        text_layout.addWidget(self.simplified_maxterm_label, 3, 0)
+        text_layout.addWidget(self.simplified_maxterm_text, 3, 1)
+        table_layout.addWidget(self.truth_table_view)
+        table_layout.addWidget(self.simplified_truth_table_view)
         self.layout.addLayout(text_layout)
         self.layout.addLayout(table_layout)
 
@@ -98,7 +302,6 @@ class Logician(QtWidgets.QApplication):
         widget.setLayout(self.layout)
         self.window.setCentralWidget(widget)
         self.window.show()  # show the window
-        sys.exit(self.exec_())
 
     def setup(self):
 
@@ -119,12 +322,56 @@ class Logician(QtWidgets.QApplication):
         credits_act.setStatusTip('Show the credits given')
         credits_act.triggered.connect(self.show_credits)
 
-        # Setup a menubar for the credits dialog box
+        # Create an action to show the time of each stage in the status bar
+        self.stats_act = QtWidgets.QAction("Show Timings", self.window)
+        self.stats_act.setCheckable(True)
+        self.stats_act.setChecked(Logician.SHOW_STATS)
+        self.stats_act.setStatusTip('Show the time of each stage of simplifying the expression')
+
+        # Setup a menubar for the credits dialog box and the timings
         self.window.statusBar()
         menubar = self.window.menuBar()
+        view_menu = menubar.addMenu('View')
+        view_menu.addAction(self.stats_act)
         help_menu = menubar.addMenu('Help')
         help_menu.addAction(credits_act)
 
+    def create_table_view(self, tooltip: str) -> QtWidgets.QTableView:
+        """Creates a QTableView for a truth table where every row has the same height
+        so that the QTableView never needs to measure the rows it does not show
+
+        :param tooltip: The tooltip of the QTableView
+        :type tooltip: str
+        """
+        view = QtWidgets.QTableView(self.window)
+        view.setToolTip(tooltip)
+        view.setModel(TruthTableModel(parent=view))
+        view.setFont(Logician.COURIER_NEW)
+        view.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
+        view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        view.verticalHeader().setVisible(False)
+        view.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        view.verticalHeader().setDefaultSectionSize(view.fontMetrics().height() + 4)
+        view.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+        return view
+
+    @staticmethod
+    def show_table(view: QtWidgets.QTableView, tree: Tree = None):
+        """Shows the truth table of a Tree in a QTableView and deletes the model
+        of the truth table that was shown before
+
+        :param view: The QTableView to show the truth table in
+        :param tree: The Tree to show the truth table of, or None for an empty truth table
+
+        :type view: QtWidgets.QTableView
+        :type tree: Tree
+        """
+        model = view.model()
+        selection_model = view.selectionModel()
+        view.setModel(TruthTableModel(tree, view))
+        model.deleteLater()
+        selection_model.deleteLater()
+
     def show_credits(self):
         """This function is called whenever the user clicks on the credits option
         in the menu bar
@@ -143,52 +390,98 @@ class Logician(QtWidgets.QApplication):
         credits_message.exec_()
 
     def on_edit(self):
-        """This function is called whenever the Expression textfield is changed by the user
+        """This function is called whenever the Expression or Don't Cares textfield is changed by the user.
+        The expression is only evaluated once the user stops typing for the debounce interval
+        """
+
+        # Any request that has not finished yet is now stale
+        #   Note that the last result stays on screen until the new result is ready
+        self.generation += 1
+        self.thread_pool.clear()
+        self.window.statusBar().showMessage("Computing…")
+        self.debounce_timer.start()
+
+    def start_worker(self):
+        """This function is called when the debounce timer runs out to evaluate the expression
+        on the thread pool
+        """
+        generation = self.generation
+        worker = SimplifyWorker(
+            self.expression_text.text(), self.dont_cares_text.text().strip(), generation,
+            lambda: generation != self.generation,
+            self.stats_act.isChecked()
+        )
+        worker.signals.finished.connect(self.on_result)
+        worker.signals.failed.connect(self.on_error)
+        self.thread_pool.start(worker)
+
+    def on_result(self, generation: int, result: dict):
+        """This function is called on the GUI thread when a SimplifyWorker has finished
+
+        :param generation: The generation of the request the result is of
+        :param result: The simplified expressions and truth tables of the expression
+
+        :type generation: int
+        :type result: dict
         """
 
+        # Ignore the result if the expression has been edited since the request was made
+        if generation != self.generation:
+            return
+        if result["stats"] is not None:
+            self.window.statusBar().showMessage(result["stats"])
+        else:
+            self.window.statusBar().clearMessage()
+
         self.simplified_maxterm_label.setStyleSheet("color: #000000;")
         self.simplified_minterm_label.setStyleSheet("color: #000000;")
 
-        # Try to evaluate the expression and set the simplified fields
-        #   and the truth table
-        try:
-            tree = Tree(self.expression_text.text())
-            minterm = tree.simplify(get_minterm=True)
-            maxterm = tree.simplify(get_minterm=False)
-            self.simplified_minterm_text.setText(str(minterm))
-            self.simplified_maxterm_text.setText(str(maxterm))
-            self.truth_table_text.setText(tree.get_table())
-
-            # Check if the expression is always false or always true
-            if str(minterm) in "01" or str(maxterm) in "01":
-                self.simplified_minterm_text.setText("Always " + ("True" if str(minterm) == "1" else "False"))
-                self.simplified_maxterm_text.setText("Always " + ("True" if str(minterm) == "1" else "False"))
-                self.truth_table_text.setText(tree.get_table())
-                self.simplified_truth_table_text.setText(tree.get_table())
+        minterm = result["minterm"]
+        maxterm = result["maxterm"]
+        self.simplified_minterm_text.setText(minterm)
+        self.simplified_maxterm_text.setText(maxterm)
+        Logician.show_table(self.truth_table_view, result["tree"])
+        Logician.show_table(self.simplified_truth_table_view, result["simplified"])
+
+        # Check if the expression is always false or always true
+        if minterm in "01" or maxterm in "01":
+            self.simplified_minterm_text.setText("Always " + ("True" if minterm == "1" else "False"))
+            self.simplified_maxterm_text.setText("Always " + ("True" if minterm == "1" else "False"))
 
-            # The expression is not always false or always true
+        # The expression is not always false or always true
+        else:
+
+            # Highlight the shortest of the minterm expression and maxterm expression
+            if result["is_minterm_shortest"]:
+                self.simplified_minterm_label.setStyleSheet("color: #00AA00;")
             else:
+                self.simplified_maxterm_label.setStyleSheet("color: #00AA00;")
+
+    def on_error(self, generation: int, _: str):
+        """This function is called on the GUI thread when a SimplifyWorker could not evaluate the expression
 
-                # Highlight the shortest expression by comparing the sizes of
-                #   the minterm expression and maxterm expression
-                if len(str(minterm)) < len(str(maxterm)):
-                    self.simplified_minterm_label.setStyleSheet("color: #00AA00;")
-                    self.simplified_truth_table_text.setText(minterm.get_table())
-                else:
-                    self.simplified_maxterm_label.setStyleSheet("color: #00AA00;")
-                    self.simplified_truth_table_text.setText(maxterm.get_table())
-                self.truth_table_text.setFont(Logician.COURIER_NEW)
-                self.simplified_truth_table_text.setFont(Logician.COURIER_NEW)
+        :param generation: The generation of the request that failed
+        :type generation: int
+        """
+
+        # Ignore the error if the expression has been edited since the request was made
+        if generation != self.generation:
+            return
+        self.window.statusBar().clearMessage()
 
         # If there is an error, don't set the fields to anything
-        except ValueError as _:
-            self.simplified_minterm_text.setText("")
-            self.simplified_maxterm_text.setText("")
-            self.truth_table_text.setText("")
-            self.simplified_truth_table_text.setText("")
+        self.simplified_maxterm_label.setStyleSheet("color: #000000;")
+        self.simplified_minterm_label.setStyleSheet("color: #000000;")
+        self.simplified_minterm_text.setText("")
+        self.simplified_maxterm_text.setText("")
+        Logician.show_table(self.truth_table_view)
+        Logician.show_table(self.simplified_truth_table_view)
 
 
 if __name__ == "__main__":
+    # The processes that simplify large expressions are spawned, which the frozen app needs to support
+    multiprocessing.freeze_support()
     QtWidgets.QApplication.setStyle('fusion')
     logician = Logician(sys.argv)
     QtWidgets.QApplication.setStyle('fusion')
+    sys.exit(logician.exec_())
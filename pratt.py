@@ -0,0 +1,210 @@
+import re
+
+from expression import Expression
+from variable import Variable
+
+
+class PrattParser:
+    """A PrattParser parses a boolean expression straight into Expression and Variable objects
+    without using Lark. It accepts the same operators and precedence as the Lark grammar in ``grammar.py``
+
+    :param expr: The boolean expression to parse
+    :type expr: str
+    """
+
+    # Longer operators are listed before the shorter operators that they start with
+    TOKEN = re.compile(
+        r"(?P<ident>[A-Za-z_][A-Za-z0-9_]*)|"
+        r"(?P<symbol>!&&|!\|\||!\^|~&|~\||~\^|-\^|-\+|-\*|[&|+*^~!\-()\[\]])"
+    )
+    WHITESPACE = re.compile(r"[ \t\f\r\n]*")
+
+    NOT = ["~", "!", "-", "not", "NOT"]
+    OPERATORS = {
+        "+": "OR", "|": "OR", "or": "OR", "OR": "OR",
+        "*": "AND", "&": "AND", "and": "AND", "AND": "AND",
+        "^": "XOR", "xor": "XOR", "XOR": "XOR",
+        "-^": "XNOR", "!^": "XNOR", "~^": "XNOR", "xnor": "XNOR", "XNOR": "XNOR",
+        "-+": "NOR", "!||": "NOR", "~|": "NOR", "nor": "NOR", "NOR": "NOR",
+        "-*": "NAND", "!&&": "NAND", "~&": "NAND", "nand": "NAND", "NAND": "NAND"
+    }
+
+    # The precedence of each operator where a higher precedence binds tighter
+    #   which follows orexpr > andexpr > xorexpr > xnorexpr > norexpr > nandexpr in the grammar
+    PRECEDENCE = {"OR": 1, "AND": 2, "XOR": 3, "XNOR": 4, "NOR": 5, "NAND": 6}
+    BRACKETS = {"(": ")", "[": "]"}
+
+    def __init__(self, expr: str):
+        self.__tokens = PrattParser.__tokenize(expr)
+        self.__index = 0
+        self.__variables = {}
+
+    @staticmethod
+    def __tokenize(expr: str) -> list:
+        """Splits a boolean expression into a list of tokens
+
+        :param expr: The boolean expression to split
+        :type expr: str
+
+        :rtype: list[str]
+        """
+
+        tokens = []
+        position = PrattParser.WHITESPACE.match(expr).end()
+        while position < len(expr):
+            match = PrattParser.TOKEN.match(expr, position)
+            if match is None:
+                raise ValueError(f"Unexpected character at position {position}")
+            tokens.append(match.group())
+            position = PrattParser.WHITESPACE.match(expr, match.end()).end()
+        return tokens
+
+    # # # # # # # # # # # # # # # # # # # #
+    # Token Methods
+    # # # # # # # # # # # # # # # # # # # #
+
+    def __peek(self) -> str:
+        """Returns the next token without consuming it or None if there are no tokens left"""
+        if self.__index < len(self.__tokens):
+            return self.__tokens[self.__index]
+        return None
+
+    def __next(self) -> str:
+        """Consumes and returns the next token"""
+        token = self.__peek()
+        if token is None:
+            raise ValueError("Unexpected end of expression")
+        self.__index += 1
+        return token
+
+    def __split_operator(self):
+        """Splits the next token when it is a word that starts with a word operator.
+        Like the contextual lexer of the Lark parser, ``a xnorb`` is read as ``a xnor b``
+        because only an operator can follow a term
+        """
+        token = self.__peek()
+        if token is None or token in PrattParser.OPERATORS or not (token[0].isalpha() or token[0] == "_"):
+            return
+
+        for operator in PrattParser.OPERATORS:
+            if operator[0].isalpha() and token.startswith(operator):
+                self.__tokens[self.__index: self.__index + 1] = [operator, token[len(operator):]]
+                return
+
+    # # # # # # # # # # # # # # # # # # # #
+    # Parsing Methods
+    # # # # # # # # # # # # # # # # # # # #
+
+    def parse(self) -> tuple:
+        """Parses the boolean expression
+
+        :return: A tuple containing the root Expression or Variable and a sorted list of variables in the expression
+        :rtype: tuple
+        """
+
+        # The operands that have been parsed and the NOTs, open brackets, and binary operators
+        #   that are still waiting for their operands are kept in stacks instead of recursing
+        #   so that very deep expressions, like many nested brackets, can still be parsed
+        operands = []
+        operators = []
+        while True:
+            self.__parse_term(operands, operators)
+
+            # Close every bracket that follows the term since the bracketed expression is also a term
+            self.__split_operator()
+            while self.__peek() is not None and self.__peek() not in PrattParser.OPERATORS:
+                self.__close_bracket(operands, operators)
+                self.__split_operator()
+
+            if self.__peek() is None:
+                break
+
+            # Every waiting operator with the same or a higher precedence takes its right side now
+            #   so that every operator is left-associative
+            operator = PrattParser.OPERATORS[self.__peek()]
+            while len(operators) > 0 and operators[-1] in PrattParser.PRECEDENCE and \
+                    PrattParser.PRECEDENCE[operators[-1]] >= PrattParser.PRECEDENCE[operator]:
+                PrattParser.__apply(operands, operators.pop())
+
+            # The C-like || and && operators are two tokens of | and &
+            token = self.__next()
+            if token in ["|", "&"] and self.__peek() == token:
+                self.__next()
+            operators.append(operator)
+
+        while len(operators) > 0:
+            if operators[-1] in PrattParser.BRACKETS:
+                raise ValueError("Unexpected end of expression")
+            PrattParser.__apply(operands, operators.pop())
+        return operands[0], sorted(self.__variables)
+
+    @staticmethod
+    def __apply(operands: list, operator: str):
+        """Replaces the last two operands with a binary operator of them
+
+        :param operands: The operands that have been parsed
+        :param operator: The binary operator to apply
+
+        :type operands: list[Expression or Variable]
+        :type operator: str
+        """
+        right = operands.pop()
+        left = operands.pop()
+        operands.append(Expression(left, operator, right, operator in ["NAND", "NOR", "XNOR"]))
+
+    def __parse_term(self, operands: list, operators: list):
+        """Parses a variable with every NOT and open bracket before it
+
+        :param operands: The operands that have been parsed
+        :param operators: The NOTs, open brackets, and binary operators that are waiting for their operands
+
+        :type operands: list[Expression or Variable]
+        :type operators: list[str]
+        """
+
+        token = self.__next()
+        while token in PrattParser.NOT or token in PrattParser.BRACKETS:
+            operators.append(token)
+            token = self.__next()
+
+        # The term is a variable
+        #   Like the contextual lexer of the Lark parser, a word operator where a term
+        #   is expected is a variable
+        if not (token[0].isalpha() or token[0] == "_"):
+            raise ValueError(f"Unexpected token {token!r}")
+        self.__variables[token] = None
+        operands.append(Variable(token, False))
+        PrattParser.__negate(operands, operators)
+
+    def __close_bracket(self, operands: list, operators: list):
+        """Closes the innermost open bracket, which must be the next token, and applies the NOTs before it
+
+        :param operands: The operands that have been parsed
+        :param operators: The NOTs, open brackets, and binary operators that are waiting for their operands
+
+        :type operands: list[Expression or Variable]
+        :type operators: list[str]
+        """
+
+        token = self.__next()
+        while len(operators) > 0 and operators[-1] not in PrattParser.BRACKETS:
+            PrattParser.__apply(operands, operators.pop())
+        if len(operators) == 0:
+            raise ValueError(f"Unexpected token {token!r}")
+        if PrattParser.BRACKETS[operators.pop()] != token:
+            raise ValueError("Mismatched brackets")
+        PrattParser.__negate(operands, operators)
+
+    @staticmethod
+    def __negate(operands: list, operators: list):
+        """Negates the last operand once for every NOT that is waiting for it
+
+        :param operands: The operands that have been parsed
+        :param operators: The NOTs, open brackets, and binary operators that are waiting for their operands
+
+        :type operands: list[Expression or Variable]
+        :type operators: list[str]
+        """
+        while len(operators) > 0 and operators[-1] in PrattParser.NOT:
+            operators.pop()
+            operands.append(operands.pop().negate())
@@ -1,44 +1,85 @@
+import time
+from collections import OrderedDict
 from typing import Union
 
+from cover import Cancelled, SetCover
+from table import TruthTable
+
 
 class Minterm:
     """An object to hold information about a minterm/maxterm when using the Quine-McCluskey Algorithm
 
-    :param values: The integer values that this Minterm consists of
-    :param value: The bit values of this Minterm
-        For example, a minterm could have bit values such as ('-010', '1010', '--00', etc.)
+    A minterm is stored as a pair of integers where the mask holds the don't-care bits
+    and the bits hold the value of every bit that is not a don't-care.
+    For example, the bit value ``'-010'`` has the bits ``0b0010`` and the mask ``0b1000``
 
-    :type values: list
-    :type value: str
+    :param bits: The value of the bits of this Minterm that are not don't-cares
+    :param mask: The bits of this Minterm that are don't-cares
+    :param size: The amount of bits, or variables, in this Minterm
+
+    :type bits: int
+    :type mask: int
+    :type size: int
     """
 
-    def __init__(self, values, value):
-        self._values = values
-        self._value = value
-        self._used = False
+    __slots__ = ("_bits", "_mask", "_size", "_used")
 
-        self._values.sort()
+    def __init__(self, bits, mask, size):
+        self._bits = bits
+        self._mask = mask
+        self._size = size
+        self._used = False
 
     def __str__(self):
-        values = ", ".join([str(value) for value in self._values])
-        return f"m({values}) = {self._value}"
+        values = ", ".join([str(value) for value in self.get_values()])
+        return f"m({values}) = {self.get_value()}"
 
     def __eq__(self, minterm):
         if type(minterm) != Minterm:
             return False
 
-        return (
-                self._value == minterm.get_value() and
-                self._values == minterm.get_values()
-        )
+        return self._bits == minterm._bits and self._mask == minterm._mask
+
+    def __hash__(self):
+        return hash((self._bits, self._mask))
+
+    def get_bits(self) -> int:
+        """Returns the value of the bits of this minterm that are not don't-cares."""
+        return self._bits
+
+    def get_mask(self) -> int:
+        """Returns the bits of this minterm that are don't-cares."""
+        return self._mask
 
     def get_values(self) -> list:
         """Returns all the implicants that this minterm covers."""
-        return self._values
+
+        # Iterate through every subset of the don't-care bits from largest to smallest
+        values = []
+        subset = self._mask
+        while True:
+            values.append(self._bits | subset)
+            if subset == 0:
+                break
+            subset = (subset - 1) & self._mask
+
+        values.reverse()
+        return values
 
     def get_value(self) -> str:
         """Returns the bit values ('-010', '1010', etc.) for this minterm."""
-        return self._value
+        return "".join([
+            "-" if self._mask >> bit & 1 else str(self._bits >> bit & 1)
+            for bit in range(self._size - 1, -1, -1)
+        ])
+
+    def covers(self, value) -> bool:
+        """Returns whether or not the specified integer value is one of the implicants this minterm covers.
+
+        :param value: The integer value to check
+        :type value: int
+        """
+        return value & ~self._mask == self._bits
 
     def use(self):
         """Keeps track of when this minterm is "used" in a comparison."""
@@ -59,32 +100,32 @@ class Minterm:
         :type minterm: Minterm
         """
 
-        # Check if this minterm is the same as the one trying to be combined with
-        if self._value == minterm._value or self._values == minterm._values:
+        # The minterms can only be combined if they have the same don't-cares
+        #   and their bits differ by exactly 1 bit
+        if self._mask != minterm._mask:
+            return None
+        diff = self._bits ^ minterm._bits
+        if diff == 0 or diff & (diff - 1) != 0:
             return None
 
-        # Keep track of the amount of difference between the value of the minterm
-        #   and also keep track of the resulting string
-        diff = 0
-        result = ""
-
-        # Iterate through all the bit values
-        for char in range(len(self._value)):
+        return Minterm(self._bits & ~diff, self._mask | diff, self._size)
 
-            # Check if this minterm and the combined minterm have a bit difference
-            if self._value[char] != minterm._value[char]:
-                diff += 1
-                result += "-"
 
-            # There is no difference
-            else:
-                result += self._value[char]
+def _unique(np, keys, has_values) -> tuple:
+    """Removes the duplicate terms from the keys of the "numpy" backend and sorts them.
+    A term that is kept has a value when any of its duplicates has a value
 
-            # The difference is greater than 1, these minterms cannot be combined
-            if diff > 1:
-                return None
+    :param np: The NumPy module
+    :param keys: The key of every term which is its mask followed by its bits
+    :param has_values: Whether or not every term has a value
 
-        return Minterm(self._values + minterm._values, result)
+    :return: A tuple containing the sorted keys and whether or not each term has a value
+    :rtype: tuple
+    """
+    keys, inverse = np.unique(keys, return_inverse=True)
+    values = np.zeros(len(keys), dtype=bool)
+    values[inverse.reshape(-1)[has_values]] = True
+    return keys, values
 
 
 class QM:
@@ -92,44 +133,67 @@ class QM:
 
     :param variables: A list of variables (as strings), in alphabetical order, that an expression has
     :param values: A list of integers where the binary values evaluate to true at
-    :param dont_cares: A list of integers to be used as don't-care values
+    :param dont_cares: A list of integers to be used as don't-care values, or a packed bitmask
+        where bit ``r`` is whether or not the value ``r`` is a don't-care
     :param is_maxterm: Whether or not to evaluate the Quine-McCluskey Algorithm as a maxterm
+    :param time_budget: The amount of seconds that choosing the prime implicants after the essential prime
+        implicants may take before a greedy choice is used. By default, there is no limit
+    :param backend: The backend that finds the prime implicants which is either "python"
+        or "numpy" to combine every term of a round at once with NumPy arrays. Both find the same prime implicants,
+        but not always in the same order, so a different cover of the same size may be chosen
+    :param is_cancelled: A function that returns True once the result is no longer needed, which is checked
+        after every round and while choosing the prime implicants and stops the solve with ``Cancelled``.
+        By default, the solve is never cancelled
 
     :type variables: list
     :type values: list
-    :type dont_cares: list
+    :type dont_cares: list or int
     :type is_maxterm: bool
+    :type time_budget: float
+    :type backend: str
+    :type is_cancelled: callable
     """
 
+    # The most terms times variables that the "numpy" backend looks up at once
+    CHUNK_TERMS = 1 << 22
+
+    # The rough amount of memory, in bytes, that the don't-care cubes of the "python" backend may use.
+    #   Each mask keeps one bit for every row, so only the most recently used masks are kept
+    DONT_CARE_BYTES = 64 * 1024 * 1024
+
     # # # # # # # # # # # # # # # # # # # # # # # # #
     # Initialize
     # # # # # # # # # # # # # # # # # # # # # # # # #
 
-    def __init__(self, variables, values, dont_cares=None, *, is_maxterm=False):
+    def __init__(self, variables, values, dont_cares=None, *, is_maxterm=False, time_budget=None, backend="python",
+                 is_cancelled=None):
+        if backend not in ["python", "numpy"]:
+            raise ValueError("The backend must be either \"python\" or \"numpy\"")
         if dont_cares is None:
-            dont_cares = []
+            dont_cares = 0
+
+        # The don't-cares are kept as a packed bitmask and are never put into the groups.
+        #   Instead, a term is combined with a cube made of only don't-cares when the cube is not in the groups
+        if not isinstance(dont_cares, int):
+            vector = 0
+            for value in dont_cares:
+                vector |= 1 << value
+            dont_cares = vector
         self._variables = variables
         self._values = values
         self._dont_cares = dont_cares
-        self._all_values = values + dont_cares
+        self._dont_care_cubes = OrderedDict()
+        self._dont_care_limit = max(1, QM.DONT_CARE_BYTES // max(1, (1 << len(variables)) >> 3))
         self._is_maxterm = is_maxterm
+        self._time_budget = time_budget
+        self._backend = backend
+        self._is_cancelled = is_cancelled
+        self._optimal = True
+        self._timings = {}
+        self._counts = {"minterms": len(values), "dont_cares": bin(dont_cares).count("1"), "combined": 0}
 
-        self._function = self.__get_function()
-
-    # # # # # # # # # # # # # # # # # # # # # # # # #
-    # Helper Methods
-    # # # # # # # # # # # # # # # # # # # # # # # # #
-
-    def __get_bits(self, value) -> str:
-        """Returns the binary digit for the specified value.
-
-        :param value: The integer to get the binary digits of
-        :type value: int
-        """
-
-        # Pad the result with extra 0's at the beginning to match how many variables
-        # there are being used
-        return bin(value)[2:].rjust(len(self._variables), "0")
+        self._prime_implicants = self.__solve()
+        self._function = QM.format_function(variables, self._prime_implicants, is_maxterm)
 
     # # # # # # # # # # # # # # # # # # # # # # # # #
     # Grouping Methods
@@ -139,72 +203,49 @@ class QM:
         """Creates the initial grouping for the bits from the values
         given to the Quine-McCluskey Algorithm
 
-        :return: A 2-dimensional list of groups in the Quine-McCluskey algorithm
-                 grouped by the amount of 1's bits in each integer value
+        :return: A list of groups in the Quine-McCluskey algorithm
+                 grouped by the amount of 1's bits in each integer value.
+                 Each group is a dict of minterms keyed by their bits and mask
         """
 
-        # Keep track of groups by 2-dimensional list
+        # Keep track of groups by a list of dicts
         groups = []
         for count in range(len(self._variables) + 1):
-            groups.append([])
+            groups.append({})
 
         # Iterate through values
-        for value in self._all_values:
+        for value in self._values:
             # Count number of 1's in value's bit equivalent
-            count = self.__get_bits(value).count("1")
+            count = bin(value).count("1")
 
             # Add count to proper group
-            groups[count].append(Minterm([value], self.__get_bits(value)))
+            groups[count][(value, 0)] = Minterm(value, 0, len(self._variables))
 
         return groups
 
-    @staticmethod
-    def __power_set(values, prime_implicants):
-        """Creates a power set of all valid prime implicants that covers
-        the rest of an expression. This is used after the essential prime implicants have been found.
-
-        :param values: The integer values that have already been evaluated
-        :param prime_implicants: The list of prime implicants (minterms) that are necessary to evaluate the expression
+    def __get_dont_care_cubes(self, mask) -> int:
+        """Returns a packed bitmask where bit ``b`` is whether or not every value of the cube
+        with the bits ``b`` and the specified mask is a don't-care
 
-        :type values: list[int]
-        :type prime_implicants: list[Minterm]
+        :param mask: The don't-care bits of the cubes
+        :type mask: int
         """
-
-        # Get the power set of all the prime_implicants
-        prime_implicants = list(prime_implicants)
-        power_set = []
-
-        # Iterate through decimal values from 1 to 2 ** size - 1
-        for i in range(1, 2 ** len(prime_implicants)):
-            current_set = []
-
-            # Get the binary value of the decimal value
-            bin_value = bin(i)[2:].rjust(len(prime_implicants), "0")
-
-            # Find which indexes have 1 in the bin_value string
-            for index in range(len(bin_value)):
-                if bin_value[index] == "1":
-                    current_set.append(prime_implicants[index])
-            power_set.append(current_set)
-
-        # Remove all subsets that do not cover the rest of the implicants
-        min_set = power_set[0]
-        for subset in power_set:
-
-            # Get all the values the set covers
-            temp_values = []
-            for implicant in subset:
-                for value in implicant.get_values():
-                    if value not in temp_values and value in values:
-                        temp_values.append(value)
-            temp_values.sort()
-
-            # Check if this subset covers the rest of the values
-            if temp_values == values:
-                if len(subset) < len(min_set):
-                    min_set = subset
-
-        return min_set
+        if mask == 0:
+            return self._dont_cares
+
+        cubes = self._dont_care_cubes.get(mask)
+        if cubes is not None:
+            self._dont_care_cubes.move_to_end(mask)
+            return cubes
+
+        # A cube is only don't-cares when both of its halves are only don't-cares
+        bit = mask & -mask
+        halves = self.__get_dont_care_cubes(mask ^ bit)
+        cubes = halves & (halves >> bit)
+        self._dont_care_cubes[mask] = cubes
+        if len(self._dont_care_cubes) > self._dont_care_limit:
+            self._dont_care_cubes.popitem(last=False)
+        return cubes
 
     # # # # # # # # # # # # # # # # # # # # # # # # #
     # Compare Methods
@@ -223,48 +264,166 @@ class QM:
         if groups is None:
             groups = self.__initial_group()
 
+        if self._is_cancelled is not None and self._is_cancelled():
+            raise Cancelled()
+
         # If there is only 1 group, return all the minterms in it
         if len(groups) == 1:
-            return groups[0]
+            return list(groups[0].values())
 
         # Try comparing the rest
         else:
-            unused = []
+            # Keep track of the unused minterms in a dict which is used as an ordered set
+            unused = {}
             comparisons = range(len(groups) - 1)
-            new_groups = [[] for _ in comparisons]
+            new_groups = [{} for _ in comparisons]
+            full = (1 << len(self._variables)) - 1
+            combined = 0
 
             for compare in comparisons:
                 group1 = groups[compare]
                 group2 = groups[compare + 1]
 
-                # Compare every term in group1 with every term in group2
-                for term1 in group1:
-                    for term2 in group2:
-
-                        # Try combining it
+                # A term in group1 can only be combined with a term in group2 that has
+                #   the same don't-cares and one more 1 bit, so look up each of those terms
+                #   instead of comparing every term in group1 with every term in group2
+                for term1 in group1.values():
+                    zeros = full & ~(term1.get_bits() | term1.get_mask())
+                    while zeros:
+                        bit = zeros & -zeros
+                        zeros ^= bit
+
+                        term2 = group2.get((term1.get_bits() | bit, term1.get_mask()))
+                        if term2 is None:
+
+                            # The term can still be combined with a cube made of only don't-cares
+                            if self._dont_cares and \
+                                    self.__get_dont_care_cubes(term1.get_mask()) >> (term1.get_bits() | bit) & 1:
+                                combined += 1
+                                term1.use()
+                                new_groups[compare].setdefault(
+                                    (term1.get_bits(), term1.get_mask() | bit),
+                                    Minterm(term1.get_bits(), term1.get_mask() | bit, len(self._variables))
+                                )
+                            continue
+
+                        # Combine the terms and only add term3 to the new group
+                        #   if it is not in the new group yet
                         term3 = term1.combine(term2)
-
-                        # Only add it to the new group if term3 is not None
-                        #   term3 will only be None if term1 and term2 could not
-                        #   be combined
-                        if term3 is not None:
-                            term1.use()
+                        combined += 1
+                        term1.use()
+                        term2.use()
+                        new_groups[compare].setdefault((term3.get_bits(), term3.get_mask()), term3)
+
+                # A term in group2 can also be combined with a cube made of only don't-cares
+                #   that has one less 1 bit which is never in group1
+                if self._dont_cares:
+                    for term2 in group2.values():
+                        ones = term2.get_bits()
+                        while ones:
+                            bit = ones & -ones
+                            ones ^= bit
+
+                            bits = term2.get_bits() ^ bit
+                            if (bits, term2.get_mask()) in group1 or \
+                                    not self.__get_dont_care_cubes(term2.get_mask()) >> bits & 1:
+                                continue
+                            combined += 1
                             term2.use()
-                            if term3 not in new_groups[compare]:
-                                new_groups[compare].append(term3)
+                            new_groups[compare].setdefault(
+                                (bits, term2.get_mask() | bit),
+                                Minterm(bits, term2.get_mask() | bit, len(self._variables))
+                            )
+
+            self._counts["combined"] += combined
 
             # Get list of all unused minterms
             for group in groups:
-                for term in group:
-                    if not term.used() and term not in unused:
-                        unused.append(term)
+                for term in group.values():
+                    if not term.used():
+                        unused[term] = None
 
             # Add recursive call
             for term in self.__get_prime_implicants(new_groups):
-                if not term.used() and term not in unused:
-                    unused.append(term)
+                if not term.used():
+                    unused[term] = None
+
+            return list(unused)
+
+    def __get_prime_implicants_numpy(self) -> list:
+        """Gets the prime implicants for the expression by combining every term of a round at once.
+        Each term is kept as a single integer key of its mask followed by its bits in a sorted array,
+        so the term that a term can be combined with, which has the same mask and one more 1 bit,
+        is found for every term and every bit at once with a binary search.
 
-            return unused
+        Unlike ``__get_prime_implicants``, the don't-cares are put into the terms, so each term also keeps
+        whether or not it has a value, and a term made of only don't-cares is never a prime implicant
+
+        :rtype: list[Minterm]
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("The \"numpy\" backend needs NumPy which can be installed with pip install numpy")
+
+        # The mask and the bits of a term must both fit in one key
+        size = len(self._variables)
+        if size > 32:
+            raise ValueError("The \"numpy\" backend can only be used with at most 32 variables")
+        full = (1 << size) - 1
+        flips = np.array([1 << (size - 1 - i) for i in range(size)], dtype=np.uint64)
+
+        # Start with every value and don't-care as a term with no mask
+        dont_cares = TruthTable(self._variables, self._dont_cares & ~self.__get_vector()).get_minterms()
+        keys = np.array(list(self._values) + dont_cares, dtype=np.uint64)
+        has_values = np.arange(len(keys)) < len(self._values)
+        keys, has_values = _unique(np, keys, has_values)
+
+        prime_implicants = []
+        while len(keys) > 0:
+            if self._is_cancelled is not None and self._is_cancelled():
+                raise Cancelled()
+            bits = keys & np.uint64(full)
+            masks = keys >> np.uint64(size)
+            free = ~(bits | masks) & np.uint64(full)
+            used = np.zeros(len(keys), dtype=bool)
+            combined_keys, combined_values = [], []
+
+            # Look up the term with each free bit set for a chunk of terms at once so that it fits in memory
+            rows = max(1, QM.CHUNK_TERMS // max(1, size))
+            for start in range(0, len(keys), rows):
+                chunk = np.arange(start, min(start + rows, len(keys)))
+                terms, positions = np.nonzero(free[chunk, None] & flips[None, :])
+                terms = chunk[terms]
+                partners = keys[terms] | flips[positions]
+                found = np.searchsorted(keys, partners)
+                found[found == len(keys)] = 0
+                matched = keys[found] == partners
+
+                first = terms[matched]
+                second = found[matched]
+                used[first] = True
+                used[second] = True
+                combined_keys.append(keys[first] | (flips[positions[matched]] << np.uint64(size)))
+                combined_values.append(has_values[first] | has_values[second])
+
+            # A term that was never combined is a prime implicant when it has a value
+            for i in np.flatnonzero(~used & has_values):
+                prime_implicants.append(Minterm(int(bits[i]), int(masks[i]), size))
+
+            keys = np.concatenate(combined_keys)
+            has_values = np.concatenate(combined_values)
+            self._counts["combined"] += len(keys)
+            keys, has_values = _unique(np, keys, has_values)
+
+        return prime_implicants
+
+    def __get_vector(self) -> int:
+        """Returns the values as a packed bitmask where bit ``r`` is whether or not ``r`` is a value"""
+        vector = 0
+        for value in self._values:
+            vector |= 1 << value
+        return vector
 
     # # # # # # # # # # # # # # # # # # # # # # # # #
     # Solving Methods
@@ -278,27 +437,51 @@ class QM:
         """
 
         # Get the prime implicants
-        prime_implicants = self.__get_prime_implicants(self.__initial_group())
+        #   The time of each stage is kept so that the stages can be measured separately
+        start = time.perf_counter()
+        if self._backend == "numpy":
+            prime_implicants = self.__get_prime_implicants_numpy()
+        else:
+            prime_implicants = self.__get_prime_implicants(self.__initial_group())
+            self._dont_care_cubes.clear()
+        self._timings["prime_implicants"] = time.perf_counter() - start
+        self._counts["prime_implicants"] = len(prime_implicants)
+        start = time.perf_counter()
+        chosen = self.__choose(prime_implicants)
+        self._timings["cover"] = time.perf_counter() - start
+        return chosen
+
+    def __choose(self, prime_implicants) -> list:
+        """Chooses the essential prime implicants and the fewest other prime implicants
+        that cover every value
+
+        :param prime_implicants: Every prime implicant of the values
+        :type prime_implicants: list[Minterm]
+
+        :rtype: list[Minterm]
+        """
+
+        # Keep track of which prime implicants cover each value
+        indices = {self._values[i]: i for i in range(len(self._values))}
+        covering = [[] for _ in self._values]
+        for minterm in prime_implicants:
+            for value in minterm.get_values():
+                if value in indices:
+                    covering[indices[value]].append(minterm)
 
         # Keep track of values with only 1 implicant
         #   These are the essential prime implicants
-        essential_prime_implicants = []
+        essential_prime_implicants = {}
         values_used = [False] * len(self._values)
 
         for i in range(len(self._values)):
-            value = self._values[i]
-
-            uses = 0
-            last = None
-            for minterm in prime_implicants:
-                if value in minterm.get_values():
-                    uses += 1
-                    last = minterm
-            if uses == 1 and last not in essential_prime_implicants:
+            if len(covering[i]) == 1 and covering[i][0] not in essential_prime_implicants:
+                last = covering[i][0]
                 for v in last.get_values():
-                    if v not in self._dont_cares:
-                        values_used[self._values.index(v)] = True
-                essential_prime_implicants.append(last)
+                    if v in indices:
+                        values_used[indices[v]] = True
+                essential_prime_implicants[last] = None
+        essential_prime_implicants = list(essential_prime_implicants)
 
         # Check if all values were used
         if values_used.count(False) == 0:
@@ -306,40 +489,83 @@ class QM:
 
         # Keep track of prime implicants that cover as many values as possible
         #   with as few variables as possible
+        #   Note that every prime implicant covers at least one value since the don't-cares are never grouped
+        essential = set(essential_prime_implicants)
         prime_implicants = [
             prime_implicant
             for prime_implicant in prime_implicants
-            if (
-                    prime_implicant not in essential_prime_implicants and
-                    len([value for value in prime_implicant.get_values() if value not in self._dont_cares]) > 0
-            )
+            if prime_implicant not in essential
         ]
 
         # Check if there is only one implicant left (very rare but just in case)
         if len(prime_implicants) == 1:
             return essential_prime_implicants + prime_implicants
 
-        # Create a power set from the remaining prime implicants and check which
-        #   combination of prime implicants gets the simplest form
-        return essential_prime_implicants + self.__power_set([
+        # Find the fewest prime implicants, with the fewest variables, that cover the rest of the values
+        return essential_prime_implicants + self.__cover([
             self._values[index]
             for index in range(len(self._values))
             if not values_used[index]
         ], prime_implicants)
 
-    def __get_function(self) -> str:
-        """Returns the expression in readable form."""
+    def __cover(self, values, prime_implicants) -> list:
+        """Chooses the fewest prime implicants that cover the rest of an expression.
+        This is used after the essential prime implicants have been found.
+        When two covers have the same amount of prime implicants, the cover with fewer variables is chosen
+
+        :param values: The integer values that are not covered by the essential prime implicants
+        :param prime_implicants: The prime implicants that can be used to cover the values
+
+        :type values: list[int]
+        :type prime_implicants: list[Minterm]
+
+        :rtype: list[Minterm]
+        """
+
+        # Create a covering table where bit i of each column is whether
+        #   or not the prime implicant covers values[i]
+        indices = {values[i]: i for i in range(len(values))}
+        columns = [0] * len(prime_implicants)
+        for j in range(len(prime_implicants)):
+            for value in prime_implicants[j].get_values():
+                if value in indices:
+                    columns[j] |= 1 << indices[value]
+
+        # Each prime implicant costs more than all the variables of every prime implicant
+        #   so that the amount of prime implicants is always minimized first
+        weight = len(self._variables) * len(prime_implicants) + 1
+        costs = [
+            weight + len(self._variables) - bin(prime_implicant.get_mask()).count("1")
+            for prime_implicant in prime_implicants
+        ]
 
-        # Get the prime implicants and variables
-        prime_implicants = self.__solve()
+        cover = SetCover(columns, costs, self._time_budget, self._is_cancelled)
+        self._optimal = cover.is_optimal()
+        self._counts["cover_columns"] = len(columns)
+        self._counts["cover_nodes"] = cover.get_nodes()
+        return [prime_implicants[j] for j in cover.get_solution()]
 
-        # Check if there are no prime_implicants; Always False
+    @staticmethod
+    def format_function(variables, prime_implicants, is_maxterm=False) -> str:
+        """Returns the expression of a list of prime implicants in readable form.
+        For example, ``(a AND NOT b) OR (c)`` for a minterm or ``(a OR NOT b) AND (c)`` for a maxterm
+
+        :param variables: A list of variables (as strings) that the prime implicants are made of
+        :param prime_implicants: The prime implicants that make up the expression
+        :param is_maxterm: Whether or not the prime implicants are maxterms
+
+        :type variables: list
+        :type prime_implicants: list[Minterm]
+        :type is_maxterm: bool
+        """
+
+        # Check if there are no prime_implicants; Always False (or Always True for a maxterm)
         if len(prime_implicants) == 0:
-            return "0"
+            return "1" if is_maxterm else "0"
 
         if len(prime_implicants) == 1:
-            if prime_implicants[0].get_value().count("-") == len(self._variables):
-                return "1"
+            if prime_implicants[0].get_value().count("-") == len(variables):
+                return "0" if is_maxterm else "1"
 
         result = ""
 
@@ -348,29 +574,268 @@ class QM:
             implicant = prime_implicants[j]
 
             # Add parentheses if necessary
-            if implicant.get_value().count("-") < len(self._variables):
+            if implicant.get_value().count("-") < len(variables):
                 result += "("
 
             # Iterate through all bits in the implicants value
             for i in range(len(implicant.get_value())):
-                if implicant.get_value()[i] == ("0" if not self._is_maxterm else "1"):
+                if implicant.get_value()[i] == ("0" if not is_maxterm else "1"):
                     result += "NOT "
                 if implicant.get_value()[i] != "-":
-                    result += self._variables[i]
+                    result += variables[i]
                 if implicant.get_value().count("-", i + 1) < len(implicant.get_value()) - i - 1 and \
                         implicant.get_value()[i] != "-":
-                    result += " AND " if not self._is_maxterm else " OR "
+                    result += " AND " if not is_maxterm else " OR "
 
             # Add parentheses if necessary
-            if implicant.get_value().count("-") < len(self._variables):
+            if implicant.get_value().count("-") < len(variables):
                 result += ")"
 
             # Combine all minterm expressions with an OR operator
             if j < len(prime_implicants) - 1:
-                result += " OR " if not self._is_maxterm else " AND "
+                result += " OR " if not is_maxterm else " AND "
 
         return result
 
     def get_function(self) -> str:
         """Returns the function solved by the Quine-McCluskey Algorithm"""
         return self._function
+
+    def get_prime_implicants(self) -> list:
+        """Returns the prime implicants, as Minterm objects, that make up the function
+        in the same order as they appear in the function
+        """
+        return self._prime_implicants
+
+    def get_timings(self) -> dict:
+        """Returns the seconds that generating the prime implicants ("prime_implicants")
+        and choosing the prime implicants that cover every value ("cover") took
+        """
+        return self._timings
+
+    def get_counts(self) -> dict:
+        """Returns the amount of values ("minterms") and don't-cares ("dont_cares"),
+        pairs of minterms that were combined ("combined"), and prime implicants ("prime_implicants").
+        When the set cover search was needed, the amount of prime implicants it chose from ("cover_columns")
+        and branches it visited ("cover_nodes") are also included
+        """
+        return self._counts
+
+    def is_optimal(self) -> bool:
+        """Returns whether or not the function is proven to have the fewest prime implicants.
+        This is only False when the time budget ran out and a greedy choice of prime implicants was used
+        """
+        return self._optimal
+
+
+class MultiQM:
+    """A class to handle processing the multiple-output Quine-McCluskey Algorithm.
+    Several functions of the same variables are simplified together so that a product term
+    which is needed by more than one function is only found once and can be shared.
+
+    Every term is tagged with the outputs it is an implicant of as a bitmask where bit ``o``
+    is output ``o``. Two terms are combined when their tags have an output in common,
+    and a term is a prime implicant unless it can be combined into a larger term with the same tag.
+
+    :param variables: A list of variables (as strings), in alphabetical order, that the functions have
+    :param vectors: The truth table of each function as a packed bitmask where bit ``r``
+        is whether or not the function is true at row ``r``
+    :param time_budget: The amount of seconds that choosing the prime implicants may take
+        before a greedy choice is used. By default, there is no limit
+
+    :type variables: list
+    :type vectors: list[int]
+    :type time_budget: float
+    """
+
+    def __init__(self, variables, vectors, *, time_budget=None):
+        self._variables = variables
+        self._vectors = vectors
+        self._time_budget = time_budget
+        self._optimal = True
+        self._timings = {}
+        self._counts = {"outputs": len(vectors), "combined": 0}
+
+        start = time.perf_counter()
+        prime_implicants = self.__get_prime_implicants()
+        self._timings["prime_implicants"] = time.perf_counter() - start
+        self._counts["prime_implicants"] = len(prime_implicants)
+
+        start = time.perf_counter()
+        self._cover = self.__choose(prime_implicants)
+        self._timings["cover"] = time.perf_counter() - start
+
+        # Each output only uses the terms of the cover that it needs
+        self._outputs = [self.__irredundant(output) for output in range(len(vectors))]
+        self._functions = [QM.format_function(variables, implicants) for implicants in self._outputs]
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Compare Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __get_prime_implicants(self) -> list:
+        """Gets the multiple-output prime implicants of every function
+
+        :return: A list of tuples containing the bits, the mask, and the tag of each prime implicant
+        :rtype: list[tuple]
+        """
+
+        # Tag each row with every output that is true at the row
+        tags = {}
+        for output in range(len(self._vectors)):
+            for row in TruthTable(self._variables, self._vectors[output]).get_minterms():
+                tags[row] = tags.get(row, 0) | 1 << output
+
+        # Each group is a dict of tags keyed by the bits and mask of the term
+        #   where the terms are grouped by the amount of 1's bits
+        groups = [{} for _ in range(len(self._variables) + 1)]
+        for row, tag in tags.items():
+            groups[bin(row).count("1")][(row, 0)] = tag
+
+        full = (1 << len(self._variables)) - 1
+        prime_implicants = []
+        while len(groups) > 0:
+            new_groups = [{} for _ in range(len(groups) - 1)]
+            used = set()
+            for compare in range(len(groups) - 1):
+                group1 = groups[compare]
+                group2 = groups[compare + 1]
+                for (bits, mask), tag1 in group1.items():
+                    zeros = full & ~(bits | mask)
+                    while zeros:
+                        bit = zeros & -zeros
+                        zeros ^= bit
+
+                        tag2 = group2.get((bits | bit, mask))
+                        if tag2 is None or tag1 & tag2 == 0:
+                            continue
+
+                        # A term is only covered by the combined term if it keeps every output of the term
+                        tag = tag1 & tag2
+                        self._counts["combined"] += 1
+                        if tag == tag1:
+                            used.add((bits, mask))
+                        if tag == tag2:
+                            used.add((bits | bit, mask))
+                        new_groups[compare][(bits, mask | bit)] = tag
+
+            for group in groups:
+                for key, tag in group.items():
+                    if key not in used:
+                        prime_implicants.append((key[0], key[1], tag))
+            groups = new_groups
+
+        return prime_implicants
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Solving Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __choose(self, prime_implicants) -> list:
+        """Chooses the fewest prime implicants, with the fewest variables, that cover every output.
+        A prime implicant that is shared by several outputs is only counted once
+
+        :param prime_implicants: The prime implicants as (bits, mask, tag) tuples
+        :type prime_implicants: list[tuple]
+
+        :return: The chosen prime implicants as (bits, mask, tag) tuples
+        :rtype: list[tuple]
+        """
+
+        # Every true row of every output is an element of the covering table
+        indices = {}
+        for output in range(len(self._vectors)):
+            for row in TruthTable(self._variables, self._vectors[output]).get_minterms():
+                indices[(output, row)] = len(indices)
+
+        size = len(self._variables)
+        columns = [0] * len(prime_implicants)
+        for j in range(len(prime_implicants)):
+            bits, mask, tag = prime_implicants[j]
+            for value in Minterm(bits, mask, size).get_values():
+                for output in range(len(self._vectors)):
+                    if tag >> output & 1:
+                        columns[j] |= 1 << indices[(output, value)]
+
+        # Each prime implicant costs more than all the variables of every prime implicant
+        #   so that the amount of prime implicants is always minimized first
+        weight = size * len(prime_implicants) + 1
+        costs = [weight + size - bin(mask).count("1") for _, mask, _ in prime_implicants]
+
+        cover = SetCover(columns, costs, self._time_budget)
+        self._optimal = cover.is_optimal()
+        self._counts["cover_columns"] = len(columns)
+        self._counts["cover_nodes"] = cover.get_nodes()
+        return [prime_implicants[j] for j in cover.get_solution()]
+
+    def __irredundant(self, output) -> list:
+        """Returns the prime implicants of the cover that an output needs.
+        A prime implicant of the cover may be an implicant of an output that is already covered
+        by the other prime implicants of the cover, so it is left out of that output
+
+        :param output: The index of the output
+        :type output: int
+
+        :rtype: list[Minterm]
+        """
+        size = len(self._variables)
+        implicants = [
+            Minterm(bits, mask, size)
+            for bits, mask, tag in self._cover
+            if tag >> output & 1
+        ]
+
+        # Remove the implicants with the most variables first
+        for implicant in sorted(implicants, key=lambda minterm: bin(minterm.get_mask()).count("1")):
+            others = [other for other in implicants if other is not implicant]
+            if all(any(other.covers(value) for other in others) for value in implicant.get_values()):
+                implicants.remove(implicant)
+        return implicants
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Getters
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def get_functions(self) -> list:
+        """Returns the function of each output solved by the multiple-output Quine-McCluskey Algorithm"""
+        return self._functions
+
+    def get_prime_implicants(self) -> list:
+        """Returns the prime implicants, as Minterm objects, that make up the function of each output"""
+        return self._outputs
+
+    def get_cover(self) -> list:
+        """Returns the shared cover as a list of tuples containing each prime implicant, as a Minterm object,
+        and the indices of the outputs that use it
+        """
+        size = len(self._variables)
+        cover = []
+        for bits, mask, _ in self._cover:
+            outputs = [
+                output
+                for output in range(len(self._outputs))
+                if any(
+                    implicant.get_bits() == bits and implicant.get_mask() == mask
+                    for implicant in self._outputs[output]
+                )
+            ]
+            if len(outputs) > 0:
+                cover.append((Minterm(bits, mask, size), outputs))
+        return cover
+
+    def get_timings(self) -> dict:
+        """Returns the seconds that generating the prime implicants ("prime_implicants")
+        and choosing the prime implicants that cover every output ("cover") took
+        """
+        return self._timings
+
+    def get_counts(self) -> dict:
+        """Returns the amount of outputs ("outputs"), pairs of terms that were combined ("combined"),
+        prime implicants ("prime_implicants"), prime implicants the set cover chose from ("cover_columns"),
+        and branches the set cover search visited ("cover_nodes")
+        """
+        return self._counts
+
+    def is_optimal(self) -> bool:
+        """Returns whether or not the shared cover is proven to have the fewest prime implicants"""
+        return self._optimal
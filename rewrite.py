@@ -0,0 +1,432 @@
+from expression import Expression
+from variable import Variable
+
+
+class Rewriter:
+    """A Rewriter reduces a boolean expression with algebraic rules before its truth table is enumerated.
+
+    The expression is rewritten into n-ary AND and OR nodes where a NOT is pushed down to the variables
+    and the following rules are applied to every node:
+        - Constant folding: ``x AND 0 = 0``, ``x OR 0 = x``, ``x XOR 1 = NOT x``
+        - Double negation: ``NOT NOT x = x``
+        - Idempotence: ``x AND x = x``
+        - Absorption: ``x AND (x OR y) = x`` and ``x OR (x AND y) = x``
+        - Complements: ``x AND NOT x = 0``, ``x OR NOT x = 1`` and ``x XOR NOT x = 1``
+        - Flattening: ``(x AND y) AND z = AND(x, y, z)``
+
+    Every node is stored once in a unique table and is referred to by its index, so a node is
+    never compared or hashed by walking its children. Node 0 is always false and node 1 is always true.
+
+    An AND or an OR node is a tuple of its operator, its children in order, and the set of its children.
+
+    :param root: The root of the expression to reduce
+    :param assignments: The value to set some variables to, which gives the cofactor of the expression.
+        By default, no variable is set
+    :type root: Expression or Variable
+    :type assignments: dict[str, bool]
+    """
+
+    FALSE = 0
+    TRUE = 1
+
+    def __init__(self, root, assignments: dict = None):
+        self._assignments = assignments or {}
+
+        # The children of an AND, an OR, or an XOR are kept in order to rebuild the expression
+        #   but the key of the node is the set of its children since the operators are commutative
+        self._nodes = [("CONST", False), ("CONST", True)]
+        self._unique = {self._nodes[0]: 0, self._nodes[1]: 1}
+
+        # The NOT of every node that has been negated so far
+        self._negations = {0: 1, 1: 0}
+        self._root = self.__rewrite(root)
+
+        # The variables and the rebuilt expression of every node that has been asked for
+        self._supports = {}
+        self._roots = {}
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Node Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __node(self, node, key=None) -> int:
+        """Returns the index of a node, adding it to the unique table if it is not in it yet
+
+        :param node: The node as a tuple of its kind and its children
+        :param key: The key of the node in the unique table. By default, the node itself is the key
+
+        :type node: tuple
+        :type key: tuple
+        """
+        if key is None:
+            key = node
+        index = self._unique.get(key)
+        if index is None:
+            index = len(self._nodes)
+            self._nodes.append(node)
+            self._unique[key] = index
+        return index
+
+    def __literal(self, value, has_not) -> int:
+        """Returns the index of a variable or the NOT of a variable
+
+        :param value: The variable
+        :param has_not: Whether or not the variable is negated
+
+        :type value: str
+        :type has_not: bool
+        """
+        index = self.__node(("VAR", value, has_not))
+        self._negations[index] = self.__node(("VAR", value, not has_not))
+        self._negations[self._negations[index]] = index
+        return index
+
+    def __negate(self, index) -> int:
+        """Returns the index of the NOT of a node where the NOT is pushed down to the variables.
+        Note that the NOT of an AND is the OR of the NOT of each child (and vice versa)
+        and the NOT of an XOR is the XOR with the NOT of one side
+
+        :param index: The index of the node to negate
+        :type index: int
+        """
+
+        # Negate the nodes in post-order without recursion so that very deep expressions can be reduced
+        stack = [index]
+        while len(stack) > 0:
+            current = stack[-1]
+            if current in self._negations:
+                stack.pop()
+                continue
+
+            node = self._nodes[current]
+            children = [node[2]] if node[0] == "XOR" else list(node[1])
+            needed = [child for child in children if child not in self._negations]
+            if len(needed) > 0:
+                stack.extend(needed)
+                continue
+
+            if node[0] == "XOR":
+                negation = self.__xor(node[1], self._negations[node[2]])
+            elif node[0] == "AND":
+                negation = self.__or([self._negations[child] for child in node[1]])
+            else:
+                negation = self.__and([self._negations[child] for child in node[1]])
+            self._negations[current] = negation
+            self._negations[negation] = current
+            stack.pop()
+
+        return self._negations[index]
+
+    def __and(self, children) -> int:
+        """Returns the index of the AND of nodes after applying every rule
+
+        :param children: The indices of the nodes
+        :type children: list[int]
+        """
+        return self.__join("AND", "OR", Rewriter.FALSE, Rewriter.TRUE, children)
+
+    def __or(self, children) -> int:
+        """Returns the index of the OR of nodes after applying every rule
+
+        :param children: The indices of the nodes
+        :type children: list[int]
+        """
+        return self.__join("OR", "AND", Rewriter.TRUE, Rewriter.FALSE, children)
+
+    def __join(self, kind, dual, absorbing, identity, children) -> int:
+        """Returns the index of the AND or OR of nodes after applying every rule
+
+        :param kind: The operator of the node which is either "AND" or "OR"
+        :param dual: The other operator which is either "OR" or "AND"
+        :param absorbing: The constant that makes the node that constant (0 for AND, 1 for OR)
+        :param identity: The constant that is removed from the node (1 for AND, 0 for OR)
+        :param children: The indices of the nodes to join
+
+        :type kind: str
+        :type dual: str
+        :type absorbing: int
+        :type identity: int
+        :type children: list[int]
+        """
+
+        # Flatten the children of the same operator and remove the identity and any duplicates
+        #   by keeping the children in a dict which is used as an ordered set
+        flat = {}
+        for child in children:
+            node = self._nodes[child]
+            if node[0] == kind:
+                for grandchild in node[1]:
+                    flat[grandchild] = None
+            elif child != identity:
+                flat[child] = None
+
+        # A child and its NOT make the whole node the absorbing constant
+        if absorbing in flat:
+            return absorbing
+        for child in flat:
+            if self._negations.get(child) in flat:
+                return absorbing
+
+        # A child of the other operator that has a child of this node, or every child of another child
+        #   of the other operator, is absorbed by it. For example, ``(x AND y) OR (x AND y AND z) = x AND y``
+        absorbed = set(
+            child
+            for child in flat
+            if self._nodes[child][0] == dual and any(grandchild in flat for grandchild in self._nodes[child][1])
+        )
+
+        # The children of the other operator are checked from the smallest to the largest against an index of the
+        #   kept ones by each of their children so that only the children that share a child are ever compared.
+        #   A kept child is a subset when every one of its children is counted
+        containing = {}
+        duals = [child for child in flat if self._nodes[child][0] == dual and child not in absorbed]
+        for child in sorted(duals, key=lambda dual_child: len(self._nodes[dual_child][2])):
+            counts = {}
+            for grandchild in self._nodes[child][2]:
+                for other in containing.get(grandchild, []):
+                    counts[other] = counts.get(other, 0) + 1
+            if any(count == len(self._nodes[other][2]) for other, count in counts.items()):
+                absorbed.add(child)
+                continue
+            for grandchild in self._nodes[child][2]:
+                containing.setdefault(grandchild, []).append(child)
+        flat = [child for child in flat if child not in absorbed]
+
+        if len(flat) == 0:
+            return identity
+        if len(flat) == 1:
+            return flat[0]
+        children = frozenset(flat)
+        return self.__node((kind, tuple(flat), children), (kind, children))
+
+    def __xor(self, left, right) -> int:
+        """Returns the index of the XOR of two nodes after applying every rule
+
+        :param left: The index of the left node
+        :param right: The index of the right node
+
+        :type left: int
+        :type right: int
+        """
+        if left == right:
+            return Rewriter.FALSE
+        if self._negations.get(left) == right:
+            return Rewriter.TRUE
+        for constant, other in [(left, right), (right, left)]:
+            if constant == Rewriter.FALSE:
+                return other
+            if constant == Rewriter.TRUE:
+                return self.__negate(other)
+        return self.__node(("XOR", left, right), ("XOR", frozenset([left, right])))
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Conversion Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @staticmethod
+    def __get_chain(node) -> list:
+        """Returns the operands of the longest chain of an AND or an OR, from left to right,
+        so that a chain like ``a OR b OR c OR ...`` is joined once instead of once for every operator
+
+        :param node: The AND, NAND, OR, or NOR at the top of the chain
+        :type node: Expression
+
+        :rtype: list[Expression or Variable]
+        """
+        operators = ["AND", "NAND"] if node.get_operator() in ["AND", "NAND"] else ["OR", "NOR"]
+        operands = []
+        stack = [node.get_right(), node.get_left()]
+        while len(stack) > 0:
+            current = stack.pop()
+            if isinstance(current, Expression) and current.get_operator() in operators and not current.has_not:
+                stack.append(current.get_right())
+                stack.append(current.get_left())
+            else:
+                operands.append(current)
+        return operands
+
+    def __rewrite(self, root) -> int:
+        """Rewrites an expression into the nodes of this Rewriter
+
+        :param root: The root of the expression to rewrite
+        :type root: Expression or Variable
+
+        :return: The index of the root node
+        :rtype: int
+        """
+
+        # Walk the expression in post-order without recursion so that
+        #   very deep expressions can still be reduced
+        indices = {}
+        chains = {}
+        stack = [(root, False)]
+        while len(stack) > 0:
+            node, visited = stack.pop()
+            if id(node) in indices:
+                continue
+
+            # A variable that is set is replaced with its value, or the NOT of its value
+            if not isinstance(node, Expression):
+                value = self._assignments.get(node.get_value())
+                if value is None:
+                    indices[id(node)] = self.__literal(node.get_value(), node.has_not())
+                else:
+                    indices[id(node)] = Rewriter.TRUE if value != node.has_not() else Rewriter.FALSE
+
+            elif visited:
+
+                # A NAND, a NOR, or an XNOR is the NOT of an AND, an OR, or an XOR
+                #   which is already held by has_not
+                operator = node.get_operator()
+                if operator in ["AND", "NAND"]:
+                    index = self.__and([indices[id(operand)] for operand in chains.pop(id(node))])
+                elif operator in ["OR", "NOR"]:
+                    index = self.__or([indices[id(operand)] for operand in chains.pop(id(node))])
+                else:
+                    index = self.__xor(indices[id(node.get_left())], indices[id(node.get_right())])
+                indices[id(node)] = self.__negate(index) if node.has_not else index
+
+            else:
+                stack.append((node, True))
+                if node.get_operator() in ["XOR", "XNOR"]:
+                    stack.append((node.get_right(), False))
+                    stack.append((node.get_left(), False))
+                else:
+                    chains[id(node)] = Rewriter.__get_chain(node)
+                    stack.extend((operand, False) for operand in reversed(chains[id(node)]))
+
+        return indices[id(root)]
+
+    def get_constant(self):
+        """Returns True or False if the expression is always true or always false, or None otherwise"""
+        if self._root in [Rewriter.FALSE, Rewriter.TRUE]:
+            return self._root == Rewriter.TRUE
+        return None
+
+    def __get_support(self, index) -> frozenset:
+        """Returns the variables of a node
+
+        :param index: The index of the node
+        :type index: int
+        """
+        stack = [index]
+        while len(stack) > 0:
+            current = stack[-1]
+            if current in self._supports:
+                stack.pop()
+                continue
+
+            node = self._nodes[current]
+            children = list(node[1:]) if node[0] == "XOR" else list(node[1]) if node[0] in ["AND", "OR"] else []
+            needed = [child for child in children if child not in self._supports]
+            if len(needed) > 0:
+                stack.extend(needed)
+                continue
+
+            if node[0] == "VAR":
+                self._supports[current] = frozenset([node[1]])
+            else:
+                self._supports[current] = frozenset().union(*[self._supports[child] for child in children])
+            stack.pop()
+
+        return self._supports[index]
+
+    def __build(self, index):
+        """Returns a node as Expression and Variable objects
+        where each n-ary node is a left-associative chain of its operator
+
+        :param index: The index of the node which must not be a constant
+        :type index: int
+
+        :rtype: Expression or Variable
+        """
+        stack = [(index, False)]
+        while len(stack) > 0:
+            current, visited = stack.pop()
+            if current in self._roots:
+                continue
+
+            node = self._nodes[current]
+            children = list(node[1:]) if node[0] == "XOR" else list(node[1]) if node[0] != "VAR" else []
+            if node[0] == "VAR":
+                self._roots[current] = Variable(node[1], node[2])
+            elif visited:
+                result = self._roots[children[0]]
+                for child in children[1:]:
+                    result = Expression(result, node[0], self._roots[child], False)
+                self._roots[current] = result
+            else:
+                stack.append((current, True))
+                stack.extend((child, False) for child in reversed(children))
+
+        return self._roots[index]
+
+    def get_support(self) -> list:
+        """Returns the sorted variables that are still in the reduced expression"""
+        if self.get_constant() is not None:
+            return []
+        return sorted(self.__get_support(self._root))
+
+    def get_root(self):
+        """Returns the root of the reduced expression as Expression and Variable objects
+        where each n-ary node is a left-associative chain of its operator,
+        or None if the expression is always true or always false
+
+        :rtype: Expression or Variable
+        """
+        if self.get_constant() is not None:
+            return None
+        return self.__build(self._root)
+
+    def get_components(self) -> tuple:
+        """Returns the operator of the root and the roots of its components where the root is an AND or an OR
+        of its components and no two components share a variable. Each component is an AND or an OR,
+        in the same way as the root, of the children of the root that are connected by their variables
+
+        :return: A tuple containing "AND" or "OR", or None if the root is neither, and a list of tuples
+            containing the root of each component, as Expression and Variable objects, and its sorted variables.
+            The list is empty when the root is not split into at least two components
+        :rtype: tuple
+        """
+        node = self._nodes[self._root]
+        if node[0] not in ["AND", "OR"]:
+            return None, []
+
+        # Merge every group of children whose variables meet the variables of the next child
+        positions = {child: i for i, child in enumerate(node[1])}
+        groups = []
+        for child in node[1]:
+            support = self.__get_support(child)
+            children = [child]
+            for group in [group for group in groups if not group[0].isdisjoint(support)]:
+                groups.remove(group)
+                support = support | group[0]
+                children = group[1] + children
+            groups.append((support, children))
+        if len(groups) == 1:
+            return node[0], []
+
+        components = []
+        for support, children in sorted(groups, key=lambda group: min(positions[child] for child in group[1])):
+            children.sort(key=positions.get)
+            root = self.__build(children[0])
+            for child in children[1:]:
+                root = Expression(root, node[0], self.__build(child), False)
+            components.append((root, sorted(support)))
+        return node[0], components
+
+    def get_shared_variable(self) -> str:
+        """Returns the variable that is in the most children of the root, where the root is an AND or an OR,
+        which is the variable to split the expression on so that its cofactors are the most likely
+        to fall apart into components. If the root is neither or no variable is in two children, None is returned
+        """
+        node = self._nodes[self._root]
+        if node[0] not in ["AND", "OR"]:
+            return None
+
+        counts = {}
+        for child in node[1]:
+            for variable in self.__get_support(child):
+                counts[variable] = counts.get(variable, 0) + 1
+        variable = min(counts, key=lambda v: (-counts[v], v))
+        return variable if counts[variable] > 1 else None
@@ -0,0 +1,243 @@
+import cProfile
+import functools
+import itertools
+import os
+import threading
+import time
+
+# The Stats that is recording on each thread, if any
+_local = threading.local()
+
+# Every cProfile stats file written by this process has its own number
+_profile_numbers = itertools.count()
+
+
+class Stats:
+    """A Stats records the wall time of each stage and counts such as the rows evaluated
+    and the minterms combined while simplifying an expression.
+
+    Nothing is recorded unless a Stats is active on the thread, either with ``instrument()``
+    or with ``Tree.INSTRUMENT``, so the pipeline only checks for an active Stats once per stage
+    when instrumentation is disabled.
+
+    :param profile_dir: The directory to write a cProfile stats file to for every call.
+        By default, nothing is profiled
+    :type profile_dir: str
+    """
+
+    def __init__(self, profile_dir: str = None):
+        self._times = {}
+        self._counts = {}
+        self._profile_dir = profile_dir
+        self._profiles = []
+        self._depth = 0
+
+    def __str__(self):
+        stages = ", ".join([f"{stage} {seconds * 1000:.2f} ms" for stage, seconds in self._times.items()])
+        counts = ", ".join([f"{name.replace('_', ' ')} {count}" for name, count in self._counts.items()])
+        if len(counts) == 0:
+            return stages
+        return f"{stages}; {counts}"
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Getters
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def get_times(self) -> dict:
+        """Returns the seconds that each stage took, in the order the stages first ran"""
+        return self._times
+
+    def get_counts(self) -> dict:
+        """Returns the counts, such as "rows_evaluated" or "prime_implicants", that were recorded"""
+        return self._counts
+
+    def get_profiles(self) -> list:
+        """Returns the paths of the cProfile stats files that were written"""
+        return self._profiles
+
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Recording Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def add_time(self, stage: str, seconds: float):
+        """Adds seconds to the time of a stage
+
+        :param stage: The name of the stage
+        :param seconds: The seconds to add
+
+        :type stage: str
+        :type seconds: float
+        """
+        self._times[stage] = self._times.get(stage, 0.0) + seconds
+
+    def add_count(self, name: str, amount: int = 1):
+        """Adds an amount to a count
+
+        :param name: The name of the count
+        :param amount: The amount to add
+
+        :type name: str
+        :type amount: int
+        """
+        self._counts[name] = self._counts.get(name, 0) + amount
+
+    def stage(self, name: str) -> '_Stage':
+        """Returns a context manager that adds the wall time of its body to a stage
+
+        :param name: The name of the stage
+        :type name: str
+        """
+        return _Stage(self, name)
+
+
+class _Stage:
+    """A context manager that adds the wall time of its body to a stage of a Stats
+
+    :param stats: The Stats to add the time to
+    :param name: The name of the stage
+
+    :type stats: Stats
+    :type name: str
+    """
+
+    __slots__ = ("_stats", "_name", "_start")
+
+    def __init__(self, stats, name):
+        self._stats = stats
+        self._name = name
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        self._stats.add_time(self._name, time.perf_counter() - self._start)
+
+
+class _NoStage:
+    """A context manager that does nothing, used when no Stats is active"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return None
+
+
+_NO_STAGE = _NoStage()
+
+
+def get_active() -> Stats:
+    """Returns the Stats that is recording on this thread or None if nothing is being recorded"""
+    return getattr(_local, "stats", None)
+
+
+def stage(name: str):
+    """Returns a context manager that adds the wall time of its body to a stage of the active Stats.
+    When no Stats is active, the context manager does nothing
+
+    :param name: The name of the stage
+    :type name: str
+    """
+    stats = getattr(_local, "stats", None)
+    if stats is None:
+        return _NO_STAGE
+    return _Stage(stats, name)
+
+
+class instrument:
+    """A context manager that records the stages and counts of everything it runs on this thread
+
+    For example::
+
+        with instrument() as stats:
+            Tree("a and b or c").simplify()
+        print(stats.get_times())
+
+    :param profile_dir: The directory to write a cProfile stats file to for every call of an instrumented method.
+        By default, nothing is profiled
+    :type profile_dir: str
+    """
+
+    def __init__(self, profile_dir: str = None):
+        self._stats = Stats(profile_dir)
+        self._previous = None
+
+    def __enter__(self) -> Stats:
+        self._previous = get_active()
+        _local.stats = self._stats
+        return self._stats
+
+    def __exit__(self, *_):
+        _local.stats = self._previous
+
+
+def instrumented(method):
+    """Decorates a method of a class so that its stages and counts are stored in ``last_stats``
+    of the object it is called on.
+
+    A new Stats is recorded for each call when the ``INSTRUMENT`` attribute of the class is True,
+    written to the ``PROFILE_DIR`` attribute of the class if it is set. Inside ``instrument()``,
+    the active Stats is used instead. Only the outermost instrumented call on a thread is profiled
+
+    :param method: The method to decorate
+    :type method: callable
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        stats = getattr(_local, "stats", None)
+        if stats is None and not getattr(type(self), "INSTRUMENT", False):
+            return method(self, *args, **kwargs)
+
+        # Record a new Stats for this call when no Stats is active
+        if stats is None:
+            with instrument(getattr(type(self), "PROFILE_DIR", None)) as stats:
+                return _call(stats, method, self, args, kwargs)
+        return _call(stats, method, self, args, kwargs)
+
+    return wrapper
+
+
+def _call(stats, method, obj, args, kwargs):
+    """Calls an instrumented method, profiling it if it is the outermost instrumented call,
+    and stores the Stats in ``last_stats`` of the object
+
+    :param stats: The active Stats
+    :param method: The method to call
+    :param obj: The object to call the method on
+    :param args: The positional arguments of the call
+    :param kwargs: The keyword arguments of the call
+
+    :type stats: Stats
+    :type method: callable
+    :type args: tuple
+    :type kwargs: dict
+    """
+    profiler = None
+    if stats._depth == 0 and stats._profile_dir is not None:
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Only one profiler can be enabled at once in some versions of Python
+            profiler = None
+
+    stats._depth += 1
+    try:
+        return method(obj, *args, **kwargs)
+    finally:
+        stats._depth -= 1
+        obj.last_stats = stats
+        if profiler is not None:
+            profiler.disable()
+            os.makedirs(stats._profile_dir, exist_ok=True)
+            path = os.path.join(
+                stats._profile_dir,
+                "{}-{}-{}.pstats".format(method.__name__.strip("_"), os.getpid(), next(_profile_numbers))
+            )
+            profiler.dump_stats(path)
+            stats._profiles.append(path)
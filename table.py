@@ -0,0 +1,152 @@
+from collections.abc import Sequence
+
+
+def get_masks(count: int) -> list:
+    """Returns the bit-parallel masks for a truth table with the specified amount of variables.
+
+    Each mask holds one bit per row of the truth table where bit ``r`` is set when the variable
+    is true at row ``r``. The first variable is the most significant bit of the row index so
+    the rows stay in the same order as the text truth table.
+
+    For example, with 2 variables the masks are ``0b1100`` and ``0b1010``
+
+    :param count: The amount of variables in the truth table
+    :type count: int
+
+    :rtype: list[int]
+    """
+
+    size = 1 << count
+    masks = []
+    for i in range(count):
+
+        # Get the block of rows where the variable is 0 followed by the
+        #   block of rows where the variable is 1
+        block = 1 << (count - 1 - i)
+        mask = ((1 << block) - 1) << block
+        width = block << 1
+
+        # Repeat the pattern by doubling it until it covers every row
+        while width < size:
+            mask |= mask << width
+            width <<= 1
+        masks.append(mask)
+
+    return masks
+
+
+def get_chunk_masks(count: int, start: int, rows: int) -> list:
+    """Returns the bit-parallel masks for a chunk of rows of a truth table with the specified amount of variables.
+
+    Bit ``r`` of each mask is whether or not the variable is true at row ``start + r``.
+    Since the amount of rows is a power of two and the chunk starts at a multiple of it,
+    the variables of the low bits of the row index repeat the same pattern in every chunk
+    and the variables of the high bits are the same in every row of a chunk
+
+    :param count: The amount of variables in the truth table
+    :param start: The first row of the chunk which must be a multiple of the amount of rows
+    :param rows: The amount of rows in the chunk which must be a power of two
+
+    :type count: int
+    :type start: int
+    :type rows: int
+
+    :rtype: list[int]
+    """
+
+    size = rows.bit_length() - 1
+    low = get_masks(size)
+    full = (1 << rows) - 1
+
+    masks = []
+    for i in range(count):
+        bit = count - 1 - i
+        if bit < size:
+            masks.append(low[i - (count - size)])
+        else:
+            masks.append(full if start >> bit & 1 else 0)
+    return masks
+
+
+class TruthTable(Sequence):
+    """A TruthTable holds the output column of a boolean expression as a single integer
+    where bit ``r`` is the truth value at row ``r``
+
+    Indexing a TruthTable lazily creates the same evaluation JSON objects that
+    ``Tree.evaluate`` has always returned so the full list of rows never needs to exist in memory.
+
+    :param variables: The variables, in order, that make up each row of the truth table
+    :param vector: The truth values of every row packed into a single integer
+
+    :type variables: list
+    :type vector: int
+    """
+
+    def __init__(self, variables: list, vector: int):
+        self.__variables = variables
+        self.__vector = vector
+
+    def __len__(self):
+        return 1 << len(self.__variables)
+
+    def __getitem__(self, index):
+
+        # Slices are returned as a list of evaluations
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("truth table index out of range")
+
+        count = len(self.__variables)
+        return {
+            "truth_values": {
+                self.__variables[i]: index & (1 << (count - 1 - i)) != 0
+                for i in range(count)
+            },
+            "truth_value": self.get_truth_value(index)
+        }
+
+    # # # # # # # # # # # # # # # # # # # #
+    # Getters
+    # # # # # # # # # # # # # # # # # # # #
+
+    def get_variables(self) -> list:
+        """Returns the variables that make up each row of this TruthTable"""
+        return self.__variables
+
+    def get_vector(self) -> int:
+        """Returns the truth values of every row of this TruthTable packed into an integer"""
+        return self.__vector
+
+    def get_truth_value(self, row: int) -> bool:
+        """Returns the truth value at the specified row of this TruthTable
+
+        :param row: The row to get the truth value of
+        :type row: int
+        """
+        return self.__vector >> row & 1 == 1
+
+    def get_minterms(self) -> list:
+        """Returns the rows where this TruthTable evaluates to true (1)"""
+        return TruthTable.__get_rows(self.__vector)
+
+    def get_maxterms(self) -> list:
+        """Returns the rows where this TruthTable evaluates to false (0)"""
+        return TruthTable.__get_rows(~self.__vector & ((1 << len(self)) - 1))
+
+    @staticmethod
+    def __get_rows(vector: int) -> list:
+        """Returns the indices of the set bits in the specified vector
+
+        :param vector: The packed truth values to get the set rows of
+        :type vector: int
+
+        :rtype: list[int]
+        """
+
+        # Reverse the binary string so that the index of each character is the row
+        bits = bin(vector)[:1:-1]
+        return [row for row in range(len(bits)) if bits[row] == "1"]
@@ -0,0 +1,227 @@
+import mmap
+import struct
+from collections.abc import Sequence
+
+from table import TruthTable
+
+# A truth table file starts with a header that is laid out like the following (little-endian):
+#   magic (4 bytes), version (2 bytes), flags (2 bytes), amount of variables (4 bytes), expression length (4 bytes)
+#   each variable as its length (2 bytes) followed by its name in UTF-8
+#   the expression in UTF-8
+#   zeros until the header is a multiple of 8 bytes
+# The header is followed by the truth value of every row packed into bits where
+#   row r is bit r % 8 (least significant first) of byte r // 8
+MAGIC = b"LGTT"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<4sHHII")
+NAME_LENGTH = struct.Struct("<H")
+
+
+def write_header(fileobj, variables: list, expression: str = ""):
+    """Writes the header of a truth table file. The packed rows must be written right after it
+
+    :param fileobj: The file, opened in binary mode, to write the header to
+    :param variables: The variables, in order, that make up each row of the truth table
+    :param expression: The expression that the truth table is of
+
+    :type fileobj: io.IOBase
+    :type variables: list
+    :type expression: str
+    """
+    expression = expression.encode("utf-8")
+    header = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(variables), len(expression)))
+    for variable in variables:
+        name = variable.encode("utf-8")
+        header += NAME_LENGTH.pack(len(name)) + name
+    header += expression
+    header += bytes(-len(header) % 8)
+    fileobj.write(header)
+
+
+def read_header(buffer) -> tuple:
+    """Reads the header of a truth table file
+
+    :param buffer: The start of the truth table file
+    :type buffer: bytes or mmap.mmap
+
+    :return: A tuple containing the variables, the expression, and the position of the packed rows
+    :rtype: tuple
+    """
+
+    if len(buffer) < HEADER.size:
+        raise ValueError("The file is not a truth table file")
+    magic, version, _, count, length = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("The file is not a truth table file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"The truth table file version {version} is not supported")
+
+    variables = []
+    position = HEADER.size
+    for _ in range(count):
+        size, = NAME_LENGTH.unpack_from(buffer, position)
+        position += NAME_LENGTH.size
+        variables.append(bytes(buffer[position: position + size]).decode("utf-8"))
+        position += size
+    expression = bytes(buffer[position: position + length]).decode("utf-8")
+    position += length
+    return variables, expression, position + -position % 8
+
+
+def get_size(count: int) -> int:
+    """Returns the amount of bytes the packed rows of a truth table take
+
+    :param count: The amount of variables in the truth table
+    :type count: int
+    """
+    return ((1 << count) + 7) // 8
+
+
+def write_truth_table(fileobj, table: TruthTable, expression: str = ""):
+    """Writes a truth table to a file
+
+    :param fileobj: The file, opened in binary mode, to write the truth table to
+    :param table: The truth table to write
+    :param expression: The expression that the truth table is of
+
+    :type fileobj: io.IOBase
+    :type table: TruthTable
+    :type expression: str
+    """
+    write_header(fileobj, table.get_variables(), expression)
+    fileobj.write(table.get_vector().to_bytes(get_size(len(table.get_variables())), "little"))
+
+
+def read_truth_table(fileobj) -> tuple:
+    """Reads a whole truth table from a file into memory
+
+    :param fileobj: The file, opened in binary mode, to read the truth table from
+    :type fileobj: io.IOBase
+
+    :return: A tuple containing the TruthTable and the expression it is of
+    :rtype: tuple
+    """
+    data = fileobj.read()
+    variables, expression, position = read_header(data)
+    size = get_size(len(variables))
+    if len(data) < position + size:
+        raise ValueError("The truth table file is incomplete")
+    return TruthTable(variables, int.from_bytes(data[position: position + size], "little")), expression
+
+
+class MappedTruthTable(Sequence):
+    """A MappedTruthTable reads a truth table file through a memory map so that only
+    the rows that are used are ever read from the file. Opening a file only reads its header,
+    so even a truth table with 2^30 rows opens instantly.
+
+    Indexing a MappedTruthTable creates the same evaluation JSON objects as a TruthTable.
+
+    :param path: The path of the truth table file
+    :type path: str
+    """
+
+    # The amount of bytes to read at once when counting the true rows
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self.__map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.__variables, self.__expression, self.__position = read_header(self.__map)
+        if len(self.__map) < self.__position + get_size(len(self.__variables)):
+            self.__map.close()
+            raise ValueError("The truth table file is incomplete")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return 1 << len(self.__variables)
+
+    def __getitem__(self, index):
+
+        # Slices are returned as a list of evaluations
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("truth table index out of range")
+
+        count = len(self.__variables)
+        return {
+            "truth_values": {
+                self.__variables[i]: index & (1 << (count - 1 - i)) != 0
+                for i in range(count)
+            },
+            "truth_value": self.get_truth_value(index)
+        }
+
+    def close(self):
+        """Closes the memory map of the truth table file"""
+        self.__map.close()
+
+    # # # # # # # # # # # # # # # # # # # #
+    # Getters
+    # # # # # # # # # # # # # # # # # # # #
+
+    def get_variables(self) -> list:
+        """Returns the variables that make up each row of this MappedTruthTable"""
+        return self.__variables
+
+    def get_expression(self) -> str:
+        """Returns the expression that this MappedTruthTable is of"""
+        return self.__expression
+
+    def get_truth_value(self, row: int) -> bool:
+        """Returns the truth value at the specified row of this MappedTruthTable
+
+        :param row: The row to get the truth value of
+        :type row: int
+        """
+        return self.__map[self.__position + (row >> 3)] >> (row & 7) & 1 == 1
+
+    def get_vector(self, start: int = 0, stop: int = None) -> int:
+        """Returns the truth values of a range of rows packed into an integer
+        where bit ``r`` is the truth value at row ``start + r``
+
+        :param start: The first row of the range
+        :param stop: The row after the last row of the range. By default, this is the amount of rows
+
+        :type start: int
+        :type stop: int
+
+        :rtype: int
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if stop <= start:
+            return 0
+        data = self.__map[self.__position + (start >> 3): self.__position + ((stop + 7) >> 3)]
+        return int.from_bytes(data, "little") >> (start & 7) & ((1 << (stop - start)) - 1)
+
+    def to_truth_table(self) -> TruthTable:
+        """Reads every row of this MappedTruthTable into a TruthTable"""
+        return TruthTable(self.__variables, self.get_vector())
+
+    def count_satisfying(self, start: int = 0, stop: int = None) -> int:
+        """Returns the amount of rows in a range where this MappedTruthTable is true
+
+        :param start: The first row of the range
+        :param stop: The row after the last row of the range. By default, this is the amount of rows
+
+        :type start: int
+        :type stop: int
+
+        :rtype: int
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        total = 0
+        rows = MappedTruthTable.CHUNK_SIZE * 8
+        for chunk in range(start, stop, rows):
+            total += bin(self.get_vector(chunk, min(chunk + rows, stop))).count("1")
+        return total
@@ -0,0 +1,87 @@
+"""Compares the CompiledExpression with the interpreted ``evaluate`` and ``evaluate_mask`` of Expression objects
+that it replaces when creating a truth table
+"""
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from compiler import CompiledExpression  # noqa: E402
+from expression import Expression  # noqa: E402
+from table import get_masks  # noqa: E402
+from variable import Variable  # noqa: E402
+
+VARIABLES = ["a", "b", "c", "d", "e"]
+OPERATORS = ["OR", "AND", "XOR", "NAND", "NOR", "XNOR"]
+
+
+def random_node(generator: random.Random, depth: int, nodes: list):
+    """Creates a random Expression or Variable that uses every operator and negated subexpressions.
+    Some subexpressions are an earlier node so that the same node is used more than once in the expression
+
+    :param generator: The random number generator
+    :param depth: The most operators from the root to a variable
+    :param nodes: Every node that has been created so far, which are used again as subexpressions
+
+    :type generator: random.Random
+    :type depth: int
+    :type nodes: list[Expression or Variable]
+
+    :rtype: Expression or Variable
+    """
+    if len(nodes) > 0 and generator.random() < 0.2:
+        node = generator.choice(nodes)
+    elif depth == 0 or generator.random() < 0.2:
+        node = Variable(generator.choice(VARIABLES), generator.random() < 0.3)
+    else:
+        operator = generator.choice(OPERATORS)
+        left = random_node(generator, depth - 1, nodes)
+        right = random_node(generator, depth - 1, nodes)
+        node = Expression(left, operator, right, operator in ["NAND", "NOR", "XNOR"])
+    if isinstance(node, Expression) and generator.random() < 0.3:
+        node = node.negate()
+    nodes.append(node)
+    return node
+
+
+class TestCompiledExpression(unittest.TestCase):
+
+    def assertSameEvaluation(self, root):
+        compiled = CompiledExpression(root, VARIABLES)
+        full = (1 << (1 << len(VARIABLES))) - 1
+        masks = get_masks(len(VARIABLES))
+
+        # Every row of the truth table is evaluated at once and one row at a time
+        expected = root.evaluate_mask(dict(zip(VARIABLES, masks)), full)
+        self.assertEqual(compiled.evaluate_masks(masks, full), expected)
+        for row in range(1 << len(VARIABLES)):
+            values = [row >> (len(VARIABLES) - 1 - i) & 1 for i in range(len(VARIABLES))]
+            value = root.evaluate(dict(zip(VARIABLES, [value == 1 for value in values])))
+            self.assertEqual(value, expected >> row & 1 == 1)
+            self.assertEqual(compiled.evaluate_row(row), value)
+            self.assertEqual(compiled(*values), value)
+
+    def test_operators(self):
+        a, b = Variable("a", False), Variable("b", False)
+        for operator in OPERATORS:
+            for has_not in [False, True]:
+                with self.subTest(operator=operator, has_not=has_not):
+                    self.assertSameEvaluation(Expression(a, operator, b, has_not))
+
+    def test_shared(self):
+        shared = Expression(Variable("a", False), "NAND", Variable("b", True), True)
+        self.assertSameEvaluation(Expression(shared, "XNOR", shared.negate(), True))
+        self.assertSameEvaluation(Expression(shared, "OR", Expression(shared, "AND", Variable("c", False)), False))
+
+    def test_same_as_interpreted(self):
+        generator = random.Random(0)
+        for _ in range(500):
+            root = random_node(generator, generator.randint(1, 6), [])
+            with self.subTest(expression=str(root)):
+                self.assertSameEvaluation(root)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+"""Compares the PrattParser with the Lark parser that it replaces
+
+An expression is parsed the same way by both parsers when both have the same functional form,
+which has every operator and NOT of the expression in the order it was parsed
+"""
+import importlib.util
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pratt import PrattParser  # noqa: E402
+from tree import Tree  # noqa: E402
+
+HAS_LARK = importlib.util.find_spec("lark") is not None
+
+# Every spelling of every operator, and of NOT, that the grammar accepts
+BINARY = list(PrattParser.OPERATORS) + ["||", "&&"]
+NOT = PrattParser.NOT
+BRACKETS = list(PrattParser.BRACKETS.items())
+
+# Each expression and the same expression with brackets around every operator in the order it must be parsed
+PRECEDENCE = [
+    ("a or b and c", "a or (b and c)"),
+    ("a and b or c", "(a and b) or c"),
+    ("a and b xor c", "a and (b xor c)"),
+    ("a xor b xnor c", "a xor (b xnor c)"),
+    ("a xnor b nor c", "a xnor (b nor c)"),
+    ("a nor b nand c", "a nor (b nand c)"),
+    ("a nand b nor c", "(a nand b) nor c"),
+    ("a or b or c", "(a or b) or c"),
+    ("a nand b nand c", "(a nand b) nand c"),
+    ("a xnor b xnor c", "(a xnor b) xnor c"),
+    ("not a and b", "(not a) and b"),
+    ("not (a and b)", "not (a and b)"),
+    ("!!a || b", "(not (not a)) or b"),
+    ("a + b * c ^ d", "a + (b * (c ^ d))"),
+    ("a | b & c -^ d ~| e -* f", "a | (b & (c -^ (d ~| (e -* f))))"),
+    ("[a or b] and c", "(a or b) and c"),
+    ("a xnorb", "a xnor b"),
+    ("a and and", "a and (and)"),
+]
+
+INVALID = [
+    "", "   ", "a and", "and a", "a nand", "a or not", "(a or b", "a or b)", "[a or b)", "(a or b]",
+    "a b", "a $ b", "not", "()", "a ~"
+]
+
+# Expressions that are nested much deeper than the recursion limit
+DEEP = [
+    "(" * 2000 + "a" + ")" * 2000,
+    "".join(f"(v{i} and " for i in range(1500)) + "x" + ")" * 1500,
+    "not " * 3000 + "a",
+    "".join(f"not [v{i} nand " for i in range(1000)) + "x" + "]" * 1000,
+]
+
+
+def random_expression(generator: random.Random, depth: int) -> str:
+    """Creates a random boolean expression that uses every spelling of the operators, of NOT, and of the brackets
+
+    :param generator: The random number generator
+    :param depth: The most operators from the root to a variable
+
+    :type generator: random.Random
+    :type depth: int
+
+    :rtype: str
+    """
+    if depth == 0 or generator.random() < 0.2:
+        expression = generator.choice(["a", "b", "c", "d", "e_1", "x2"])
+    else:
+        left = random_expression(generator, depth - 1)
+        right = random_expression(generator, depth - 1)
+        expression = f"{left} {generator.choice(BINARY)} {right}"
+        if generator.random() < 0.5:
+            opening, closing = generator.choice(BRACKETS)
+            expression = f"{opening}{expression}{closing}"
+    if generator.random() < 0.2:
+        expression = f"{generator.choice(NOT)} {expression}"
+    return expression
+
+
+class TestPrattParser(unittest.TestCase):
+
+    def assertSameTree(self, first: Tree, second: Tree):
+        self.assertEqual(first.functional(), second.functional())
+        self.assertEqual(first.get_variables(), second.get_variables())
+
+    def test_precedence(self):
+        for expression, bracketed in PRECEDENCE:
+            with self.subTest(expression=expression):
+                self.assertSameTree(Tree(expression, "fast"), Tree(bracketed, "fast"))
+
+    def test_invalid(self):
+        for expression in INVALID:
+            with self.subTest(expression=expression):
+                with self.assertRaises(ValueError):
+                    Tree(expression, "fast")
+
+    def test_deep(self):
+        expression = " or ".join(f"v{i}" for i in range(5000))
+        self.assertEqual(len(Tree(expression, "fast").get_variables()), 5000)
+
+        for expression in DEEP:
+            with self.subTest(expression=expression[:40]):
+                tree = Tree(expression, "fast")
+                if HAS_LARK:
+                    self.assertSameTree(tree, Tree(expression, "lark"))
+
+    @unittest.skipUnless(HAS_LARK, "Lark is not installed")
+    def test_same_as_lark(self):
+        generator = random.Random(0)
+        for _ in range(500):
+            expression = random_expression(generator, generator.randint(1, 5))
+            with self.subTest(expression=expression):
+                self.assertSameTree(Tree(expression, "fast"), Tree(expression, "lark"))
+
+    @unittest.skipUnless(HAS_LARK, "Lark is not installed")
+    def test_precedence_same_as_lark(self):
+        for expression, _ in PRECEDENCE:
+            with self.subTest(expression=expression):
+                self.assertSameTree(Tree(expression, "fast"), Tree(expression, "lark"))
+
+    @unittest.skipUnless(HAS_LARK, "Lark is not installed")
+    def test_invalid_same_as_lark(self):
+        for expression in INVALID:
+            with self.subTest(expression=expression):
+                with self.assertRaises(ValueError):
+                    Tree(expression, "lark")
+
+
+if __name__ == "__main__":
+    unittest.main()
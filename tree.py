@@ -1,107 +1,145 @@
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from typing import Union
 
-from lark import Lark
-from lark.tree import Tree as LarkTree
-
+from bdd import BDD, get_order
+from cache import SimplifyCache
+from compiler import CompiledExpression
+from cover import Cancelled
+from espresso import Espresso, get_complement, get_cover
 from expression import Expression
-from qm import QM
+from pratt import PrattParser
+from qm import Minterm, MultiQM, QM
+from rewrite import Rewriter
+from stats import get_active, instrumented, stage
+from table import TruthTable, get_chunk_masks, get_masks
+from tablefile import get_size, write_header
 from variable import Variable
 
 
 class Tree:
-    BOOLEAN = Lark(
-        """
-        start: orexpr
-        ?orexpr: (orexpr ("+" | "|" ~ 1..2 | "or" | "OR"))? andexpr
-        ?andexpr: (andexpr ("*" | "&" ~ 1..2 | "and" | "AND"))? xorexpr
-        ?xorexpr: (xorexpr ("^" | "xor" | "XOR"))? xnorexpr
-        ?xnorexpr: (xnorexpr ("-^" | "xnor" | "XNOR"))? norexpr
-        ?norexpr: (norexpr ("-+" | "nor" | "NOR"))? nandexpr
-        ?nandexpr: (nandexpr ("-*" | "nand" | "NAND"))? term
-        ?term: nexpr
-            | pexpr
-            | IDENT
-        ?nexpr: TILDE orexpr
-        ?pexpr: "(" orexpr ")"
-            | "[" orexpr "]"
-        TILDE: "~" | "!" | "not" | "NOT"
-
-        %import common.CNAME -> IDENT
-        %import common.WS
-        %ignore WS
-        """
-    )
+    """A Tree holds the parsed boolean expression of a string
+
+    :param expr: The boolean expression to parse
+    :param parser: The parser to use which is either "lark" for the Lark grammar
+        or "fast" for the PrattParser which does not import Lark
+
+    :type expr: str
+    :type parser: str
+    """
+
+    # The Lark parser is only loaded when it is first needed so that the "fast" parser
+    #   can be used without importing Lark at all
+    BOOLEAN = None
+
+    # The prime implicants of every function simplified with the Quine-McCluskey Algorithm are
+    #   shared by every Tree in the process. This can be replaced with a SimplifyCache that has a
+    #   different memory bound or a database, or set to None to not cache anything
+    CACHE = SimplifyCache()
+
+    # Set INSTRUMENT to True to record the stages and counts of every call in ``last_stats``
+    #   and set PROFILE_DIR to also write a cProfile stats file of every call to a directory.
+    #   The stages and counts of several calls can be recorded together with ``stats.instrument()``
+    INSTRUMENT = False
+    PROFILE_DIR = None
+
+    # The backend that finds the prime implicants for "qm" which is either "python" or "numpy"
+    QM_BACKEND = "python"
+
+    # The Stats of the last instrumented call on this Tree
+    last_stats = None
+
+    # An AND or an OR of parts that share no variables is simplified one part at a time. Parts that have at least
+    #   PARALLEL_VARIABLES variables are simplified in WORKERS processes (by default, the amount of CPUs) when there
+    #   are several of them. Set SHANNON_VARIABLES to also split parts that share variables on their most shared
+    #   variable with "qm" once they have more than that many variables, which is much faster but no longer always finds
+    #   the smallest expression. By default, parts that share variables are never split so that "qm" stays exact
+    PARALLEL_VARIABLES = 12
+    WORKERS = None
+    SHANNON_VARIABLES = None
+
+    # The terms of an AND of parts (or the clauses of an OR of parts) are the products of the terms of every part
+    #   which grow exponentially with the amount of parts, so a form is not built when it has more than MAX_TERMS
+    MAX_TERMS = 1 << 16
+
+    # The cover of where an expression is true, or its complement for a maxterm expression, can also grow exponentially
+    #   so "espresso" does not simplify a form whose cover has more than ESPRESSO_CUBES cubes
+    ESPRESSO_CUBES = 1 << 12
+
+    @staticmethod
+    def __get_parser():
+        """Returns the Lark parser for a boolean expression, loading it if it has not been loaded yet"""
+        if Tree.BOOLEAN is None:
+            from grammar import load_parser
+            Tree.BOOLEAN = load_parser()
+        return Tree.BOOLEAN
 
     @staticmethod
-    def __create_dict(parse_tree) -> tuple:
-        """Creates a parsable JSON object that can be parsed through LogicNode and LogicVar
-        objects to be used to represent a boolean expression
+    def __create_tree(parse_tree) -> tuple:
+        """Creates the Expression and Variable objects that represent a boolean expression
+        from a Lark parse tree in a single pass
 
         :param parse_tree: A Lark grammar tree object to parse through
         :type parse_tree: lark.tree.Tree
 
-        :return: A tuple containing the parsed expression as a JSON object and a list of variables the expression
+        :return: A tuple containing the root Expression or Variable and a sorted list of variables in the expression
         :rtype: tuple
         """
 
-        variables = []
+        # Keep track of the variables in a dict which is used as an ordered set
+        variables = {}
+        results = []
 
-        # Check if the parse_tree is a Tree
-        if isinstance(parse_tree, LarkTree):
+        # Walk the parse tree in post-order without recursion so that
+        #   very deep expressions can still be parsed
+        stack = [(parse_tree, False)]
+        while len(stack) > 0:
+            node, visited = stack.pop()
 
-            # Check if the expression is an orexpr (OR) or andexpr (AND)
-            if parse_tree.data != "nexpr":
-
-                # Get the left and right expression along with any new variables that may exist
-                left, variables_new_left = Tree.__create_dict(parse_tree.children[0])
-                right, variables_new_right = Tree.__create_dict(parse_tree.children[1])
-                for variable in variables_new_left + variables_new_right:
-                    if variable not in variables:
-                        variables.append(variable)
-
-                # Return the expression and the variables
-                return {
-                           "left": left,
-                           "operator": parse_tree.data[: parse_tree.data.find("expr")].upper(),
-                           "right": right,
-                           "has_not": False
-                       }, variables
+            # The node is an ident (Variable), Lark tokens are strings
+            if isinstance(node, str):
+                variables[node.value] = None
+                results.append(Variable(node.value, False))
 
             # Check if the expression is an nexpr (NOT)
-            else:
+            elif visited and node.data == "nexpr":
+                results.append(results.pop().negate())
 
-                # Get the expression along with any new variables that may exist
-                expression, variables_new = Tree.__create_dict(parse_tree.children[1])
-                expression["has_not"] = not expression["has_not"]
-                for variable in variables_new:
-                    if variable not in variables:
-                        variables.append(variable)
+            # The expression is an orexpr (OR), andexpr (AND), etc.
+            #   Note that a NAND, a NOR, or an XNOR is the NOT of an AND, an OR, or an XOR
+            elif visited:
+                right = results.pop()
+                left = results.pop()
+                operator = node.data[: node.data.find("expr")].upper()
+                results.append(Expression(left, operator, right, operator in ["NAND", "NOR", "XNOR"]))
 
-                # Return the expression and the variables
-                return expression, variables
+            else:
+                stack.append((node, True))
+                for child in reversed(node.children):
+                    stack.append((child, False))
 
-        # The parse_tree is an ident (Variable)
-        return {
-                   "value": parse_tree.value,
-                   "has_not": False
-               }, [parse_tree.value]
+        return results[0], sorted(variables)
 
-    def __init__(self, expr: str):
+    @instrumented
+    def __init__(self, expr: str, parser: str = "lark"):
+        if parser not in ["lark", "fast"]:
+            raise ValueError("The parser must be either \"lark\" or \"fast\"")
 
         # Try to parse the expression
         try:
-            self.__root, self.__variables = Tree.__create_dict(
-                Tree.BOOLEAN.parse(expr).children[0]  # This ignores the "start" Tree
-            )
-            self.__variables.sort()
-
-            # Check if the expression is a LogicNode or LogicVar
-            if "value" in self.__root:
-                # noinspection PyTypeChecker
-                self.__root = Variable(json=self.__root)
-            else:
-                # noinspection PyTypeChecker
-                self.__root = Expression(json=self.__root)
+            with stage("parse"):
+                if parser == "fast":
+                    self.__root, self.__variables = PrattParser(expr).parse()
+                else:
+                    self.__root, self.__variables = Tree.__create_tree(
+                        Tree.__get_parser().parse(expr).children[0]  # This ignores the "start" Tree
+                    )
+            self.__parser = parser
+            self.__compiled = None
 
         # If parsing the expression fails, the boolean expression is invalid
         except Exception:
@@ -120,12 +158,94 @@ class Tree:
         """Returns a list of variables used in this Tree"""
         return self.__variables
 
+    @instrumented
     def get_table(self, as_list: bool = False) -> Union[str, list]:
         """Returns a truth table of the root expression of this Tree
 
         :param as_list: Whether or not to return the truth table as a list of lines
         :type as_list: bool
         """
+        header, separator = self.__get_table_header()
+        with stage("table"):
+            values = "".join([str(chunk, "ascii") for chunk in self.__iter_table_rows(4096)])
+
+        if as_list:
+            return [header, separator, values]
+        return f"{header}\n{separator}\n{values}"
+
+    def iter_table(self, chunk_rows: int = 4096):
+        """Yields the truth table of the root expression of this Tree in pieces so that
+        the whole truth table never needs to be in memory. The header and separator rows
+        are the first piece and every other piece has up to the specified amount of rows.
+        Joining the pieces gives the same truth table as ``get_table``
+
+        :param chunk_rows: The most amount of rows in each piece which is rounded down to a power of two
+        :type chunk_rows: int
+
+        :rtype: Iterator[str]
+        """
+        header, separator = self.__get_table_header()
+        yield f"{header}\n{separator}\n"
+        for chunk in self.__iter_table_rows(chunk_rows):
+            yield str(chunk, "ascii")
+
+    @instrumented
+    def write_table(self, fileobj, chunk_rows: int = 4096):
+        """Writes the truth table of the root expression of this Tree to a file in pieces
+        so that the whole truth table never needs to be in memory.
+        A file opened in binary mode, like ``socket.makefile("wb")``, is written without
+        decoding the rows into strings
+
+        :param fileobj: The file to write the truth table to which can be opened in text or binary mode
+        :param chunk_rows: The most amount of rows to write at once which is rounded down to a power of two
+
+        :type fileobj: io.IOBase
+        :type chunk_rows: int
+        """
+        header, separator = self.__get_table_header()
+        if isinstance(fileobj, io.TextIOBase):
+            fileobj.write(f"{header}\n{separator}\n")
+            for chunk in self.__iter_table_rows(chunk_rows):
+                fileobj.write(str(chunk, "ascii"))
+        else:
+            fileobj.write(f"{header}\n{separator}\n".encode("utf-8"))
+            for chunk in self.__iter_table_rows(chunk_rows):
+                fileobj.write(chunk)
+
+    @instrumented
+    def write_binary_table(self, fileobj, chunk_rows: int = 1 << 20):
+        """Writes the truth table of the root expression of this Tree to a file in the binary format
+        of ``tablefile.py`` which packs each row into a single bit. The rows are evaluated and written
+        in pieces so that the whole truth table never needs to be in memory.
+        The file can be read with ``read_truth_table`` or ``MappedTruthTable``
+
+        :param fileobj: The file, opened in binary mode, to write the truth table to
+        :param chunk_rows: The most amount of rows to write at once which is rounded down to a power of two
+
+        :type fileobj: io.IOBase
+        :type chunk_rows: int
+        """
+        write_header(fileobj, self.get_variables(), str(self))
+
+        # Every piece must be a whole amount of bytes unless it is the whole truth table
+        count = len(self.get_variables())
+        chunk_rows = min(1 << (max(chunk_rows, 8).bit_length() - 1), 1 << count)
+        full = (1 << chunk_rows) - 1
+        with stage("table"):
+            for start in range(0, 1 << count, chunk_rows):
+                vector = self.compile().evaluate_masks(get_chunk_masks(count, start, chunk_rows), full)
+                fileobj.write(vector.to_bytes(min(get_size(count), (chunk_rows + 7) // 8), "little"))
+
+        stats = get_active()
+        if stats is not None:
+            stats.add_count("rows_evaluated", 1 << count)
+
+    def __get_table_header(self) -> tuple:
+        """Returns the header row and the separator row of the truth table
+
+        :return: A tuple containing the header row and the separator row
+        :rtype: tuple
+        """
 
         # Create the header row which holds the variables and result like the following:
         #   | a | b | c | (a * b) + c |
@@ -144,94 +264,747 @@ class Tree:
             "-" * len(str(self))
         )
 
-        # Create the truth values and their evaluations which just consists of 1's and 0's
-        #   to look like the following:
-        #   | 0 | 1 | 0 |      0      |
-        evaluations = self.evaluate()
-        values = "\n".join([
-            "| {} | {} |".format(
-                " | ".join([
-                    ("1" if evaluation["truth_values"][value] else "0").center(len(value))
-                    for value in evaluation["truth_values"]
-                ]),
-                ("1" if evaluation["truth_value"] else "0").center(len(str(self)))
-            )
-            for evaluation in evaluations
-        ])
+        return header, separator
 
-        if as_list:
-            return [header, separator, values]
-        return f"{header}\n{separator}\n{values}"
+    def __iter_table_rows(self, chunk_rows: int):
+        """Yields the rows of the truth table in chunks as a bytearray that is reused for every chunk,
+        so each chunk must be used before the next one is created.
+        Every row ends with a new line except for the last row of the truth table
+
+        :param chunk_rows: The most amount of rows in each chunk which is rounded down to a power of two
+        :type chunk_rows: int
+
+        :rtype: Iterator[bytearray]
+        """
+
+        count = len(self.get_variables())
+        size = 1 << count
+        chunk_rows = min(1 << (max(chunk_rows, 1).bit_length() - 1), size)
+        full = (1 << chunk_rows) - 1
+        compiled = self.compile()
+
+        # Every row has the same width, so a chunk is created once from a row of 0's
+        #   like the following and only the 1's and 0's are replaced for each chunk:
+        #   | 0 | 0 | 0 |      0      |
+        #   Note that the offsets are where the 1 or 0 is in each column
+        widths = [len(var) for var in self.get_variables()] + [len(str(self))]
+        line = ("| " + " | ".join(["0".center(width) for width in widths]) + " |\n").encode("ascii")
+        offsets = []
+        position = 2
+        for width in widths:
+            offsets.append(position + "0".center(width).index("0"))
+            position += width + 3
+        buffer = bytearray(line * chunk_rows)
+
+        # The columns of the variables of the low bits of the row index are the same in every chunk
+        #   and the columns of the variables of the high bits are either all 1's or all 0's
+        low = chunk_rows.bit_length() - 1
+        for i in range(count - low, count):
+            block = 1 << (count - 1 - i)
+            buffer[offsets[i]::len(line)] = (b"0" * block + b"1" * block) * (chunk_rows // (block << 1))
+        ones = b"1" * chunk_rows
+        zeros = b"0" * chunk_rows
+
+        stats = get_active()
+        for start in range(0, size, chunk_rows):
+            if stats is not None:
+                stats.add_count("rows_evaluated", chunk_rows)
+            for i in range(count - low):
+                buffer[offsets[i]::len(line)] = ones if start >> (count - 1 - i) & 1 else zeros
+
+            # Bit r of the evaluation is row r of the chunk, so the binary string is reversed
+            vector = compiled.evaluate_masks(get_chunk_masks(count, start, chunk_rows), full)
+            buffer[offsets[-1]::len(line)] = format(vector, "0{}b".format(chunk_rows))[::-1].encode("ascii")
+
+            # The last row of the truth table does not end with a new line
+            if start + chunk_rows == size:
+                yield memoryview(buffer)[:-1]
+            else:
+                yield buffer
 
     # # # # # # # # # # # # # # # # # # # #
     # Evaluation Methods
     # # # # # # # # # # # # # # # # # # # #
 
-    def evaluate(self) -> list:
+    @instrumented
+    def evaluate(self) -> TruthTable:
         """Evaluates the root of this Tree to get boolean values where the root expression
         is 1 or 0
 
-        :return: A list of evaluations and their truth values that make up the evaluation
+        Every row is evaluated at once by giving each variable a bit-parallel mask
+        over all the rows of the truth table
+
+        :return: A TruthTable that can be indexed to get the evaluations and their truth values
+            that make up the evaluation
+        """
+
+        # Create a mask for each variable where bit r is whether or not the variable
+        #   is true at row r
+        compiled = self.compile()
+        with stage("evaluate"):
+            masks = get_masks(len(self.get_variables()))
+            full = (1 << (1 << len(self.get_variables()))) - 1
+            vector = compiled.evaluate_masks(masks, full)
+
+        stats = get_active()
+        if stats is not None:
+            stats.add_count("rows_evaluated", 1 << len(self.get_variables()))
+        return TruthTable(self.get_variables(), vector)
+
+    def compile(self) -> CompiledExpression:
+        """Compiles the root of this Tree into a generated Python function.
+        The compiled function is created once and reused for every evaluation of this Tree
+
+        For example:
+            - ``tree.compile()(True, False)`` evaluates the expression where the first variable
+              is true and the second variable is false
+            - ``tree.compile().evaluate_row(2)`` evaluates the expression at row 2 of the truth table
+        """
+        if self.__compiled is None:
+            with stage("compile"):
+                self.__compiled = CompiledExpression(self.__root, self.get_variables())
+        return self.__compiled
+
+    # # # # # # # # # # # # # # # # # # # #
+    # BDD Methods
+    # # # # # # # # # # # # # # # # # # # #
+
+    def to_bdd(self, bdd: BDD = None) -> tuple:
+        """Creates the Reduced Ordered Binary Decision Diagram of the root of this Tree.
+        Unlike ``evaluate``, this never creates the truth table, so its time depends on the size
+        of the diagram and not on the amount of variables
+
+        :param bdd: The BDD to create the diagram in which must have every variable of this Tree.
+            By default, a new BDD is created with the variables in the order they appear in the expression
+        :type bdd: BDD
+
+        :return: A tuple containing the BDD and the edge of the root of this Tree
+        :rtype: tuple
+        """
+        if bdd is None:
+            bdd = BDD(get_order(self.__root))
+        return bdd, bdd.create(self.__root)
+
+    def equivalent(self, other: 'Tree') -> bool:
+        """Returns whether or not the root of this Tree and the root of another Tree
+        are true for exactly the same values of their variables
+
+        :param other: The Tree to compare with
+        :type other: Tree
+        """
+
+        # Both diagrams must be in the same BDD where the same function is always the same edge
+        variables = get_order(self.__root)
+        variables += [variable for variable in get_order(other.__root) if variable not in set(variables)]
+        bdd = BDD(variables)
+        return self.to_bdd(bdd)[1] == other.to_bdd(bdd)[1]
+
+    def count_satisfying(self) -> int:
+        """Returns the amount of rows of the truth table where the root of this Tree is true
+        without creating the truth table
+        """
+        bdd, edge = self.to_bdd()
+        return bdd.count_satisfying(edge)
+
+    def is_tautology(self) -> bool:
+        """Returns whether or not the root of this Tree is true in every row of the truth table
+        without creating the truth table
+        """
+        return self.to_bdd()[1] == BDD.TRUE
+
+    @staticmethod
+    def __create_from_implicants(variables, prime_implicants, parser, is_maxterm=False) -> Union['Tree', str]:
+        """Creates a Tree straight from the prime implicants of a simplified expression
+        without parsing the function string. The Tree is the same Tree that parsing
+        ``QM.format_function(variables, prime_implicants, is_maxterm)`` would create
+
+        :param variables: A list of variables (as strings) that the prime implicants are made of
+        :param prime_implicants: The prime implicants, as Minterm objects, of the simplified expression
+        :param parser: The parser the Tree should use
+        :param is_maxterm: Whether or not the prime implicants are maxterms
+
+        :type variables: list
+        :type prime_implicants: list[Minterm]
+        :type parser: str
+        :type is_maxterm: bool
+
+        :return: The simplified Tree or "0" or "1" if the expression is always false or always true
+        :rtype: Tree or str
+        """
+
+        # Check if the expression is always false or always true
+        #   Note that a maxterm expression without any prime implicants is an AND of nothing which is always true
+        if len(prime_implicants) == 0:
+            return "1" if is_maxterm else "0"
+        if len(prime_implicants) == 1 and prime_implicants[0].get_mask() == (1 << len(variables)) - 1:
+            return "0" if is_maxterm else "1"
+
+        # A minterm is an OR of ANDs and a maxterm is an AND of ORs
+        #   where both operators are left-associative like in the grammar
+        inner, outer = ("OR", "AND") if is_maxterm else ("AND", "OR")
+        used = {}
+        root = None
+        for implicant in prime_implicants:
+            term = None
+            for i in range(len(variables)):
+                bit = 1 << (len(variables) - 1 - i)
+                if implicant.get_mask() & bit:
+                    continue
+
+                # A variable is negated when its bit is 0 in a minterm or 1 in a maxterm
+                used[variables[i]] = None
+                literal = Variable(variables[i], (implicant.get_bits() & bit == 0) != is_maxterm)
+                term = literal if term is None else Expression(term, inner, literal, False)
+            root = term if root is None else Expression(root, outer, term, False)
+
+        tree = Tree.__new__(Tree)
+        tree.__root = root
+        tree.__variables = sorted(used)
+        tree.__parser = parser
+        tree.__compiled = None
+        return tree
+
+    def __from_rewriter(self, rewriter) -> Union['Tree', str]:
+        """Creates a Tree of the expression reduced by a Rewriter
+
+        :param rewriter: The Rewriter of an expression of this Tree
+        :type rewriter: Rewriter
+
+        :return: The Tree of the reduced expression, or "0" or "1" if the expression is always false or always true
+        :rtype: Tree or str
+        """
+        constant = rewriter.get_constant()
+        if constant is not None:
+            return "1" if constant else "0"
+
+        tree = Tree.__new__(Tree)
+        tree.__root = rewriter.get_root()
+        tree.__variables = rewriter.get_support()
+        tree.__parser = self.__parser
+        tree.__compiled = None
+        return tree
+
+    def __presimplify(self) -> tuple:
+        """Reduces the root with algebraic rules, like ``x OR NOT x = 1`` and ``x AND (x OR y) = x``,
+        so that the truth table is only enumerated over the variables that can still change the expression
+
+        :return: A tuple containing this Tree if no variable was removed, a Tree of the reduced expression,
+            or "0" or "1" if the expression is always false or always true, and the Rewriter of the expression
+        :rtype: tuple
+        """
+        with stage("presimplify"):
+            rewriter = Rewriter(self.__root)
+        if rewriter.get_constant() is not None:
+            return self.__from_rewriter(rewriter), rewriter
+
+        support = rewriter.get_support()
+        stats = get_active()
+        if stats is not None:
+            stats.add_count("removed_variables", len(self.get_variables()) - len(support))
+        if len(support) == len(self.get_variables()):
+            return self, rewriter
+        return self.__from_rewriter(rewriter), rewriter
+
+    def __get_cubes(self, simplified, is_maxterm: bool) -> list:
+        """Returns the cubes, over the variables of this Tree, of a simplified minterm or maxterm expression.
+        The cubes of a minterm expression are where it is true and the cubes of a maxterm expression
+        are where it is false, just like the prime implicants of either
+
+        :param simplified: The simplified expression of a part of this Tree
+        :param is_maxterm: Whether or not the simplified expression is a maxterm expression
+
+        :type simplified: Tree or str
+        :type is_maxterm: bool
+
+        :rtype: list[tuple]
+        """
+        if isinstance(simplified, str):
+            return [(0, 0)] if (simplified == "1") != is_maxterm else []
+
+        bits = {variable: 1 << (len(self.get_variables()) - 1 - i) for i, variable in enumerate(self.get_variables())}
+        outer = "AND" if is_maxterm else "OR"
+        cubes = []
+        terms = [simplified.__root]
+        while len(terms) > 0:
+            term = terms.pop()
+            if isinstance(term, Expression) and term.get_operator() == outer:
+                terms.append(term.get_right())
+                terms.append(term.get_left())
+                continue
+
+            # A variable is in the zeros of a cube when it is negated in a minterm or not negated in a maxterm
+            ones = zeros = 0
+            literals = [term]
+            while len(literals) > 0:
+                literal = literals.pop()
+                if isinstance(literal, Expression):
+                    literals.extend([literal.get_left(), literal.get_right()])
+                elif literal.has_not() != is_maxterm:
+                    zeros |= bits[literal.get_value()]
+                else:
+                    ones |= bits[literal.get_value()]
+            cubes.append((ones, zeros))
+        return cubes
+
+    def __create_from_cubes(self, cubes, is_maxterm: bool) -> Union['Tree', str]:
+        """Creates a Tree from the cubes of a minterm or maxterm expression over the variables of this Tree
+
+        :param cubes: The cubes from ``__get_cubes``
+        :param is_maxterm: Whether or not the cubes are of a maxterm expression
+
+        :type cubes: list[tuple]
+        :type is_maxterm: bool
+
+        :rtype: Tree or str
+        """
+        full = (1 << len(self.get_variables())) - 1
+        return Tree.__create_from_implicants(
+            self.get_variables(),
+            [Minterm(cube[0], full & ~(cube[0] | cube[1]), len(self.get_variables())) for cube in cubes],
+            self.__parser,
+            is_maxterm
+        )
+
+    @staticmethod
+    def __simplify_parts(parts, method: str, forms: list, is_cancelled=None) -> list:
+        """Simplifies every part of an expression, in separate processes when several parts are large enough
+
+        :param parts: The parts to simplify, as Trees or "0" or "1"
+        :param method: The method to simplify with which is either "qm" or "espresso"
+        :param forms: Whether or not to get the maxterm expression, for each expression to get
+        :param is_cancelled: A function that returns True once the parts are no longer needed
+
+        :type parts: list[Tree or str]
+        :type method: str
+        :type forms: list[bool]
+        :type is_cancelled: callable
+
+        :return: A list of tuples containing the expressions of each part in the same order as the forms
+        :rtype: list[tuple]
+        """
+        large = [
+            part for part in parts if isinstance(part, Tree) and len(part.get_variables()) >= Tree.PARALLEL_VARIABLES
+        ]
+        workers = Tree.WORKERS or os.cpu_count() or 1
+        if min(len(large), workers) > 1:
+            # The processes start with the default settings so the settings of this process are sent with every part
+            settings = {name: getattr(Tree, name) for name in ["QM_BACKEND", "SHANNON_VARIABLES"]}
+
+            # A process that dies, or that cannot be started, only means the parts are simplified in this process
+            #   instead. Any other error, like an error while simplifying a part, is raised as it would be here
+            try:
+                futures = [_get_pool(workers).submit(_simplify_part, part, method, forms, settings) for part in parts]
+
+                # The cancellation check cannot be sent to the processes, so it is checked here while they work
+                #   and the processes are stopped since a part that has started cannot be cancelled
+                pending = futures
+                while len(pending) > 0:
+                    pending = wait(pending, timeout=0.1).not_done
+                    if len(pending) > 0 and is_cancelled is not None and is_cancelled():
+                        _reset_pool(terminate=True)
+                        raise Cancelled()
+                return [future.result() for future in futures]
+            except (BrokenProcessPool, OSError):
+                _reset_pool()
+        return [_simplify_part(part, method, forms, is_cancelled=is_cancelled) for part in parts]
+
+    def __decompose(self, rewriter, method: str, forms: list, is_cancelled=None) -> tuple:
+        """Simplifies the expression one part at a time when the root is an AND or an OR of parts that share
+        no variables, or, for "qm" with more than ``SHANNON_VARIABLES`` variables when it is set, when the root
+        can be split on its most shared variable into ``(x AND f(x=1)) OR (NOT x AND f(x=0))``
+
+        :param rewriter: The Rewriter of the root of this Tree
+        :param method: The method to simplify with which is either "qm" or "espresso"
+        :param forms: Whether or not to get the maxterm expression, for each expression to get
+        :param is_cancelled: A function that returns True once the result is no longer needed
+
+        :type rewriter: Rewriter
+        :type method: str
+        :type forms: list[bool]
+        :type is_cancelled: callable
+
+        :return: A tuple containing the expressions in the same order as the forms, where an expression
+            with more than ``MAX_TERMS`` terms is None, or None if the expression cannot be split
+        :rtype: tuple
+        """
+        operator, components = rewriter.get_components()
+        if len(components) > 0:
+            parts = [Tree.__new__(Tree) for _ in components]
+            for part, (root, variables) in zip(parts, components):
+                part.__root = root
+                part.__variables = variables
+                part.__parser = self.__parser
+                part.__compiled = None
+            stats = get_active()
+            if stats is not None:
+                stats.add_count("components", len(parts))
+            results = Tree.__simplify_parts(parts, method, forms, is_cancelled)
+
+            # The rows where an OR is true, or an AND is false, are the rows where any part is.
+            #   The rows where an OR is false, or an AND is true, are the products of the cubes of every part.
+            #   Since the parts share no variables, no cube of either cover can contain another one
+            simplified = []
+            for i, is_maxterm in enumerate(forms):
+                if any(result[i] is None for result in results):
+                    simplified.append(None)
+                    continue
+                covers = [self.__get_cubes(result[i], is_maxterm) for result in results]
+                if (operator == "OR") != is_maxterm:
+                    cubes = [(0, 0)] if [(0, 0)] in covers else [cube for cover in covers for cube in cover]
+                else:
+                    size = 1
+                    for cover in covers:
+                        size *= len(cover)
+                        if size > Tree.MAX_TERMS:
+                            break
+                    if size > Tree.MAX_TERMS:
+                        simplified.append(None)
+                        continue
+                    cubes = [(0, 0)]
+                    for cover in covers:
+                        cubes = [(cube[0] | other[0], cube[1] | other[1]) for cube in cubes for other in cover]
+                simplified.append(self.__create_from_cubes(cubes, is_maxterm))
+            return tuple(simplified)
+
+        variable = rewriter.get_shared_variable()
+        if method != "qm" or Tree.SHANNON_VARIABLES is None or len(self.get_variables()) <= Tree.SHANNON_VARIABLES or \
+                variable is None:
+            return None
+
+        stats = get_active()
+        if stats is not None:
+            stats.add_count("shannon_splits")
+        cofactors = [self.__from_rewriter(Rewriter(self.__root, {variable: value})) for value in [True, False]]
+        results = Tree.__simplify_parts(cofactors, method, forms, is_cancelled)
+
+        # Both the rows where the expression is true and where it is false are the rows of the cofactor
+        #   where the variable is true, with the variable, and the rows of the other cofactor without it.
+        #   Terms of the two cofactors that are the same or that can be merged are then combined by Espresso
+        bit = 1 << (len(self.get_variables()) - 1 - self.get_variables().index(variable))
+        simplified = []
+        for i, is_maxterm in enumerate(forms):
+            if any(result[i] is None for result in results):
+                simplified.append(None)
+                continue
+            true, false = [self.__get_cubes(result[i], is_maxterm) for result in results]
+            cubes = [(cube[0] | bit, cube[1]) for cube in true] + [(cube[0], cube[1] | bit) for cube in false]
+            with stage("espresso"):
+                minimized = Espresso(self.get_variables(), cubes, is_maxterm=is_maxterm)
+            simplified.append(Tree.__create_from_implicants(
+                self.get_variables(), minimized.get_prime_implicants(), self.__parser, is_maxterm
+            ))
+        return tuple(simplified)
+
+    def __get_dont_cares(self, dont_cares, method: str) -> Union[int, list]:
+        """Returns the rows of the truth table that are don't-cares in the form a method uses
+
+        :param dont_cares: The don't-cares as a list of row indices, a packed bitmask where bit ``r``
+            is whether or not row ``r`` is a don't-care, or an expression (as a string or a Tree)
+            that is true at every don't-care
+        :param method: The method to simplify with which is either "qm" or "espresso"
+
+        :type dont_cares: list or int or str or Tree
+        :type method: str
+
+        :return: A packed bitmask for "qm" or a list of cubes for "espresso"
+        :rtype: int or list[tuple]
+        """
+        count = len(self.get_variables())
+        if dont_cares is None:
+            return 0 if method == "qm" else []
+
+        # An expression is evaluated over the variables of this Tree, or turned into cubes for "espresso",
+        #   so that its rows never need to be listed
+        if isinstance(dont_cares, (str, Tree)):
+            if isinstance(dont_cares, str):
+                dont_cares = Tree(dont_cares, self.__parser)
+            if not set(dont_cares.get_variables()) <= set(self.get_variables()):
+                raise ValueError("The don't-care expression must only use the variables of the expression")
+            if method == "espresso":
+                return get_cover(dont_cares.__root, self.get_variables())
+            return CompiledExpression(dont_cares.__root, self.get_variables()).evaluate_masks(
+                get_masks(count), (1 << (1 << count)) - 1
+            )
+
+        if isinstance(dont_cares, int):
+            if not 0 <= dont_cares < 1 << (1 << count):
+                raise ValueError("The don't-care bitmask must only have a bit for each row of the truth table")
+            vector = dont_cares
+        else:
+            vector = 0
+            for row in dont_cares:
+                if not 0 <= row < 1 << count:
+                    raise ValueError("The don't-care rows must be rows of the truth table")
+                vector |= 1 << row
+
+        if method == "espresso":
+            full = (1 << count) - 1
+            return [(row, full & ~row) for row in TruthTable(self.get_variables(), vector).get_minterms()]
+        return vector
+
+    def __get_espresso_cover(self, get_minterm: bool, dont_cares: list) -> list:
+        """Returns the cubes of where the expression is true, for a minterm expression, or false, for a maxterm
+        expression, for Espresso to minimize
+
+        :param get_minterm: Whether to get the cubes of a minterm expression or maxterm expression
+        :param dont_cares: The don't-cares as a list of cubes
+        :type get_minterm: bool
+        :type dont_cares: list[tuple]
+
+        :return: The cubes, or None if there would be more than ``ESPRESSO_CUBES`` of them
+        :rtype: list[tuple]
+        """
+
+        # Pushing a NOT through an expression turns every OR of ANDs into an AND of ORs whose cubes are the products
+        #   of the cubes of every OR, so the rows where the expression is false are the complement of the cover
+        #   instead. The cover of an AND of ORs, like a maxterm expression, is the complement of the cover of its NOT
+        cover = get_cover(self.__root, self.get_variables(), limit=Tree.ESPRESSO_CUBES)
+        if cover is not None:
+            return cover if get_minterm else get_complement(cover + dont_cares, Tree.ESPRESSO_CUBES)
+        cover = get_cover(self.__root, self.get_variables(), negate=True, limit=Tree.ESPRESSO_CUBES)
+        if cover is not None:
+            return get_complement(cover + dont_cares, Tree.ESPRESSO_CUBES) if get_minterm else cover
+        return None
+
+    def __simplify(self, get_minterm: bool, method: str, evaluations: TruthTable = None,
+                   dont_cares: Union[int, list] = None, is_cancelled=None) -> Union['Tree', str]:
+        """Simplifies the boolean expression at the root as either a minterm or a maxterm expression
+
+        :param get_minterm: Whether to get the minterm expression or maxterm expression
+        :param method: The method to simplify with which is either "qm" or "espresso"
+        :param evaluations: The truth table of this Tree which is only used by "qm".
+            By default, the expression is evaluated
+        :param dont_cares: The don't-cares from ``__get_dont_cares``. By default, there are no don't-cares
+        :param is_cancelled: A function that returns True once the result is no longer needed
+
+        :type get_minterm: bool
+        :type method: str
+        :type evaluations: TruthTable
+        :type dont_cares: int or list[tuple]
+        :type is_cancelled: callable
+
+        :return: The simplified expression, or None if its cover for "espresso" has more than ``ESPRESSO_CUBES`` cubes
+        :rtype: Tree or str
         """
 
-        # Iterate through all the integer values from 2 ** len(variables)
-        evaluations = []
-        for binary in range(2 ** len(self.get_variables())):
+        # Minimize the cubes of where the expression is true (minterm)
+        #   or where the expression is false (maxterm)
+        if method == "espresso":
+            with stage("espresso"):
+                cover = self.__get_espresso_cover(get_minterm, dont_cares or [])
+                if cover is None:
+                    return None
+                minimized = Espresso(self.get_variables(), cover, dont_cares, is_maxterm=not get_minterm)
 
-            # Create a JSON object for each variable and whether or not this variable
-            #   is true at the current binary value
-            truth_values = {
-                self.get_variables()[i]: binary & (1 << (len(self.get_variables()) - 1 - i)) != 0
-                for i in range(len(self.get_variables()))
-            }
+        else:
+            # Get the minterm or maxterm true-at values
+            #   Note that a minterm expression is true where the expression evaluates
+            #   to true (1) and a maxterm expresion is true where the expression evaluates
+            #   to false (0)
+            if evaluations is None:
+                evaluations = self.evaluate()
+            if dont_cares is None:
+                dont_cares = 0
 
-            # Add the evaluation for this binary value to the list of evaluations
-            evaluations.append({
-                "truth_values": truth_values,
-                "truth_value": self.__root.evaluate(truth_values)
-            })
-        return evaluations
+            # The same function may have already been simplified from a different expression
+            implicants = None
+            if Tree.CACHE is not None:
+                implicants = Tree.CACHE.get(
+                    self.get_variables(), evaluations.get_vector(), not get_minterm, dont_cares
+                )
+            stats = get_active()
+            if implicants is not None:
+                if stats is not None:
+                    stats.add_count("cache_hits")
+                return Tree.__create_from_implicants(
+                    self.get_variables(),
+                    [Minterm(bits, mask, len(self.get_variables())) for bits, mask in implicants],
+                    self.__parser,
+                    not get_minterm
+                )
 
-    def simplify(self, get_minterm: bool = None) -> 'Tree':
+            # The don't-cares are neither minterms nor maxterms
+            if get_minterm:
+                values = TruthTable(self.get_variables(), evaluations.get_vector() & ~dont_cares).get_minterms()
+            else:
+                values = TruthTable(self.get_variables(), evaluations.get_vector() | dont_cares).get_maxterms()
+            minimized = QM(
+                self.get_variables(), values, dont_cares,
+                is_maxterm=not get_minterm, backend=Tree.QM_BACKEND, is_cancelled=is_cancelled
+            )
+            if stats is not None:
+                for name, seconds in minimized.get_timings().items():
+                    stats.add_time(name, seconds)
+                for name, count in minimized.get_counts().items():
+                    stats.add_count(name, count)
+
+            if Tree.CACHE is not None:
+                Tree.CACHE.put(
+                    self.get_variables(),
+                    evaluations.get_vector(),
+                    [(implicant.get_bits(), implicant.get_mask()) for implicant in minimized.get_prime_implicants()],
+                    not get_minterm,
+                    dont_cares
+                )
+
+        return Tree.__create_from_implicants(
+            self.get_variables(), minimized.get_prime_implicants(), self.__parser, not get_minterm
+        )
+
+    @instrumented
+    def simplify(self, get_minterm: bool = None, method: str = "qm", dont_cares=None, *,
+                 is_cancelled=None) -> Union['Tree', str]:
         """Simplifies the boolean expression at the root
         and returns the most simplified expression obtained
         from either minterm or maxterm evaluation.
 
         :param get_minterm: Whether to get the minterm expression or maxterm expression.
-            By default, the function returns the shortest of the two
+            By default, the function returns the shortest of the two for "qm"
+            and the minterm expression for "espresso" whose maxterm expression is only built when it is asked for
+        :param method: The method to simplify with which is either "qm" for the exact Quine-McCluskey Algorithm
+            or "espresso" for the Espresso heuristic which does not enumerate the truth table
+            and can be used with many more variables
+        :param dont_cares: The rows of the truth table whose value does not matter, as a list of row indices,
+            a packed bitmask where bit ``r`` is row ``r``, or an expression (as a string or a Tree)
+            that is true at every don't-care. By default, there are no don't-cares
+        :param is_cancelled: A function that returns True once the result is no longer needed, which stops
+            the Quine-McCluskey Algorithm with ``cover.Cancelled``. By default, it is never cancelled
         :type get_minterm: bool
+        :type method: str
+        :type dont_cares: list or int or str or Tree
+        :type is_cancelled: callable
 
         :return: The simplified boolean expression inside a Tree
         :rtype: Tree
         """
 
-        # Get the minterm and maxterm true-at values
-        #   Note that a minterm expression is true where the expression evaluates
-        #   to true (1) and a maxterm expresion is true where the expression evaluates
-        #   to false (0)
-        evaluations = self.evaluate()
-        true_at_minterms = [
-            decimal
-            for decimal in range(len(evaluations))
-            if evaluations[decimal]["truth_value"]
-        ]
-        true_at_maxterms = [
-            decimal
-            for decimal in range(len(evaluations))
-            if not evaluations[decimal]["truth_value"]
-        ]
+        if method not in ["qm", "espresso"]:
+            raise ValueError("The method must be either \"qm\" or \"espresso\"")
+
+        if get_minterm is None:
+            if method == "espresso":
+                get_minterm = True
+            else:
+                return self.simplify_all(method, dont_cares, is_cancelled=is_cancelled)[2]
 
-        minterm_qm = QM(self.get_variables(), true_at_minterms).get_function()
-        maxterm_qm = QM(self.get_variables(), true_at_maxterms, is_maxterm=True).get_function()
+        # The don't-cares are rows of the truth table of every variable, so the variables are only reduced without them
+        if dont_cares is None:
+            reduced, rewriter = self.__presimplify()
+            if reduced is not self:
+                if isinstance(reduced, str):
+                    return reduced
+                return reduced.simplify(get_minterm, method, is_cancelled=is_cancelled)
 
-        tree_minterm = Tree(minterm_qm) if minterm_qm not in "01" else minterm_qm
-        tree_maxterm = Tree(maxterm_qm) if maxterm_qm not in "01" else maxterm_qm
+            decomposed = self.__decompose(rewriter, method, [not get_minterm], is_cancelled)
+            if decomposed is not None:
+                if decomposed[0] is None:
+                    raise ValueError("The simplified expression would have too many terms")
+                return decomposed[0]
+        simplified = self.__simplify(
+            get_minterm, method, dont_cares=self.__get_dont_cares(dont_cares, method), is_cancelled=is_cancelled
+        )
+        if simplified is None:
+            raise ValueError("The simplified expression would have too many terms")
+        return simplified
 
-        if get_minterm is not None:
-            if get_minterm:
-                return tree_minterm
-            return tree_maxterm
-        return min(tree_minterm, tree_maxterm, key=lambda qm: len(str(qm)))
+    @instrumented
+    def simplify_all(self, method: str = "qm", dont_cares=None, *, is_cancelled=None) -> tuple:
+        """Simplifies the boolean expression at the root into both a minterm and a maxterm expression.
+        The expression is only evaluated once and each expression is only simplified once.
+        An AND or an OR of parts that share no variables is simplified one part at a time
+        and the parts are recombined, so the truth table of the whole expression is never enumerated
+
+        :param method: The method to simplify with which is either "qm" for the exact Quine-McCluskey Algorithm
+            or "espresso" for the Espresso heuristic which does not enumerate the truth table
+        :param dont_cares: The rows of the truth table whose value does not matter, in any form ``simplify`` accepts
+        :param is_cancelled: A function that returns True once the result is no longer needed, like for ``simplify``
+        :type method: str
+        :type dont_cares: list or int or str or Tree
+        :type is_cancelled: callable
+
+        :return: A tuple containing the minterm expression, the maxterm expression,
+            and whichever of the two is the shortest. An expression that is always false or always true is "0" or "1"
+            and an expression of parts that would have more than ``MAX_TERMS`` terms, or an expression whose cover
+            for "espresso" would have more than ``ESPRESSO_CUBES`` cubes, is None
+        :rtype: tuple
+        """
+
+        if method not in ["qm", "espresso"]:
+            raise ValueError("The method must be either \"qm\" or \"espresso\"")
+
+        # The don't-cares are rows of the truth table of every variable, so the variables are only reduced without them
+        decomposed = None
+        if dont_cares is None:
+            reduced, rewriter = self.__presimplify()
+            if isinstance(reduced, str):
+                return reduced, reduced, reduced
+            if reduced is not self:
+                return reduced.simplify_all(method, is_cancelled=is_cancelled)
+            decomposed = self.__decompose(rewriter, method, [False, True], is_cancelled)
+
+        if decomposed is not None:
+            tree_minterm, tree_maxterm = decomposed
+        else:
+            evaluations = self.evaluate() if method == "qm" else None
+            dont_cares = self.__get_dont_cares(dont_cares, method)
+            tree_minterm = self.__simplify(True, method, evaluations, dont_cares, is_cancelled)
+            tree_maxterm = self.__simplify(False, method, evaluations, dont_cares, is_cancelled)
+        built = [tree for tree in [tree_minterm, tree_maxterm] if tree is not None]
+        if len(built) == 0:
+            raise ValueError("The simplified expression would have too many terms")
+        return tree_minterm, tree_maxterm, min(built, key=lambda qm: len(str(qm)))
+
+    @staticmethod
+    def simplify_many(exprs, parser: str = "lark") -> tuple:
+        """Simplifies several boolean expressions together as minterm expressions that share their product terms.
+        Every expression is evaluated over the variables of all the expressions at once
+        and simplified with the multiple-output Quine-McCluskey Algorithm, so a product term that more than
+        one expression needs is only in the shared cover once
+
+        :param exprs: The boolean expressions to simplify, as strings or Trees
+        :param parser: The parser to use for the expressions that are strings and for the simplified Trees
+
+        :type exprs: list[str or Tree]
+        :type parser: str
+
+        :return: A tuple containing the simplified expression of each expression, in the same order,
+            and the shared cover as a list of tuples containing each prime implicant, as a Minterm object,
+            and the indices of the expressions that use it. An expression that is always false or always true
+            is "0" or "1"
+        :rtype: tuple
+        """
+        trees = [expr if isinstance(expr, Tree) else Tree(expr, parser) for expr in exprs]
+        variables = sorted({variable for tree in trees for variable in tree.get_variables()})
+
+        # Every expression uses the same masks of the shared variables
+        with stage("evaluate"):
+            masks = get_masks(len(variables))
+            full = (1 << (1 << len(variables))) - 1
+            vectors = [
+                CompiledExpression(tree.__root, variables).evaluate_masks(masks, full)
+                for tree in trees
+            ]
+
+        minimized = MultiQM(variables, vectors)
+        stats = get_active()
+        if stats is not None:
+            stats.add_count("rows_evaluated", len(trees) << len(variables))
+            for name, seconds in minimized.get_timings().items():
+                stats.add_time(name, seconds)
+            for name, count in minimized.get_counts().items():
+                stats.add_count(name, count)
+
+        simplified = [
+            Tree.__create_from_implicants(variables, implicants, parser)
+            for implicants in minimized.get_prime_implicants()
+        ]
+        return simplified, minimized.get_cover()
+
+    def to_json(self) -> dict:
+        """Returns the root of this Tree as a JSON object which can be loaded
+        with ``Expression(json=...)`` or ``Variable(json=...)``
+        """
+        return self.__root.to_json()
 
     def functional(self) -> str:
         """Returns this Tree object in a functional notation
@@ -240,3 +1013,85 @@ class Tree:
             - ``a or b and c`` is functionally equivalent to ``and(or(a, b), c)``
         """
         return self.__root.functional()
+
+
+# The processes that simplify the parts of expressions are only started once, when they are first needed,
+#   and they are started with "spawn" so that a process with other threads, like the app, is never copied
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """Returns the processes that simplify the parts of expressions, starting them if they have not been started
+    or if there should be a different amount of them
+
+    :param workers: The amount of processes
+    :type workers: int
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(
+                workers, mp_context=multiprocessing.get_context("spawn"), initializer=_initialize_part
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def _reset_pool(terminate: bool = False):
+    """Forgets the processes that simplify the parts of expressions after one of them died, or after the parts
+    they are simplifying are no longer needed, so that new ones are started the next time they are needed
+
+    :param terminate: Whether or not to stop the processes, and the parts they are simplifying, right away
+    :type terminate: bool
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            # There is no public way to stop the processes of a ProcessPoolExecutor
+            if terminate:
+                for process in list((getattr(_pool, "_processes", None) or {}).values()):
+                    process.terminate()
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _initialize_part():
+    """Makes a process that simplifies the parts of an expression simplify their own parts in that process"""
+    Tree.WORKERS = 1
+
+
+def _simplify_part(part, method: str, forms: list, settings: dict = None, is_cancelled=None) -> tuple:
+    """Simplifies a part of an expression
+
+    :param part: The part to simplify, as a Tree or "0" or "1"
+    :param method: The method to simplify with which is either "qm" or "espresso"
+    :param forms: Whether or not to get the maxterm expression, for each expression to get
+    :param settings: The class attributes of Tree to set before simplifying, in a process that simplifies parts
+    :param is_cancelled: A function that returns True once the part is no longer needed, in this process
+
+    :type part: Tree or str
+    :type method: str
+    :type forms: list[bool]
+    :type settings: dict
+    :type is_cancelled: callable
+
+    :return: A tuple containing the expressions of the part in the same order as the forms
+    :rtype: tuple
+    """
+    for name, value in (settings or {}).items():
+        setattr(Tree, name, value)
+    if isinstance(part, str):
+        return tuple(part for _ in forms)
+    if len(forms) == 2:
+        minterm, maxterm, _ = part.simplify_all(method, is_cancelled=is_cancelled)
+        return tuple(maxterm if is_maxterm else minterm for is_maxterm in forms)
+
+    # The only error of a part is that its expression would have too many terms
+    try:
+        return tuple(part.simplify(not is_maxterm, method, is_cancelled=is_cancelled) for is_maxterm in forms)
+    except ValueError:
+        return tuple(None for _ in forms)
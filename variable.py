@@ -1,7 +1,13 @@
+import threading
+import weakref
+
+
 class Variable:
     """A LogicVar class holds information about a variable, or a literal, in a boolean algebraic
     expression of logical expression.
 
+    A Variable is immutable and interned, so every ``NOT a`` in an expression is the same object.
+
     :param value: The variable letter for this Variable object
     :param has_not: Whether or not this Variable object has a ~ (NOT) operator attached to it
     :param json: A JSON object to load a Variable object from.
@@ -12,11 +18,13 @@ class Variable:
     :type json: dict
     """
 
-    def __init__(self, value: str = None, has_not: bool = None, *, json: dict = None):
-        """
+    __slots__ = ("_value", "_has_not", "_hash", "__weakref__")
 
-        :rtype: object
-        """
+    # The unique table of every Variable that exists keyed by its letter and NOT
+    _unique = weakref.WeakValueDictionary()
+    _lock = threading.Lock()
+
+    def __new__(cls, value: str = None, has_not: bool = None, *, json: dict = None):
         # Check if the JSON object is given
         if json is not None:
 
@@ -28,12 +36,44 @@ class Variable:
                 raise KeyError("The \"value\" and \"has_not\" keys must exist in the LogicVar JSON.")
 
         # Make sure value and has_not exist
-        if value is not None and has_not is not None:
-            self.__value = value
-            self.__has_not = has_not
-        else:
+        if value is None or has_not is None:
             raise ValueError("The \"value\" and \"has_not\" parameters must not be a NoneType.")
 
+        has_not = bool(has_not)
+        key = (value, has_not)
+        # The lock is only needed to add a new Variable so that two threads never add the same one
+        variable = Variable._unique.get(key)
+        if variable is not None:
+            return variable
+        with Variable._lock:
+            variable = Variable._unique.get(key)
+            if variable is None:
+                variable = super().__new__(cls)
+                setter = super(Variable, variable).__setattr__
+                setter("_value", value)
+                setter("_has_not", has_not)
+                setter("_hash", hash(key))
+                Variable._unique[key] = variable
+        return variable
+
+    def __setattr__(self, name, value):
+        raise AttributeError("A Variable cannot be changed")
+
+    def __delattr__(self, name):
+        raise AttributeError("A Variable cannot be changed")
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return Variable, (self._value, self._has_not)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __str__(self):
         return "{}{}".format(
             "NOT " if self.has_not() else "",
@@ -46,11 +86,22 @@ class Variable:
 
     def get_value(self) -> str:
         """Returns the variable letter of this LogicVar object"""
-        return self.__value
+        return self._value
 
     def has_not(self) -> bool:
         """Returns whether or not this LogicVar object has a ~ (NOT) operator attached to it"""
-        return self.__has_not
+        return self._has_not
+
+    def negate(self) -> 'Variable':
+        """Returns a new LogicVar object that is the NOT of this LogicVar object"""
+        return Variable(self.get_value(), not self.has_not())
+
+    def to_json(self) -> dict:
+        """Returns a JSON object of this LogicVar object that can be loaded with ``Variable(json=...)``"""
+        return {
+            "value": self.get_value(),
+            "has_not": self.has_not()
+        }
 
     # # # # # # # # # # # # # # # # # # # # # # # # #
     # Evaluation Methods
@@ -66,6 +117,23 @@ class Variable:
             return not truth_values[self.get_value()]
         return truth_values[self.get_value()]
 
+    def evaluate_mask(self, masks, full) -> int:
+        """Evaluates this LogicVar object for every row of a truth table at once
+        given a dict of bit-parallel masks that include the letter
+
+        :param masks: A JSON object of masks where bit ``r`` of each mask is the truth value
+            of the variable at row ``r``
+        :param full: A mask with a bit set for every row of the truth table
+
+        :type masks: dict
+        :type full: int
+
+        :rtype: int
+        """
+        if self.has_not():
+            return masks[self.get_value()] ^ full
+        return masks[self.get_value()]
+
     def functional(self) -> str:
         """Returns a functional representation of this Variable
 